@@ -0,0 +1,394 @@
+"""
+Benchmark suite for Snake Game hot paths
+
+Times Snake.move, Snake.check_collision, Food.respawn, Snake.draw plus
+Food.draw, and a full SnakeGame.update() + draw() frame across grid sizes
+and snake lengths. Results are written as JSON and compared against a
+stored baseline, so regressions show up as numbers:
+
+    python -m benchmarks.bench_snake --baseline benchmarks/baseline.json
+
+Every result is the best of several runs. Timings only compare on the
+machine that recorded the baseline, and even there a loaded machine can
+slow every result down at once: the default 1.5x regression threshold
+assumes an otherwise idle machine. Run make bench-baseline after
+changing a hot path or moving to another machine.
+
+Long snakes are laid out as a serpentine over the top rows with the head
+turning down into the empty part of the grid, so every timed run can move
+the snake without dying. Drawing uses SDL's dummy video driver.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+from snake_game.config import CONFIG  # noqa: E402
+from snake_game.game import SnakeGame  # noqa: E402
+from snake_game.game_objects import (  # noqa: E402
+    Direction,
+    Food,
+    Position,
+    Snake,
+    current_position_table,
+)
+from snake_game.logger import logger  # noqa: E402
+
+GRIDS = ((32, 24), (100, 100), (320, 240), (1000, 1000))
+LENGTHS = (3, 1000, 100_000)
+QUICK_GRIDS = ((32, 24), (100, 100))
+QUICK_LENGTHS = (3, 1000)
+
+# Most runs of one operation; short capped runs are repeated up to this
+MAX_RUNS = 200
+
+# Settings changed while benchmarking, restored afterwards
+_SETTINGS = ("WINDOW_WIDTH", "WINDOW_HEIGHT", "GRID_SIZE", "WALL_COLLISION")
+
+Operation = Callable[[], Any]
+
+
+@dataclass
+class Case:
+    """One grid size and snake length combination"""
+
+    width: int
+    height: int
+    length: int
+
+    @property
+    def name(self) -> str:
+        """Get the case name used in result keys"""
+        return f"{self.width}x{self.height}/len={self.length}"
+
+    @property
+    def safe_moves(self) -> int:
+        """Get how many moves the serpentine snake makes before dying"""
+        return self.height - (self.length - 1) // self.width - 2
+
+
+def iter_cases(
+    grids: Sequence[Tuple[int, int]], lengths: Sequence[int]
+) -> List[Case]:
+    """Get the cases whose snake fits in the top half of the grid"""
+    return [
+        Case(width, height, length)
+        for width, height in grids
+        for length in lengths
+        if length <= width * height // 2
+    ]
+
+
+def configure_grid(case: Case) -> None:
+    """Set CONFIG to the case's grid, keeping the window at most 1000px"""
+    grid_size = max(1, min(20, 1000 // max(case.width, case.height)))
+    CONFIG.GRID_SIZE = grid_size
+    CONFIG.WINDOW_WIDTH = case.width * grid_size
+    CONFIG.WINDOW_HEIGHT = case.height * grid_size
+    CONFIG.WALL_COLLISION = False
+
+
+def make_snake(case: Case) -> Snake:
+    """Create a serpentine snake of the case's length, heading down"""
+    table = current_position_table()
+    segments: List[Position] = []
+    for i in range(case.length):
+        y, x = divmod(i, case.width)
+        if y % 2:
+            x = case.width - 1 - x
+        segments.append(table.get(x, y))
+    segments.reverse()
+
+    snake = Snake()
+    snake.body = segments
+    snake.direction = Direction.DOWN
+    snake.next_direction = Direction.DOWN
+    return snake
+
+
+def make_food(snake: Snake) -> Food:
+    """Create food on a free cell with a fixed seed"""
+    food = Food(random.Random(0))
+    food.respawn(snake.body)
+    return food
+
+
+def bench_move(case: Case, screen: Any) -> Tuple[Callable[[], Operation], int]:
+    """Snake.move"""
+
+    def setup() -> Operation:
+        return make_snake(case).move
+
+    return setup, case.safe_moves
+
+
+def bench_check_collision(
+    case: Case, screen: Any
+) -> Tuple[Callable[[], Operation], int]:
+    """Snake.check_collision"""
+    snake = make_snake(case)
+    return lambda: snake.check_collision, 1_000_000
+
+
+def bench_respawn(
+    case: Case, screen: Any
+) -> Tuple[Callable[[], Operation], int]:
+    """Food.respawn"""
+    snake = make_snake(case)
+    food = make_food(snake)
+    body = snake.body
+    return lambda: lambda: food.respawn(body), 1_000_000
+
+
+def bench_draw(case: Case, screen: Any) -> Tuple[Callable[[], Operation], int]:
+    """Snake.draw + Food.draw"""
+    snake = make_snake(case)
+    food = make_food(snake)
+
+    def draw() -> None:
+        snake.draw(screen)
+        food.draw(screen)
+
+    return lambda: draw, 1_000_000
+
+
+def bench_frame(case: Case, game: Any) -> Tuple[Callable[[], Operation], int]:
+    """SnakeGame.update() + draw()"""
+
+    def setup() -> Operation:
+        game.reset_game()
+        snake = make_snake(case)
+        game.simulator.snake = snake
+        game.food.respawn(snake.body)
+        # Time steady-state frames, not the first full redraw
+        game.draw()
+
+        def frame() -> None:
+            game.update()
+            game.draw()
+
+        return frame
+
+    return setup, case.safe_moves
+
+
+BENCHMARKS: Dict[str, Callable[..., Tuple[Callable[[], Operation], int]]] = {
+    "move": bench_move,
+    "check_collision": bench_check_collision,
+    "respawn": bench_respawn,
+    "draw": bench_draw,
+    "frame": bench_frame,
+}
+
+
+def time_operation(
+    setup: Callable[[], Operation],
+    max_ops: int,
+    repeat: int,
+    min_time: float,
+) -> Tuple[float, int]:
+    """Time an operation, returning (best ns per op, ops per run).
+
+    Each run gets a fresh operation from setup(), so state-changing
+    operations such as moves start from the same state every time.
+    Operations capped at a few ops per run (e.g. moves on a small grid)
+    get more runs instead, so every result is the best of about
+    ``min_time`` seconds of timing rather than of a few microseconds.
+    """
+    operation = setup()
+    start = time.perf_counter()
+    operation()
+    single = max(time.perf_counter() - start, 1e-9)
+    number = max(1, min(max_ops - 1, int(min_time / single)))
+    runs = max(repeat, min(MAX_RUNS, int(min_time / (single * number))))
+
+    best = float("inf")
+    for _ in range(runs):
+        operation = setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e9, number
+
+
+def run_benchmarks(
+    cases: Sequence[Case],
+    names: Sequence[str],
+    repeat: int = 10,
+    min_time: float = 0.05,
+) -> List[Dict[str, Any]]:
+    """Run the named benchmarks for every case"""
+    results = []
+    previous = {name: getattr(CONFIG, name) for name in _SETTINGS}
+    level = logger.logger.level
+    # Per-food info logs would dominate the timings
+    logger.logger.setLevel(logging.WARNING)
+    try:
+        for case in cases:
+            configure_grid(case)
+            game = None
+            screen = None
+            for name in names:
+                if name == "frame":
+                    if game is None:
+                        game = SnakeGame()
+                    target = game
+                else:
+                    if screen is None:
+                        screen = pygame.display.set_mode(
+                            (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
+                        )
+                    target = screen
+                setup, max_ops = BENCHMARKS[name](case, target)
+                ns_per_op, number = time_operation(
+                    setup, max_ops, repeat, min_time
+                )
+                results.append(
+                    {
+                        "name": f"{name}/{case.name}",
+                        "benchmark": name,
+                        "grid": [case.width, case.height],
+                        "length": case.length,
+                        "ns_per_op": round(ns_per_op, 1),
+                        "ops_per_run": number,
+                    }
+                )
+                print(f"{results[-1]['name']:<36} {ns_per_op:>14,.0f} ns/op")
+    finally:
+        for name, value in previous.items():
+            setattr(CONFIG, name, value)
+        logger.logger.setLevel(level)
+        pygame.quit()
+    return results
+
+
+def compare(
+    results: Sequence[Dict[str, Any]],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[str]:
+    """Print results against the baseline and return regressed names"""
+    reference = {
+        entry["name"]: entry["ns_per_op"] for entry in baseline["results"]
+    }
+    regressions = []
+    print(f"\n{'benchmark':<36} {'ns/op':>14} {'baseline':>14} {'ratio':>7}")
+    for entry in results:
+        name = entry["name"]
+        old = reference.get(name)
+        if old is None:
+            print(f"{name:<36} {entry['ns_per_op']:>14,.0f} {'-':>14}")
+            continue
+
+        ratio = entry["ns_per_op"] / old if old else float("inf")
+        status = ""
+        if ratio > threshold:
+            status = " REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            status = " faster"
+        print(
+            f"{name:<36} {entry['ns_per_op']:>14,.0f} {old:>14,.0f} "
+            f"{ratio:>6.2f}x{status}"
+        )
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine the benchmarks ran on"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for the benchmark suite"""
+    parser = argparse.ArgumentParser(
+        prog="bench_snake",
+        description="Benchmark Snake Game hot paths",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="small grids and snakes only"
+    )
+    parser.add_argument(
+        "--only",
+        choices=sorted(BENCHMARKS),
+        action="append",
+        help="run only this benchmark (repeatable)",
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--output", default=None, help="write results as JSON to this file"
+    )
+    parser.add_argument(
+        "--baseline", default=None, help="compare with this results file"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="overwrite the baseline file with these results",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="slowdown ratio reported as a regression, valid only "
+        "against a baseline from the same machine (default: 1.5)",
+    )
+    args = parser.parse_args(argv)
+
+    grids = QUICK_GRIDS if args.quick else GRIDS
+    lengths = QUICK_LENGTHS if args.quick else LENGTHS
+    names = args.only or list(BENCHMARKS)
+    results = run_benchmarks(iter_cases(grids, lengths), names, args.repeat)
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if args.baseline:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Could not load baseline {args.baseline}: {e}")
+            return 2
+
+        if baseline.get("environment") != report["environment"]:
+            print("\nThe baseline was recorded on another machine or setup")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Start-up time benchmark for Snake Game
+
+Measures the time from launching a fresh process to the first frame on
+screen, for the source launcher and for the PyInstaller build:
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --build   # rebuild dist/ first
+
+Each target is started with --quit-after-first-frame, which prints a
+marker as soon as the first frame is presented and exits. Every run uses
+an empty working directory (no config, scores or logs) and SDL's dummy
+video driver. "import" times plain ``import snake_game`` for reference.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from snake_game.main import FIRST_FRAME_MARKER  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+SPEC_FILE = ROOT / "snake_game.spec"
+EXECUTABLE = (
+    ROOT / "dist" / ("SnakeGame.exe" if os.name == "nt" else "SnakeGame")
+)
+
+# A run that shows no frame within this many seconds has failed
+TIMEOUT = 60.0
+
+
+def target_commands() -> Dict[str, List[str]]:
+    """Get the command line of every target that can be run here"""
+    commands = {
+        "import": [sys.executable, "-c", "import snake_game"],
+        "run_snake.py": [
+            sys.executable,
+            str(ROOT / "run_snake.py"),
+            "--quit-after-first-frame",
+        ],
+    }
+    if EXECUTABLE.exists():
+        commands["pyinstaller"] = [
+            str(EXECUTABLE),
+            "--quit-after-first-frame",
+        ]
+    return commands
+
+
+def build_executable() -> None:
+    """Build dist/SnakeGame from snake_game.spec"""
+    subprocess.run(
+        [sys.executable, "-m", "PyInstaller", "--noconfirm", str(SPEC_FILE)],
+        cwd=ROOT,
+        check=True,
+    )
+
+
+def time_to_first_frame(command: Sequence[str], wait_for_frame: bool) -> float:
+    """Start a process and return the seconds until its first frame.
+
+    Without ``wait_for_frame`` the time until the process exits is used.
+    """
+    env = {
+        **os.environ,
+        "SDL_VIDEODRIVER": "dummy",
+        "SDL_AUDIODRIVER": "dummy",
+        "PYGAME_HIDE_SUPPORT_PROMPT": "1",
+        "PYTHONPATH": str(ROOT),
+        "PYTHONDONTWRITEBYTECODE": "1",
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        env["SNAKE_LOG_DIR"] = os.path.join(directory, "logs")
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            command,
+            cwd=directory,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        try:
+            elapsed = None
+            assert process.stdout is not None
+            for line in process.stdout:
+                if wait_for_frame and line.strip() == FIRST_FRAME_MARKER:
+                    elapsed = time.perf_counter() - start
+                    break
+            process.wait(TIMEOUT)
+            if elapsed is None:
+                if wait_for_frame:
+                    raise RuntimeError(f"{command[0]} showed no frame")
+                elapsed = time.perf_counter() - start
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+    return elapsed
+
+
+def run_benchmarks(
+    commands: Dict[str, List[str]], repeat: int
+) -> List[Dict[str, Any]]:
+    """Time every target ``repeat`` times"""
+    results = []
+    for name, command in commands.items():
+        wait_for_frame = name != "import"
+        # The first run warms the OS file cache and is not counted
+        time_to_first_frame(command, wait_for_frame)
+        times = [
+            time_to_first_frame(command, wait_for_frame) for _ in range(repeat)
+        ]
+        results.append(
+            {
+                "name": name,
+                "min_ms": round(min(times) * 1000, 1),
+                "median_ms": round(statistics.median(times) * 1000, 1),
+                "max_ms": round(max(times) * 1000, 1),
+                "runs": repeat,
+            }
+        )
+        entry = results[-1]
+        print(
+            f"{name:<14} min {entry['min_ms']:>8.1f} ms  "
+            f"median {entry['median_ms']:>8.1f} ms  "
+            f"max {entry['max_ms']:>8.1f} ms"
+        )
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for the start-up benchmark"""
+    parser = argparse.ArgumentParser(
+        prog="bench_startup",
+        description="Measure Snake Game time to first frame",
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--build",
+        action="store_true",
+        help="build the PyInstaller executable from snake_game.spec first",
+    )
+    parser.add_argument(
+        "--output", default=None, help="write results as JSON to this file"
+    )
+    args = parser.parse_args(argv)
+
+    if args.build:
+        build_executable()
+    commands = target_commands()
+    if "pyinstaller" not in commands:
+        print(f"{EXECUTABLE} not found; run with --build to include it")
+
+    results = run_benchmarks(commands, args.repeat)
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
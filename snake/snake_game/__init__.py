@@ -3,13 +3,68 @@ Snake Game - A modern implementation of the classic Snake game.
 
 This package provides a complete Snake game with configurable settings,
 high score tracking, and both wall collision and wrap-around modes.
+
+Submodules and the names below are imported on first access, so reading
+``__version__`` or using the headless simulation does not load pygame.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "0.1.0-alpha.1"
 __author__ = "Vitor"
 __email__ = "your.email@example.com"
 
-from .game import SnakeGame
-from .config import CONFIG, COLORS
-
 __all__ = ["SnakeGame", "CONFIG", "COLORS"]
+
+# Public names and the submodule each one is defined in
+_LAZY_ATTRIBUTES = {
+    "SnakeGame": ".game",
+    "CONFIG": ".config",
+    "COLORS": ".config",
+}
+
+_SUBMODULES = frozenset(
+    {
+        "config",
+        "frame_timer",
+        "game",
+        "game_objects",
+        "high_score",
+        "input_handler",
+        "logger",
+        "main",
+        "menu",
+        "persistence",
+        "renderer",
+        "replay",
+        "rollout",
+        "score_store",
+        "simulation",
+        "sprites",
+        "telemetry",
+        "text_cache",
+        "vector_env",
+    }
+)
+
+if TYPE_CHECKING:
+    from .config import COLORS, CONFIG
+    from .game import SnakeGame
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name or submodule the first time it is used"""
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES)
@@ -1,11 +1,27 @@
 """
 Centralized game configurations for Snake Game
+
+Importing this module has no side effects: CONFIG starts with the
+defaults, and entry points call CONFIG.ensure_loaded() to read
+config.json. Grid geometry derived from the window and grid sizes is
+computed once and recomputed only after one of those settings changes.
+
+While the game runs, CONFIG_WATCHER applies edits to config.json without
+a restart: poll() stats the file at most once per second and reloads it
+only when its modification time or size changed.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Any
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import json
 import os
+import time
+from .persistence import PERSISTENCE
+
+# Settings the derived grid geometry depends on
+_GEOMETRY_FIELDS = frozenset({"WINDOW_WIDTH", "WINDOW_HEIGHT", "GRID_SIZE"})
+_GEOMETRY_PROPERTIES = ("grid_width", "grid_height", "center_x", "center_y")
 
 
 @dataclass
@@ -18,7 +34,7 @@ class GameConfig:
     GRID_SIZE: int = 20
 
     # Game settings
-    FPS: int = 10
+    FPS: int = 10  # Simulation ticks per second (game speed)
     WALL_COLLISION: bool = False
 
     # Scoring
@@ -27,13 +43,32 @@ class GameConfig:
     # Snake initial settings
     INITIAL_SNAKE_LENGTH: int = 3
 
+    # Rendering: repaint only changed cells instead of the whole screen
+    DIRTY_RECT_RENDERING: bool = True
+
+    # Loop: tick the simulation on a fixed timestep at FPS while input and
+    # interpolated rendering run at up to RENDER_FPS frames per second
+    FIXED_TIMESTEP: bool = True
+    RENDER_FPS: int = 60
+
+    # Input: direction presses buffered ahead of the snake, one per tick
+    INPUT_QUEUE_DEPTH: int = 3
+
     # Configuration file path
     _config_file: str = field(default="config.json", init=False)
+    _loaded: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self):
         """Validate configuration after initialization"""
         self._validate_config()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _GEOMETRY_FIELDS:
+            # Drop the cached geometry; it is recomputed on next use
+            for cached in _GEOMETRY_PROPERTIES:
+                self.__dict__.pop(cached, None)
+
     def _validate_config(self) -> None:
         """Validate configuration values"""
         if self.WINDOW_WIDTH <= 0 or self.WINDOW_HEIGHT <= 0:
@@ -45,28 +80,34 @@ class GameConfig:
         if self.FPS <= 0:
             raise ValueError("FPS must be positive")
 
+        if self.RENDER_FPS <= 0:
+            raise ValueError("Render FPS must be positive")
+
+        if self.INPUT_QUEUE_DEPTH <= 0:
+            raise ValueError("Input queue depth must be positive")
+
         if self.POINTS_PER_FOOD < 0:
             raise ValueError("Points per food cannot be negative")
 
         if self.INITIAL_SNAKE_LENGTH < 1:
             raise ValueError("Initial snake length must be at least 1")
 
-    @property
+    @cached_property
     def grid_width(self) -> int:
         """Calculate grid width based on window width and grid size"""
         return self.WINDOW_WIDTH // self.GRID_SIZE
 
-    @property
+    @cached_property
     def grid_height(self) -> int:
         """Calculate grid height based on window height and grid size"""
         return self.WINDOW_HEIGHT // self.GRID_SIZE
 
-    @property
+    @cached_property
     def center_x(self) -> int:
         """Get center X position in grid coordinates"""
         return self.grid_width // 2
 
-    @property
+    @cached_property
     def center_y(self) -> int:
         """Get center Y position in grid coordinates"""
         return self.grid_height // 2
@@ -78,6 +119,13 @@ class GameConfig:
 
         # Store old value for rollback if validation fails
         old_value = getattr(self, setting_name)
+        if not isinstance(value, type(old_value)) or isinstance(
+            value, bool
+        ) != isinstance(old_value, bool):
+            raise ValueError(
+                f"Invalid value for {setting_name}: expected "
+                f"{type(old_value).__name__}, got {value!r}"
+            )
 
         try:
             setattr(self, setting_name, value)
@@ -95,12 +143,9 @@ class GameConfig:
         """Set FPS with validation"""
         self.update_setting("FPS", fps)
 
-    def save_to_file(self, filename: Optional[str] = None) -> None:
-        """Save configuration to JSON file"""
-        if filename is None:
-            filename = self._config_file
-
-        config_dict = {
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the persistent settings as a dictionary"""
+        return {
             "WINDOW_WIDTH": self.WINDOW_WIDTH,
             "WINDOW_HEIGHT": self.WINDOW_HEIGHT,
             "GRID_SIZE": self.GRID_SIZE,
@@ -108,45 +153,62 @@ class GameConfig:
             "WALL_COLLISION": self.WALL_COLLISION,
             "POINTS_PER_FOOD": self.POINTS_PER_FOOD,
             "INITIAL_SNAKE_LENGTH": self.INITIAL_SNAKE_LENGTH,
+            "DIRTY_RECT_RENDERING": self.DIRTY_RECT_RENDERING,
+            "FIXED_TIMESTEP": self.FIXED_TIMESTEP,
+            "RENDER_FPS": self.RENDER_FPS,
+            "INPUT_QUEUE_DEPTH": self.INPUT_QUEUE_DEPTH,
         }
 
-        try:
-            with open(filename, "w") as f:
-                json.dump(config_dict, f, indent=2)
-        except IOError as e:
-            print(f"Warning: Could not save config to {filename}: {e}")
+    def save_to_file(self, filename: Optional[str] = None) -> None:
+        """Save configuration to JSON file (written in the background)"""
+        if filename is None:
+            filename = self._config_file
+
+        config_dict = self.to_dict()
+        PERSISTENCE.write(filename, json.dumps(config_dict, indent=2))
+
+    def load_from_file(self, filename: Optional[str] = None) -> Set[str]:
+        """Load configuration from JSON file (defaults if it is missing).
 
-    def load_from_file(self, filename: Optional[str] = None) -> None:
-        """Load configuration from JSON file"""
+        Returns the names of the settings whose values changed.
+        """
         if filename is None:
             filename = self._config_file
+        self._loaded = True
 
+        # A save may still be queued
+        PERSISTENCE.flush(filename)
         if not os.path.exists(filename):
-            # Create default config file if it doesn't exist
-            print(
-                f"Config file {filename} not found. Creating default configuration."
-            )
-            self.save_to_file(filename)
-            return
+            # Nothing is written until a setting is changed
+            return set()
 
+        changed: Set[str] = set()
         try:
             with open(filename, "r") as f:
                 config_dict = json.load(f)
+            if not isinstance(config_dict, dict):
+                raise ValueError("expected a JSON object")
 
             # Update settings one by one with validation
+            current = self.to_dict()
             for key, value in config_dict.items():
-                if hasattr(self, key):
-                    try:
-                        self.update_setting(key, value)
-                    except ValueError as e:
-                        print(
-                            f"Warning: Invalid value for {key}: {e}. Using default."
-                        )
-
-        except (IOError, json.JSONDecodeError) as e:
+                if key not in current or current[key] == value:
+                    continue
+                try:
+                    self.update_setting(key, value)
+                    changed.add(key)
+                except ValueError as e:
+                    print(f"Warning: {e}. Keeping {key}={current[key]}.")
+
+        except (IOError, ValueError) as e:
             print(f"Warning: Could not load config from {filename}: {e}")
-            print("Creating new default configuration file.")
-            self.save_to_file(filename)
+            print("Using default configuration.")
+        return changed
+
+    def ensure_loaded(self) -> None:
+        """Load the configuration file unless it was already loaded"""
+        if not self._loaded:
+            self.load_from_file()
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values"""
@@ -159,6 +221,10 @@ class GameConfig:
             "WALL_COLLISION",
             "POINTS_PER_FOOD",
             "INITIAL_SNAKE_LENGTH",
+            "DIRTY_RECT_RENDERING",
+            "FIXED_TIMESTEP",
+            "RENDER_FPS",
+            "INPUT_QUEUE_DEPTH",
         ]:
             setattr(self, field_name, getattr(defaults, field_name))
 
@@ -194,9 +260,90 @@ class Colors:
     YELLOW: Tuple[int, int, int] = (255, 255, 0)
 
 
+ConfigListener = Callable[[Set[str]], None]
+
+
+class ConfigWatcher:
+    """Applies edits to a config file while the game is running.
+
+    poll() is cheap enough to call every frame: it checks the file at most
+    once per ``interval`` seconds, and reads it only when its modification
+    time or size changed. Listeners get the names of the settings that
+    changed, to rebuild whatever depends on them.
+    """
+
+    def __init__(self, config: GameConfig, interval: float = 1.0):
+        self.config = config
+        self.interval = interval
+        self._listeners: List[ConfigListener] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        # None while not watching
+        self._next_check: Optional[float] = None
+
+    @property
+    def path(self) -> str:
+        """The watched config file"""
+        return self.config._config_file
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """Get the file's modification time (ns) and size"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def start(self) -> None:
+        """Start watching, taking the file as it is now as loaded"""
+        PERSISTENCE.flush(self.path)
+        self._signature = self._stat()
+        self._next_check = time.monotonic() + self.interval
+
+    def stop(self) -> None:
+        """Stop watching"""
+        self._next_check = None
+
+    def poll(self) -> Set[str]:
+        """Apply the file's changes if it was edited.
+
+        Returns the names of the settings that changed (usually none).
+        """
+        if self._next_check is None:
+            return set()
+        now = time.monotonic()
+        if now < self._next_check:
+            return set()
+        self._next_check = now + self.interval
+
+        if PERSISTENCE.pending(self.path):
+            # Our own save is on its way; look again once it has landed
+            # rather than wait for it on the render thread
+            return set()
+        signature = self._stat()
+        if signature == self._signature:
+            return set()
+        self._signature = signature
+        if signature is None:
+            # A deleted file keeps the current settings
+            return set()
+
+        changed = self.config.load_from_file(self.path)
+        if changed:
+            for listener in list(self._listeners):
+                listener(changed)
+        return changed
+
+    def add_listener(self, listener: ConfigListener) -> None:
+        """Call a function with the changed settings after a reload"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ConfigListener) -> None:
+        """Stop calling a listener"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+
 # Global configuration instances
 CONFIG = GameConfig()
 COLORS = Colors()
-
-# Load saved configuration on import
-CONFIG.load_from_file()
+CONFIG_WATCHER = ConfigWatcher(CONFIG)
@@ -0,0 +1,237 @@
+"""
+Frame phase timing for Snake Game
+
+FrameTimer splits every frame of the game and menu loops into phases
+(event handling, update, draw, display flip and the sleep in clock.tick)
+and keeps the last few hundred frames to report p50/p95/p99 times and
+dropped frames. F3 toggles an on-screen overlay with these numbers; the
+samples can be written to JSON or CSV when the game exits.
+
+The loops call mark() after each phase; while the timer is disabled those
+calls return immediately.
+"""
+
+import csv
+import json
+import math
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import pygame
+from .config import COLORS
+
+PHASE_EVENTS = "events"
+PHASE_UPDATE = "update"
+PHASE_DRAW = "draw"
+PHASE_FLIP = "flip"
+PHASE_SLEEP = "sleep"
+PHASES = (PHASE_EVENTS, PHASE_UPDATE, PHASE_DRAW, PHASE_FLIP, PHASE_SLEEP)
+_PHASE_INDEX = {phase: i for i, phase in enumerate(PHASES)}
+
+PERCENTILES = (50, 95, 99)
+
+# A frame counts as dropped when it takes this many frame budgets, i.e.
+# at least one display refresh was missed (allowing for timer jitter)
+DROPPED_FRAME_FACTOR = 1.5
+
+TOGGLE_KEY = pygame.K_F3
+
+# Per-phase times in ms followed by the frame total
+FrameSample = Tuple[float, ...]
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """Get a nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+class FrameTimer:
+    """Rolling per-phase frame times for the game and menu loops"""
+
+    def __init__(self, window: int = 600, refresh_ms: float = 500.0):
+        if window <= 0:
+            raise ValueError("Frame timer window must be positive")
+
+        self.enabled = False
+        self.overlay_visible = False
+        self.dump_path: Optional[Path] = None
+        self.refresh_ms = refresh_ms
+        self.frames = 0
+        self.dropped = 0
+        self.samples: Deque[FrameSample] = deque(maxlen=window)
+
+        self._current = [0.0] * len(PHASES)
+        self._start = 0.0
+        self._last = 0.0
+        self._overlay_stats: Dict[str, Dict[str, float]] = {}
+        self._overlay_version = 0
+        self._overlay_refreshed = 0.0
+        self._font: Optional[pygame.font.Font] = None
+
+    def enable(self, dump_path: Union[str, Path, None] = None) -> None:
+        """Start timing frames, optionally dumping them on exit"""
+        if not self.enabled:
+            self.enabled = True
+            # Timing may start in the middle of a frame
+            self.begin_frame()
+        if dump_path is not None:
+            self.dump_path = Path(dump_path)
+
+    def begin_frame(self) -> None:
+        """Start timing a new frame"""
+        if not self.enabled:
+            return
+        self._current = [0.0] * len(PHASES)
+        self._start = self._last = perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Charge the time since the previous mark to a phase"""
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self._current[_PHASE_INDEX[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self, budget_ms: float = 0.0) -> None:
+        """Record the frame; ``budget_ms`` is its target duration, if any"""
+        if not self.enabled:
+            return
+        total_ms = (self._last - self._start) * 1000
+        self.samples.append(
+            tuple(seconds * 1000 for seconds in self._current) + (total_ms,)
+        )
+        self.frames += 1
+        if budget_ms > 0 and total_ms > budget_ms * DROPPED_FRAME_FACTOR:
+            self.dropped += 1
+
+        if self.overlay_visible:
+            now_ms = self._last * 1000
+            if now_ms - self._overlay_refreshed >= self.refresh_ms:
+                self._overlay_stats = self.stats()
+                self._overlay_version += 1
+                self._overlay_refreshed = now_ms
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Get p50/p95/p99, mean and max in ms per phase and frame total"""
+        stats = {}
+        for i, name in enumerate(PHASES + ("frame",)):
+            values = sorted(sample[i] for sample in self.samples)
+            phase_stats = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+            phase_stats["mean"] = sum(values) / len(values) if values else 0.0
+            phase_stats["max"] = values[-1] if values else 0.0
+            stats[name] = phase_stats
+        return stats
+
+    def summary(self) -> Dict[str, object]:
+        """Get the frame counters together with the phase statistics"""
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "window": len(self.samples),
+            "phases": self.stats(),
+        }
+
+    def dump(self, path: Union[str, Path, None] = None) -> Path:
+        """Write the samples to a .csv file or the summary to JSON"""
+        path = Path(path) if path is not None else self.dump_path
+        if path is None:
+            raise ValueError("No frame timing dump path set")
+
+        if path.suffix.lower() == ".csv":
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(PHASES + ("frame",))
+                writer.writerows(
+                    [f"{value:.4f}" for value in sample]
+                    for sample in self.samples
+                )
+        else:
+            with open(path, "w") as f:
+                json.dump(self.summary(), f, indent=2)
+        return path
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Toggle the overlay on F3. Returns True if the event was used."""
+        if event.type != pygame.KEYDOWN or event.key != TOGGLE_KEY:
+            return False
+
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            # Showing the numbers turns timing on
+            self.enable()
+            self._overlay_refreshed = 0.0
+        return True
+
+    def overlay_key(self) -> Optional[int]:
+        """Get a value that changes whenever the overlay shows new numbers"""
+        return self._overlay_version if self.overlay_visible else None
+
+    def draw_overlay(
+        self, screen: pygame.Surface, topleft: Tuple[int, int]
+    ) -> Optional[pygame.Rect]:
+        """Draw the overlay and return the area it covers"""
+        if not self.overlay_visible:
+            return None
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        lines = [f"{'ms':<7}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, phase_stats in self._overlay_stats.items():
+            values = "".join(
+                f"{phase_stats[f'p{p}']:7.2f}" for p in PERCENTILES
+            )
+            lines.append(f"{name:<7}{values}")
+        lines.append(f"dropped {self.dropped}/{self.frames}")
+
+        # The numbers change constantly, so they bypass the text cache
+        surfaces = [
+            self._font.render(line, True, COLORS.WHITE) for line in lines
+        ]
+        line_height = self._font.get_linesize()
+        width = max(surface.get_width() for surface in surfaces)
+        rect = pygame.Rect(topleft, (width, line_height * len(surfaces)))
+        screen.fill(COLORS.BLACK, rect)
+        for i, surface in enumerate(surfaces):
+            screen.blit(surface, (rect.x, rect.y + i * line_height))
+        return rect
+
+
+# Shared by the game and menu loops
+FRAME_TIMER = FrameTimer()
+
+
+# Called once after the next frame reaches the display
+_after_present: List[Callable[[], None]] = []
+
+
+def after_next_present(callback: Callable[[], None]) -> None:
+    """Call a function once the next frame is on the display"""
+    _after_present.append(callback)
+
+
+def present(rects: Optional[List[pygame.Rect]] = None) -> None:
+    """Push the frame to the display, timing it as the flip phase"""
+    FRAME_TIMER.mark(PHASE_DRAW)
+    if rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+    FRAME_TIMER.mark(PHASE_FLIP)
+    if _after_present:
+        callbacks = list(_after_present)
+        _after_present.clear()
+        for callback in callbacks:
+            callback()
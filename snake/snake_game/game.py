@@ -2,16 +2,60 @@
 Main game class for Snake Game
 """
 
+import logging
 import pygame
 import sys
+import time
+import uuid
 from enum import Enum
-from .config import CONFIG, COLORS
+from functools import cached_property
+from pathlib import Path
+from typing import Hashable, List, Optional, Set, Union
+from .config import CONFIG, CONFIG_WATCHER, COLORS
 from .game_objects import Snake, Food
-from .input_handler import InputHandler, InputAction
+from .simulation import SimEvent, SnakeSimulator
+from .input_handler import (
+    InputAction,
+    InputHandler,
+    InputQueue,
+    wait_for_events,
+)
 from .high_score import HighScoreManager
+from .renderer import DirtyRectRenderer, union_rects, draw_motion
+from .replay import Replay, ReplayError, ReplayRecorder
+from .text_cache import TEXT_CACHE, render_text
+from .frame_timer import (
+    FRAME_TIMER,
+    PHASE_DRAW,
+    PHASE_EVENTS,
+    PHASE_SLEEP,
+    PHASE_UPDATE,
+    present,
+)
 from .logger import logger
+from .persistence import PERSISTENCE
+from .telemetry import TELEMETRY, TelemetryEvent
 from .menu import MenuManager, MenuState
 
+# Default directory for --replay-dir
+DEFAULT_REPLAY_DIR = Path("replays")
+
+# Most simulation ticks run in one frame before the loop drops time to
+# catch up (e.g. after the window was dragged or the machine stalled)
+MAX_TICKS_PER_FRAME = 5
+
+# Settings that change the board or the rules; editing one mid-game
+# restarts the game, since its snake and replay no longer fit
+RESTART_SETTINGS = frozenset(
+    {
+        "WINDOW_WIDTH",
+        "WINDOW_HEIGHT",
+        "GRID_SIZE",
+        "WALL_COLLISION",
+        "POINTS_PER_FOOD",
+    }
+)
+
 
 class GameState(Enum):
     """Game state enumeration"""
@@ -23,11 +67,21 @@ class GameState(Enum):
 
 
 class SnakeGame:
-    """Main Snake Game class"""
-
-    def __init__(self):
-        # Initialize pygame
-        pygame.init()
+    """Main Snake Game class.
+
+    The game rules live in SnakeSimulator; this class adds the window,
+    input handling, menus and rendering on top of it.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        replay_dir: Union[str, Path, None] = None,
+    ):
+        # Initialize only what the game uses: pygame.init() would also
+        # start the mixer, opening an audio device for a silent game
+        pygame.display.init()
+        pygame.font.init()
 
         # Setup display
         self.screen = pygame.display.set_mode(
@@ -35,53 +89,137 @@ class SnakeGame:
         )
         pygame.display.set_caption("Snake Game")
 
-        # Game components
+        # Game components (the clock also starts SDL's timer)
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.renderer = DirtyRectRenderer(self.screen)
+
+        # Pause/game over screens are composed once and kept on screen
+        # until what they show changes
+        self._dim_layer: Optional[pygame.Surface] = None
+        self._overlay_key: Optional[Hashable] = None
+        self._screen_exposed = False
 
         # Game systems
         self.input_handler = InputHandler()
+        self.input_queue = InputQueue(CONFIG.INPUT_QUEUE_DEPTH)
         self.high_score_manager = HighScoreManager()
 
         # Game state
         self.state = GameState.PLAYING
-        self.score = 0
-        self.direction_changed_this_frame = False
+        # A fixed seed replays the same food sequence every game
+        # (started by reset_game() below)
+        self.simulator = SnakeSimulator(seed, start=False)
+        # Fixed timestep: time not yet simulated, and how far the display
+        # is between the previous and the current tick (0..1)
+        self._accumulator = 0.0
+        self._frame_ms = 0
+        self.interpolation = 1.0
+        self.recorder = ReplayRecorder()
+        self.last_replay: Optional[Replay] = None
+        # Finished games are saved here (for bug reports and score
+        # audits) only when a directory is given
+        self.replay_dir = Path(replay_dir) if replay_dir is not None else None
+        self.menu_manager: Optional[MenuManager] = None
 
         # Initialize game objects
         self.reset_game()
 
         logger.info("Snake Game initialized")
 
+    @cached_property
+    def font(self) -> pygame.font.Font:
+        """Font for headings and the score (loaded on first use)"""
+        return pygame.font.Font(None, 36)
+
+    @cached_property
+    def small_font(self) -> pygame.font.Font:
+        """Font for hints (loaded on first use)"""
+        return pygame.font.Font(None, 24)
+
+    @property
+    def snake(self) -> Snake:
+        """Snake of the current game"""
+        return self.simulator.snake
+
+    @property
+    def food(self) -> Food:
+        """Food of the current game"""
+        return self.simulator.food
+
+    @property
+    def score(self) -> int:
+        """Score of the current game"""
+        return self.simulator.score
+
+    @property
+    def board_full(self) -> bool:
+        """Whether the current game was won by filling the board"""
+        return self.simulator.board_full
+
     def reset_game(self) -> None:
         """Reset game to initial state"""
-        self.snake = Snake()
-        self.food = Food()
-        self.score = 0
+        self.simulator.reset()
         self.state = GameState.PLAYING
-        self.direction_changed_this_frame = False
+        self.input_queue.depth = CONFIG.INPUT_QUEUE_DEPTH
+        self.input_queue.clear()
+        self._accumulator = 0.0
+        self.interpolation = 1.0
+        self.recorder.start(self.simulator.seed)
+        self.renderer.invalidate()
+        TELEMETRY.emit(
+            TelemetryEvent.GAME_START,
+            0,
+            seed=self.simulator.seed,
+            fps=CONFIG.FPS,
+            wall_collision=CONFIG.WALL_COLLISION,
+            grid=[CONFIG.grid_width, CONFIG.grid_height],
+        )
 
-        # Ensure food doesn't spawn on snake
-        self.food.respawn(self.snake.body)
+        logger.info("Game reset with seed %d", self.simulator.seed)
+
+    def apply_config_changes(self, changed: Set[str]) -> None:
+        """Apply settings edited in the config file while running"""
+        size = (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
+        if self.screen.get_size() != size:
+            # The only change that needs a new window
+            self.screen = pygame.display.set_mode(size)
+            self.renderer.screen = self.screen
+            if self.menu_manager is not None:
+                self.menu_manager.set_screen(self.screen)
+
+        if changed & RESTART_SETTINGS and self.state in (
+            GameState.PLAYING,
+            GameState.PAUSED,
+        ):
+            paused = self.state == GameState.PAUSED
+            self.reset_game()
+            if paused:
+                self.state = GameState.PAUSED
 
-        logger.info("Game reset")
+        self.input_queue.depth = CONFIG.INPUT_QUEUE_DEPTH
+        # Everything else is read from CONFIG as the next frame is drawn
+        self.renderer.invalidate()
+        self._overlay_key = None
+        logger.info("Applied config changes: %s", ", ".join(sorted(changed)))
 
     def handle_events(self) -> bool:
         """Handle pygame events. Returns False to quit game."""
-        # Reset direction change flag
-        self.direction_changed_this_frame = False
-
-        # Get all events
-        events = list(pygame.event.get())
+        # Get all events; static screens sleep until input arrives
+        if self.state == GameState.PLAYING:
+            events = list(pygame.event.get())
+        else:
+            events = wait_for_events()
 
         # Check for quit events
         for event in events:
             if event.type == pygame.QUIT:
                 return False
+            FRAME_TIMER.handle_event(event)
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._screen_exposed = True
 
         # Get actions from input handler
-        actions = self.input_handler.get_actions_from_events(events)
+        actions = self.input_handler.get_ordered_actions(events)
 
         # Process actions based on game state
         if self.state == GameState.GAME_OVER:
@@ -91,7 +229,7 @@ class SnakeGame:
         else:
             return self._handle_playing_actions(actions)
 
-    def _handle_game_over_actions(self, actions: set) -> bool:
+    def _handle_game_over_actions(self, actions: List[InputAction]) -> bool:
         """Handle actions during game over state"""
         if InputAction.RESTART in actions:
             self.reset_game()
@@ -103,18 +241,14 @@ class SnakeGame:
             return False  # This will break the game loop and return to menu
         return True
 
-    def _handle_playing_actions(self, actions: set) -> bool:
+    def _handle_playing_actions(self, actions: List[InputAction]) -> bool:
         """Handle actions during playing state"""
-        # Handle movement actions (only one per frame)
-        if not self.direction_changed_this_frame:
-            for action in actions:
-                if self.input_handler.is_movement_action(action):
-                    direction = self.input_handler.get_direction_from_action(
-                        action
-                    )
-                    if direction and self.snake.change_direction(direction):
-                        self.direction_changed_this_frame = True
-                        break
+        # Queue movement actions in order; update() applies one per tick
+        now = pygame.time.get_ticks()
+        for action in actions:
+            direction = self.input_handler.get_direction_from_action(action)
+            if direction:
+                self.input_queue.push(direction, now)
 
         # Handle other actions
         if InputAction.PAUSE in actions:
@@ -124,8 +258,9 @@ class SnakeGame:
             # Clear direction buffer when unpausing
             if was_paused:
                 self.snake.next_direction = self.snake.direction
+                self.input_queue.clear()
 
-            logger.info(f"Game {'unpaused' if was_paused else 'paused'}")
+            logger.info("Game %s", "unpaused" if was_paused else "paused")
 
         elif InputAction.RESTART in actions:
             self.reset_game()
@@ -136,12 +271,13 @@ class SnakeGame:
 
         return True
 
-    def _handle_paused_actions(self, actions: set) -> bool:
+    def _handle_paused_actions(self, actions: List[InputAction]) -> bool:
         """Handle actions during paused state"""
         if InputAction.PAUSE in actions:
             # Unpause the game
             self.state = GameState.PLAYING
             self.snake.next_direction = self.snake.direction
+            self.input_queue.clear()
             logger.info("Game unpaused")
         elif InputAction.QUIT in actions:
             # Allow quitting from pause menu
@@ -158,45 +294,108 @@ class SnakeGame:
         if self.state != GameState.PLAYING:
             return
 
-        # Move snake
-        self.snake.move()
-
-        # Check collisions
-        if self.snake.check_collision():
-            self._handle_game_over()
-            return
-
-        # Check if snake ate food
-        if self.snake.ate_food(self.food):
-            self.snake.grow()
-            self.score += CONFIG.POINTS_PER_FOOD
-            self.food.respawn(self.snake.body)
+        # Direction changes are queued by the input handlers and take
+        # effect here, so this is where they are recorded
+        snake = self.snake
+        self.input_queue.apply(snake, pygame.time.get_ticks())
+        action = None
+        if snake.next_direction != snake.direction:
+            action = snake.next_direction
+            self.recorder.record(self.simulator.ticks, action)
+            TELEMETRY.emit(
+                TelemetryEvent.DIRECTION,
+                self.simulator.ticks,
+                direction=action.name,
+            )
+        events = self.simulator.step(action)
 
+        if SimEvent.ATE_FOOD in events:
             logger.info(
-                f"Score: {self.score}, Snake length: {self.snake.get_length()}"
+                "Score: %d, Snake length: %d",
+                self.score,
+                self.snake.get_length(),
             )
+            TELEMETRY.emit(
+                TelemetryEvent.FOOD,
+                self.simulator.ticks,
+                score=self.score,
+                length=self.snake.get_length(),
+            )
+
+        if self.simulator.done:
+            if self.board_full:
+                logger.info("Board full - player wins")
+            self._handle_game_over()
 
     def _handle_game_over(self) -> None:
         """Handle game over logic"""
         self.state = GameState.GAME_OVER
+        self.last_replay = self.recorder.finish(
+            self.simulator.ticks, self.score
+        )
+        if self.last_replay is not None and self.replay_dir is not None:
+            self._save_replay(self.last_replay, self.replay_dir)
 
         # Check and save high score
-        is_high_score = self.high_score_manager.add_score(self.score)
+        seed = self.simulator.seed
+        is_high_score = self.high_score_manager.add_score(self.score, seed=seed)
+
+        death_cause = self.simulator.death_cause
+        TELEMETRY.emit(
+            TelemetryEvent.GAME_OVER,
+            self.simulator.ticks,
+            score=self.score,
+            length=self.snake.get_length(),
+            cause=death_cause.value if death_cause is not None else None,
+            food_eaten=self.simulator.food_eaten,
+            direction_changes=(
+                len(self.last_replay.changes) if self.last_replay else 0
+            ),
+            high_score=is_high_score,
+            fps=CONFIG.FPS,
+            wall_collision=CONFIG.WALL_COLLISION,
+        )
 
         if is_high_score:
-            logger.info(f"New high score: {self.score}")
+            logger.info("New high score: %d (seed %d)", self.score, seed)
         else:
-            logger.info(f"Game over. Score: {self.score}")
+            logger.info("Game over. Score: %d (seed %d)", self.score, seed)
+
+    def _save_replay(self, replay: Replay, directory: Path) -> None:
+        """Save a finished game's replay to a directory"""
+        # Millisecond time sorts the files; the random part keeps games
+        # with the same seed and end time (e.g. parallel bots) apart
+        name = f"{time.time_ns() // 1_000_000}_{replay.seed}"
+        path = directory / f"{name}_{uuid.uuid4().hex[:8]}.snkr"
+        try:
+            data = replay.to_bytes()
+            directory.mkdir(parents=True, exist_ok=True)
+        except (OSError, ReplayError) as e:
+            logger.warning("Could not save replay to %s: %s", path, e)
+            return
+        # Written in the background so game over does not stall a frame
+        PERSISTENCE.write(path, data)
+        logger.info("Replay saved to %s", path)
+
+    def _dump_frame_times(self) -> None:
+        """Write the frame timings if a dump was requested"""
+        if FRAME_TIMER.dump_path is None or not FRAME_TIMER.frames:
+            return
+        try:
+            path = FRAME_TIMER.dump()
+            logger.info("Frame timings saved to %s", path)
+        except OSError as e:
+            logger.warning("Could not save frame timings: %s", e)
 
     def draw_text(
         self, text: str, x: int, y: int, color=COLORS.WHITE, font=None
-    ) -> None:
-        """Draw text on screen"""
+    ) -> pygame.Rect:
+        """Draw text on screen and return the area it covers"""
         if font is None:
             font = self.font
 
-        text_surface = font.render(text, True, color)
-        self.screen.blit(text_surface, (x, y))
+        text_surface = render_text(font, text, color)
+        return self.screen.blit(text_surface, (x, y))
 
     def draw_centered_text(
         self, text: str, y: int, color=COLORS.WHITE, font=None
@@ -205,36 +404,67 @@ class SnakeGame:
         if font is None:
             font = self.font
 
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(font, text, color)
         x = (CONFIG.WINDOW_WIDTH - text_surface.get_width()) // 2
         self.screen.blit(text_surface, (x, y))
 
-    def draw_hud(self) -> None:
-        """Draw heads-up display"""
+    def draw_hud(self) -> List[pygame.Rect]:
+        """Draw heads-up display and return the areas it covers"""
         # Current score
-        self.draw_text(f"Score: {self.score}", 10, 10)
+        rects = [self.draw_text(f"Score: {self.score}", 10, 10)]
 
         # High score
         high_score = self.high_score_manager.get_high_score()
-        self.draw_text(f"High Score: {high_score}", 10, 40)
+        rects.append(self.draw_text(f"High Score: {high_score}", 10, 40))
 
         # Snake length
-        self.draw_text(
-            f"Length: {self.snake.get_length()}", 10, 70, font=self.small_font
+        rects.append(
+            self.draw_text(
+                f"Length: {self.snake.get_length()}",
+                10,
+                70,
+                font=self.small_font,
+            )
+        )
+
+        # Frame timing overlay (F3), below the HUD
+        overlay = FRAME_TIMER.draw_overlay(self.screen, (10, 100))
+        if overlay is not None:
+            rects.append(overlay)
+        return rects
+
+    def _hud_key(self) -> Hashable:
+        """Get the values shown by the HUD, to detect when it changes"""
+        return (
+            self.score,
+            self.high_score_manager.get_high_score(),
+            self.snake.get_length(),
+            FRAME_TIMER.overlay_key(),
         )
 
+    def _get_dim_layer(self) -> pygame.Surface:
+        """Get the semi-transparent layer that dims the board"""
+        size = (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
+        if self._dim_layer is None or self._dim_layer.get_size() != size:
+            self._dim_layer = pygame.Surface(size)
+            self._dim_layer.set_alpha(128)
+            self._dim_layer.fill(COLORS.BLACK)
+        return self._dim_layer
+
     def draw_game_over_screen(self) -> None:
         """Draw game over screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(COLORS.BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_dim_layer(), (0, 0))
 
         # Game over text
-        self.draw_centered_text(
-            "GAME OVER", CONFIG.WINDOW_HEIGHT // 2 - 60, COLORS.RED
-        )
+        if self.board_full:
+            self.draw_centered_text(
+                "YOU WIN!", CONFIG.WINDOW_HEIGHT // 2 - 60, COLORS.GREEN
+            )
+        else:
+            self.draw_centered_text(
+                "GAME OVER", CONFIG.WINDOW_HEIGHT // 2 - 60, COLORS.RED
+            )
 
         # Final score
         self.draw_centered_text(
@@ -257,10 +487,7 @@ class SnakeGame:
     def draw_pause_screen(self) -> None:
         """Draw pause screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(COLORS.BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_dim_layer(), (0, 0))
 
         self.draw_centered_text(
             "PAUSED", CONFIG.WINDOW_HEIGHT // 2 - 40, COLORS.BLUE
@@ -276,8 +503,50 @@ class SnakeGame:
             font=self.small_font,
         )
 
+    def _overlay_state_key(self) -> Hashable:
+        """Get everything the pause/game over screen shows"""
+        high_score = self.high_score_manager.get_high_score()
+        return (
+            self.state,
+            self.score,
+            high_score,
+            self.score == high_score,
+            self.board_full,
+            self.snake.get_length(),
+            (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT),
+            FRAME_TIMER.overlay_key(),
+        )
+
     def draw(self) -> None:
         """Draw all game elements"""
+        if self.state in (GameState.PAUSED, GameState.GAME_OVER):
+            key = self._overlay_state_key()
+            if key == self._overlay_key:
+                # The composed screen is still on the display
+                if self._screen_exposed:
+                    present()
+                self._screen_exposed = False
+                return
+            self._overlay_key = key
+        else:
+            self._overlay_key = None
+
+        self._screen_exposed = False
+        if CONFIG.DIRTY_RECT_RENDERING and self.state == GameState.PLAYING:
+            # Repaint only the cells and HUD text that changed
+            self.renderer.draw(
+                self.snake,
+                self.food,
+                self._hud_key(),
+                self.draw_hud,
+                self.interpolation,
+            )
+            return
+
+        # Overlays cover the board, so the next incremental frame must
+        # start from a full redraw
+        self.renderer.invalidate()
+
         # Clear screen
         self.screen.fill(COLORS.BLACK)
 
@@ -287,7 +556,11 @@ class SnakeGame:
             self.food.draw(self.screen)
 
         # Draw HUD
-        self.draw_hud()
+        hud_rect = union_rects(self.draw_hud())
+        if self.state == GameState.PLAYING:
+            draw_motion(
+                self.screen, self.snake, self.food, self.interpolation, hud_rect
+            )
 
         # Draw state-specific overlays
         if self.state == GameState.PAUSED:
@@ -296,7 +569,7 @@ class SnakeGame:
             self.draw_game_over_screen()
 
         # Update display
-        pygame.display.flip()
+        present()
 
     def run_game_session(self) -> str:
         """Run a single game session and return next state"""
@@ -304,11 +577,23 @@ class SnakeGame:
 
         # Reset game state
         self.reset_game()
+        self._frame_ms = self.clock.tick()
 
-        running = True
         try:
-            while running:
-                running = self.handle_events()
+            while True:
+                FRAME_TIMER.begin_frame()
+                CONFIG_WATCHER.poll()
+                if CONFIG.FIXED_TIMESTEP:
+                    running = self._run_fixed_timestep_frame()
+                    frame_rate = CONFIG.RENDER_FPS
+                else:
+                    running = self._run_frame()
+                    frame_rate = CONFIG.FPS
+                # Only a running game has a frame budget to miss
+                if self.state == GameState.PLAYING:
+                    FRAME_TIMER.end_frame(1000 / frame_rate)
+                else:
+                    FRAME_TIMER.end_frame()
                 if not running:
                     # Check if we should return to menu or quit entirely
                     if self.state == GameState.MENU:
@@ -316,28 +601,87 @@ class SnakeGame:
                     else:
                         return MenuState.QUIT.value
 
-                self.update()
-                self.draw()
-                self.clock.tick(CONFIG.FPS)
-
         except KeyboardInterrupt:
             logger.info("Game session interrupted by user")
             return MenuState.QUIT.value
         except Exception as e:
-            logger.error(f"Unexpected error in game session: {e}")
+            logger.error("Unexpected error in game session: %s", e)
             return MenuState.QUIT.value
 
-        # Fallback - return to main menu
-        return MenuState.MAIN_MENU.value
+    def _run_frame(self) -> bool:
+        """Run one frame that is also one simulation tick"""
+        if not self.handle_events():
+            return False
+        FRAME_TIMER.mark(PHASE_EVENTS)
+
+        self.update()
+        FRAME_TIMER.mark(PHASE_UPDATE)
+        self.draw()
+        FRAME_TIMER.mark(PHASE_DRAW)
+        # Only a running game ticks at a fixed rate; the other states
+        # block in handle_events() until there is input
+        if self.state == GameState.PLAYING:
+            self.clock.tick(CONFIG.FPS)
+            FRAME_TIMER.mark(PHASE_SLEEP)
+        return True
+
+    def _run_fixed_timestep_frame(self) -> bool:
+        """Run one display frame and as many ticks as are due.
+
+        Input is polled and the screen redrawn at CONFIG.RENDER_FPS, while
+        the simulation advances in steps of exactly 1000 / CONFIG.FPS ms
+        of elapsed time, so game speed does not depend on the frame rate.
+        """
+        was_playing = self.state == GameState.PLAYING
+        if not self.handle_events():
+            return False
+        FRAME_TIMER.mark(PHASE_EVENTS)
+
+        if self.state == GameState.PLAYING:
+            if was_playing:
+                tick_ms = 1000.0 / CONFIG.FPS
+                self._accumulator = min(
+                    self._accumulator + self._frame_ms,
+                    tick_ms * MAX_TICKS_PER_FRAME,
+                )
+            else:
+                # Time spent paused or on the game over screen is not
+                # simulated
+                self.clock.tick()
+                self._accumulator = 0.0
+            self._step_due_ticks()
+        FRAME_TIMER.mark(PHASE_UPDATE)
+
+        self.draw()
+        FRAME_TIMER.mark(PHASE_DRAW)
+        if self.state == GameState.PLAYING:
+            self._frame_ms = self.clock.tick(CONFIG.RENDER_FPS)
+            FRAME_TIMER.mark(PHASE_SLEEP)
+        return True
+
+    def _step_due_ticks(self) -> None:
+        """Run the ticks covered by the accumulated time"""
+        tick_ms = 1000.0 / CONFIG.FPS
+        while self._accumulator >= tick_ms:
+            self.update()
+            self._accumulator -= tick_ms
+            if self.state != GameState.PLAYING:
+                self._accumulator = 0.0
+                break
+        self.interpolation = min(self._accumulator / tick_ms, 1.0)
 
     def run(self) -> None:
         """Main game loop with menu integration"""
         logger.info("Starting Snake Game with menu system")
 
         # Initialize menu manager
-        menu_manager = MenuManager(self.screen)
+        self.menu_manager = MenuManager(self.screen)
         current_state = MenuState.MAIN_MENU.value
 
+        # Pick up edits to config.json while running
+        CONFIG_WATCHER.add_listener(self.apply_config_changes)
+        CONFIG_WATCHER.start()
+
         try:
             while current_state != MenuState.QUIT.value:
                 if current_state == MenuState.GAME.value:
@@ -345,27 +689,41 @@ class SnakeGame:
                     current_state = self.run_game_session()
                 else:
                     # Run menu system
-                    current_state = menu_manager.run()
+                    current_state = self.menu_manager.run()
 
         except KeyboardInterrupt:
             logger.info("Game interrupted by user")
         except Exception as e:
-            logger.error(f"Unexpected error in main loop: {e}")
+            logger.error("Unexpected error in main loop: %s", e)
             raise
         finally:
             logger.info("Shutting down Snake Game")
+            CONFIG_WATCHER.stop()
+            CONFIG_WATCHER.remove_listener(self.apply_config_changes)
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug("Text cache: %s", TEXT_CACHE.stats())
+                logger.debug(
+                    "Input latency: %s", self.input_queue.latency_stats()
+                )
+            self._dump_frame_times()
+            TELEMETRY.close()
+            PERSISTENCE.flush()
             pygame.quit()
             sys.exit()
 
 
-def run_game_only() -> str:
+def run_game_only(seed: Optional[int] = None) -> str:
     """Run game without menu system (for direct game launch)"""
-    game = SnakeGame()
+    CONFIG.ensure_loaded()
+    logger.configure()
+    game = SnakeGame(seed)
     return game.run_game_session()
 
 
 def main():
     """Main entry point"""
+    CONFIG.ensure_loaded()
+    logger.configure()
     game = SnakeGame()
     game.run()
 
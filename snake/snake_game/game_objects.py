@@ -1,14 +1,34 @@
 """
 Core game objects for Snake Game
+
+This module is pure Python: the draw methods import the pygame tile cache
+(sprites.py) only when called, so the game rules can run without importing
+pygame.
 """
 
-import pygame
+import logging
 import random
+from array import array
+from collections import deque
 from enum import Enum
-from typing import List, Tuple
-from .config import CONFIG, COLORS
+from functools import lru_cache
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+from .config import CONFIG
 from .logger import logger
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Direction(Enum):
     """Enum for possible movement directions"""
@@ -19,8 +39,22 @@ class Direction(Enum):
     RIGHT = (1, 0)
 
 
+class CollisionType(Enum):
+    """Kinds of collisions that end a game"""
+
+    WALL = "wall"
+    SELF = "self"
+
+
 class Position:
-    """Represents a position on the game grid"""
+    """Represents a position on the game grid.
+
+    Positions are immutable value objects. Positions inside the grid are
+    interned by PositionTable, so the hot paths hand out the same instance
+    for a cell instead of allocating a new one every tick.
+    """
+
+    __slots__ = ("x", "y")
 
     def __init__(self, x: int, y: int):
         self.x = x
@@ -28,13 +62,15 @@ class Position:
 
     def __eq__(self, other) -> bool:
         """Check equality with another Position"""
+        if self is other:
+            return True
         if isinstance(other, Position):
             return self.x == other.x and self.y == other.y
         return False
 
     def __hash__(self) -> int:
         """Make Position hashable for use in sets"""
-        return hash((self.x, self.y))
+        return self.x * 65537 + self.y
 
     def __repr__(self) -> str:
         """String representation for debugging"""
@@ -43,7 +79,7 @@ class Position:
     def __add__(self, direction: Direction) -> "Position":
         """Add a direction to get a new position"""
         dx, dy = direction.value
-        return Position(self.x + dx, self.y + dy)
+        return current_position_table().get(self.x + dx, self.y + dy)
 
     def to_pixel(self) -> Tuple[int, int]:
         """Convert grid position to pixel coordinates"""
@@ -55,9 +91,8 @@ class Position:
 
     def wrap_around(self) -> "Position":
         """Wrap position around game boundaries (teleport to opposite side)"""
-        new_x = self.x % CONFIG.grid_width
-        new_y = self.y % CONFIG.grid_height
-        return Position(new_x, new_y)
+        table = current_position_table()
+        return table.get(self.x % table.width, self.y % table.height)
 
     def is_out_of_bounds(self) -> bool:
         """Check if position is outside game boundaries"""
@@ -69,63 +104,335 @@ class Position:
         )
 
 
+class PositionTable:
+    """Interned positions and packed cell ids for one grid size.
+
+    Cell ids are ``y * width + x``. The table holds one Position per cell,
+    created lazily on first use, so stepping around the grid reuses the
+    same objects instead of allocating new ones.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self._positions: List[Optional[Position]] = [None] * self.size
+
+    def cell_id(self, position: Position) -> int:
+        """Get the cell id of a position, or -1 if it is off the grid"""
+        x = position.x
+        y = position.y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def from_cell(self, cell: int) -> Position:
+        """Get the interned position of a cell id"""
+        position = self._positions[cell]
+        if position is None:
+            position = Position(cell % self.width, cell // self.width)
+            self._positions[cell] = position
+        return position
+
+    def get(self, x: int, y: int) -> Position:
+        """Get the interned position for coordinates.
+
+        Off-grid coordinates cannot be interned and get a fresh Position.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.from_cell(y * self.width + x)
+        return Position(x, y)
+
+    def step(
+        self, position: Position, direction: Direction, wrap: bool
+    ) -> Position:
+        """Get the position one cell away in a direction"""
+        dx, dy = direction.value
+        x = position.x + dx
+        y = position.y + dy
+        if wrap:
+            x %= self.width
+            y %= self.height
+        return self.get(x, y)
+
+
+@lru_cache(maxsize=4)
+def get_position_table(width: int, height: int) -> PositionTable:
+    """Get the shared position table for a grid size"""
+    return PositionTable(width, height)
+
+
+def current_position_table() -> PositionTable:
+    """Get the position table for the configured grid"""
+    return get_position_table(CONFIG.grid_width, CONFIG.grid_height)
+
+
+class FreeCells:
+    """Index of the unoccupied grid cells.
+
+    Free cell ids are packed at the front of an array and a second array
+    maps every cell id to its slot in the first one (-1 while the cell is
+    occupied). Cells are taken out with a swap-remove, so occupying,
+    releasing and sampling are all O(1).
+    """
+
+    def __init__(self, width: int, height: int):
+        self.table = get_position_table(width, height)
+        self.width = width
+        self.height = height
+        size = width * height
+        self._cells = array("l", range(size))
+        self._slots = array("l", range(size))
+        self._count = size
+
+    @classmethod
+    def from_occupied(
+        cls, width: int, height: int, occupied: Iterable[Position]
+    ) -> "FreeCells":
+        """Build an index with the given positions already occupied"""
+        free_cells = cls(width, height)
+        for position in occupied:
+            free_cells.occupy(position)
+        return free_cells
+
+    def occupy(self, position: Position) -> None:
+        """Mark a cell as occupied"""
+        cell = self.table.cell_id(position)
+        if cell >= 0:
+            self.occupy_cell(cell)
+
+    def release(self, position: Position) -> None:
+        """Mark a cell as free"""
+        cell = self.table.cell_id(position)
+        if cell >= 0:
+            self.release_cell(cell)
+
+    def occupy_cell(self, cell: int) -> None:
+        """Mark a cell id as occupied"""
+        slot = self._slots[cell]
+        if slot < 0:
+            return
+
+        # Swap the last free cell into the vacated slot
+        self._count -= 1
+        last = self._cells[self._count]
+        self._cells[slot] = last
+        self._slots[last] = slot
+        self._cells[self._count] = cell
+        self._slots[cell] = -1
+
+    def release_cell(self, cell: int) -> None:
+        """Mark a cell id as free"""
+        if self._slots[cell] >= 0:
+            return
+
+        self._cells[self._count] = cell
+        self._slots[cell] = self._count
+        self._count += 1
+
+    def sample(self, rng: random.Random) -> Optional[Position]:
+        """Pick a uniformly random free cell, or None if the board is full"""
+        if not self._count:
+            return None
+        cell = self._cells[rng.randrange(self._count)]
+        return self.table.from_cell(cell)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, position: object) -> bool:
+        if not isinstance(position, Position):
+            return False
+        cell = self.table.cell_id(position)
+        return cell >= 0 and self._slots[cell] >= 0
+
+
+def cell_rect(position: Position) -> Tuple[int, int, int, int]:
+    """Get the screen rectangle of a grid cell"""
+    grid_size = CONFIG.GRID_SIZE
+    return (
+        position.x * grid_size,
+        position.y * grid_size,
+        grid_size,
+        grid_size,
+    )
+
+
 class Food:
-    """Represents food in the game"""
+    """Represents food in the game.
 
-    def __init__(self):
+    All placement randomness comes from ``rng``; pass a seeded
+    ``random.Random`` to make food placement reproducible.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng if rng is not None else random.Random()
         self.position = self._generate_random_position()
-        logger.debug(f"Food spawned at {self.position}")
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Food spawned at %s", self.position)
 
     def _generate_random_position(self) -> Position:
         """Generate a random position within game boundaries"""
-        x = random.randint(0, CONFIG.grid_width - 1)
-        y = random.randint(0, CONFIG.grid_height - 1)
-        return Position(x, y)
+        x = self.rng.randint(0, CONFIG.grid_width - 1)
+        y = self.rng.randint(0, CONFIG.grid_height - 1)
+        return current_position_table().get(x, y)
+
+    def respawn(
+        self, avoid_positions: Union["SnakeBody", Iterable[Position]]
+    ) -> bool:
+        """Respawn food avoiding specified positions (usually snake body).
+
+        Returns False when every cell is taken (the board is full), in
+        which case the food keeps its current position.
+        """
+        free_cells = getattr(avoid_positions, "free_cells", None)
+        if free_cells is None:
+            free_cells = FreeCells.from_occupied(
+                CONFIG.grid_width, CONFIG.grid_height, avoid_positions
+            )
+
+        new_position = free_cells.sample(self.rng)
+        if new_position is None:
+            logger.info("No free cell left for food: board is full")
+            return False
+
+        self.position = new_position
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Food respawned at %s", new_position)
+        return True
 
-    def respawn(self, avoid_positions: List[Position]) -> None:
-        """Respawn food avoiding specified positions (usually snake body)"""
-        max_attempts = 100  # Prevent infinite loop
-        attempts = 0
-
-        while attempts < max_attempts:
-            new_position = self._generate_random_position()
-            if new_position not in avoid_positions:
-                self.position = new_position
-                logger.debug(f"Food respawned at {self.position}")
-                return
-            attempts += 1
-
-        # Fallback: find first available position
-        for x in range(CONFIG.grid_width):
-            for y in range(CONFIG.grid_height):
-                candidate = Position(x, y)
-                if candidate not in avoid_positions:
-                    self.position = candidate
-                    logger.warning(
-                        f"Food respawned using fallback at {self.position}"
-                    )
-                    return
-
-        logger.error("Could not find valid position for food respawn")
-
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: "pygame.Surface") -> None:
         """Draw the food on the screen"""
-        pixel_pos = self.position.to_pixel()
+        from .sprites import TILE_CACHE
 
-        # Draw main food rectangle
-        pygame.draw.rect(
-            screen,
-            COLORS.RED,
-            (pixel_pos[0], pixel_pos[1], CONFIG.GRID_SIZE, CONFIG.GRID_SIZE),
+        grid_size = CONFIG.GRID_SIZE
+        screen.blit(
+            TILE_CACHE.get().food,
+            (self.position.x * grid_size, self.position.y * grid_size),
         )
 
-        # Draw border for better visibility
-        pygame.draw.rect(
-            screen,
-            COLORS.WHITE,
-            (pixel_pos[0], pixel_pos[1], CONFIG.GRID_SIZE, CONFIG.GRID_SIZE),
-            1,
-        )
+
+class SnakeBody:
+    """Deque-backed snake body with a per-cell occupancy index.
+
+    Segments are ordered head first. The occupancy index counts how many
+    segments sit on each cell (an array indexed by cell id, plus a small
+    dict for segments off the grid), so membership and self-collision
+    checks are O(1) instead of a scan over the whole body. When a
+    FreeCells index is attached it is kept in sync as cells become
+    occupied or free.
+    """
+
+    def __init__(
+        self,
+        segments: Iterable[Position] = (),
+        free_cells: Optional[FreeCells] = None,
+    ):
+        if free_cells is not None:
+            self._table = free_cells.table
+        else:
+            self._table = current_position_table()
+        self._segments: Deque[Position] = deque()
+        self._counts = array("l", [0]) * self._table.size
+        self._off_grid: Dict[Position, int] = {}
+        self.free_cells = free_cells
+        for segment in segments:
+            self.append_tail(segment)
+
+    def _occupy(self, position: Position) -> None:
+        """Increment the occupancy counter of a cell"""
+        cell = self._table.cell_id(position)
+        if cell < 0:
+            self._off_grid[position] = self._off_grid.get(position, 0) + 1
+            return
+
+        count = self._counts[cell]
+        self._counts[cell] = count + 1
+        if not count and self.free_cells is not None:
+            self.free_cells.occupy_cell(cell)
+
+    def _release(self, position: Position) -> None:
+        """Decrement the occupancy counter of a cell"""
+        cell = self._table.cell_id(position)
+        if cell < 0:
+            count = self._off_grid[position] - 1
+            if count:
+                self._off_grid[position] = count
+            else:
+                del self._off_grid[position]
+            return
+
+        count = self._counts[cell] - 1
+        self._counts[cell] = count
+        if not count and self.free_cells is not None:
+            self.free_cells.release_cell(cell)
+
+    @property
+    def head(self) -> Position:
+        """Get the head segment"""
+        return self._segments[0]
+
+    @property
+    def tail(self) -> Position:
+        """Get the tail segment"""
+        return self._segments[-1]
+
+    def push_head(self, position: Position) -> None:
+        """Add a new head segment"""
+        self._segments.appendleft(position)
+        self._occupy(position)
+
+    def append_tail(self, position: Position) -> None:
+        """Add a new tail segment"""
+        self._segments.append(position)
+        self._occupy(position)
+
+    def pop_tail(self) -> Position:
+        """Remove and return the tail segment"""
+        position = self._segments.pop()
+        self._release(position)
+        return position
+
+    def occupancy(self, position: Position) -> int:
+        """Get how many segments occupy the given cell"""
+        cell = self._table.cell_id(position)
+        if cell < 0:
+            return self._off_grid.get(position, 0)
+        return self._counts[cell]
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(self._segments)
+
+    def __contains__(self, position: object) -> bool:
+        if not isinstance(position, Position):
+            return False
+        return self.occupancy(position) > 0
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Position, List[Position]]:
+        if isinstance(index, slice):
+            return list(self._segments)[index]
+        return self._segments[index]
+
+    def __setitem__(self, index: int, position: Position) -> None:
+        """Replace a segment, keeping the occupancy index in sync"""
+        self._release(self._segments[index])
+        self._segments[index] = position
+        self._occupy(position)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SnakeBody):
+            return self._segments == other._segments
+        if isinstance(other, list):
+            return list(self._segments) == other
+        return False
+
+    def __repr__(self) -> str:
+        return f"SnakeBody({list(self._segments)})"
 
 
 class Snake:
@@ -138,40 +445,67 @@ class Snake:
         self.next_direction = Direction.RIGHT  # Input buffer
         self.grow_pending = False
 
-        logger.info(f"Snake initialized with {len(self.body)} segments")
+        logger.info("Snake initialized with %d segments", len(self.body))
+
+    @property
+    def body(self) -> SnakeBody:
+        """Snake segments, head first"""
+        return self._body
+
+    @body.setter
+    def body(self, segments: Iterable[Position]) -> None:
+        """Replace the whole body, rebuilding the occupancy indexes"""
+        if isinstance(segments, SnakeBody):
+            self._body = segments
+        else:
+            self._body = SnakeBody(segments, self._create_free_cells())
+
+        # Where the head and tail were before the last move, for
+        # interpolated rendering; unknown for a new body
+        self.previous_head: Optional[Position] = None
+        self.vacated_tail: Optional[Position] = None
 
-    def _create_initial_body(self) -> List[Position]:
+    def _create_free_cells(self) -> FreeCells:
+        """Create an empty free-cell index for the current grid"""
+        return FreeCells(CONFIG.grid_width, CONFIG.grid_height)
+
+    def _create_initial_body(self) -> SnakeBody:
         """Create initial snake body"""
         center_x = CONFIG.center_x
         center_y = CONFIG.center_y
 
-        body = []
+        body = SnakeBody(free_cells=self._create_free_cells())
+        table = current_position_table()
         for i in range(CONFIG.INITIAL_SNAKE_LENGTH):
-            body.append(Position(center_x - i, center_y))
+            body.append_tail(table.get(center_x - i, center_y))
 
         return body
 
     def move(self) -> None:
         """Move the snake one position forward"""
+        body = self._body
+
         # Apply buffered direction
         self.direction = self.next_direction
 
-        # Calculate new head position
-        new_head = self.body[0] + self.direction
-
-        # Handle boundaries based on configuration
-        if not CONFIG.WALL_COLLISION:
-            new_head = new_head.wrap_around()
+        # Calculate new head position, wrapping around the boundaries
+        # unless walls are enabled
+        new_head = current_position_table().step(
+            body.head, self.direction, not CONFIG.WALL_COLLISION
+        )
 
         # Add new head
-        self.body.insert(0, new_head)
+        self.previous_head = body.head
+        body.push_head(new_head)
 
         # Remove tail if not growing
         if not self.grow_pending:
-            self.body.pop()
+            self.vacated_tail = body.pop_tail()
         else:
+            self.vacated_tail = None
             self.grow_pending = False
-            logger.debug(f"Snake grew to {len(self.body)} segments")
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug("Snake grew to %d segments", len(body))
 
     def change_direction(self, new_direction: Direction) -> bool:
         """Change snake direction (prevents reverse movement)"""
@@ -186,38 +520,47 @@ class Snake:
         # Prevent reverse movement
         if new_direction != opposite_directions.get(self.direction):
             self.next_direction = new_direction
-            logger.debug(f"Direction changed to {new_direction}")
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug("Direction changed to %s", new_direction)
             return True
 
-        logger.debug(
-            f"Invalid direction change to {new_direction} (reverse movement)"
-        )
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Invalid direction change to %s (reverse movement)",
+                new_direction,
+            )
         return False
 
     def grow(self) -> None:
         """Mark that snake should grow on next move"""
         self.grow_pending = True
 
-    def check_collision(self) -> bool:
-        """Check if snake has collided with walls or itself"""
-        head = self.body[0]
+    def get_collision(self) -> Optional[CollisionType]:
+        """Get the collision the snake's head is in, if any"""
+        body = self._body
+        head = body.head
 
         # Check wall collision only if enabled
         if CONFIG.WALL_COLLISION and head.is_out_of_bounds():
-            logger.info(f"Snake hit wall at {head}")
-            return True
+            logger.info("Snake hit wall at %s", head)
+            return CollisionType.WALL
 
-        # Check self collision
-        if head in self.body[1:]:
-            logger.info(f"Snake hit itself at {head}")
-            return True
+        # Check self collision (the head itself accounts for one segment)
+        if body.occupancy(head) > 1:
+            logger.info("Snake hit itself at %s", head)
+            return CollisionType.SELF
 
-        return False
+        return None
+
+    def check_collision(self) -> bool:
+        """Check if snake has collided with walls or itself"""
+        return self.get_collision() is not None
 
     def ate_food(self, food: Food) -> bool:
         """Check if snake ate the food"""
-        if self.body[0] == food.position:
-            logger.debug("Snake ate food")
+        if self._body.head == food.position:
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug("Snake ate food")
             return True
         return False
 
@@ -225,35 +568,31 @@ class Snake:
         """Get current snake length"""
         return len(self.body)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the snake on the screen"""
-        for i, segment in enumerate(self.body):
-            pixel_pos = segment.to_pixel()
-
-            # Different color for head
-            color = COLORS.DARK_GREEN if i == 0 else COLORS.GREEN
-
-            # Draw segment
-            pygame.draw.rect(
-                screen,
-                color,
-                (
-                    pixel_pos[0],
-                    pixel_pos[1],
-                    CONFIG.GRID_SIZE,
-                    CONFIG.GRID_SIZE,
-                ),
-            )
-
-            # Draw border
-            pygame.draw.rect(
-                screen,
-                COLORS.BLACK,
-                (
-                    pixel_pos[0],
-                    pixel_pos[1],
-                    CONFIG.GRID_SIZE,
-                    CONFIG.GRID_SIZE,
-                ),
-                1,
-            )
+    def draw(self, screen: "pygame.Surface") -> None:
+        """Draw the snake on the screen with one batched blit"""
+        from .sprites import TILE_CACHE
+
+        tiles = TILE_CACHE.get()
+        body_tile = tiles.body
+        grid_size = CONFIG.GRID_SIZE
+        blits = [
+            (body_tile, (segment.x * grid_size, segment.y * grid_size))
+            for segment in self._body
+        ]
+        if blits:
+            # Different tile for the head
+            blits[0] = (tiles.head, blits[0][1])
+        screen.blits(blits, False)
+
+    def draw_segment(
+        self, screen: "pygame.Surface", segment: Position, is_head: bool
+    ) -> None:
+        """Draw a single segment, e.g. for incremental rendering"""
+        from .sprites import TILE_CACHE
+
+        tiles = TILE_CACHE.get()
+        grid_size = CONFIG.GRID_SIZE
+        screen.blit(
+            tiles.head if is_head else tiles.body,
+            (segment.x * grid_size, segment.y * grid_size),
+        )
@@ -2,60 +2,76 @@
 High score management system
 """
 
-import json
 from pathlib import Path
-from typing import List, Optional, TypedDict
+from typing import List, Optional, Union
 from datetime import datetime
 from .logger import logger
+from .score_store import ScoreEntry, ScoreListener, get_score_store
 
 
-class ScoreEntry(TypedDict):
-    """Represents a single score entry"""
-
-    score: int
-    player: str
-    date: str
-    timestamp: float
+class HighScoreManager:
+    """High score manager with persistent storage.
 
+    Every score is kept in a ScoreStore log next to ``file_path`` (same
+    name, ``.jsonl`` suffix); the high score table is its best
+    ``max_scores`` entries. Scores from an older ``file_path`` JSON file
+    are imported the first time the log is created.
 
-class HighScoreManager:
-    """High score manager with persistent storage"""
+    Managers for the same file share one in-memory store, so a score
+    added by the game is immediately seen by the high score menu.
+    """
 
     def __init__(
-        self, file_path: str = "high_scores.json", max_scores: int = 10
+        self,
+        file_path: str = "high_scores.json",
+        max_scores: int = 10,
+        store_path: Union[str, Path, None] = None,
     ):
         self.file_path = Path(file_path)
         self.max_scores = max_scores
-        self.scores: List[ScoreEntry] = self._load_scores()
-
-    def _load_scores(self) -> List[ScoreEntry]:
-        """Load scores from file"""
+        if store_path is None:
+            store_path = self.file_path.with_suffix(".jsonl")
+        self.store = get_score_store(store_path)
+        if self.store.is_new:
+            self._import_legacy_scores()
+
+    def _import_legacy_scores(self) -> None:
+        """Import scores from the old whole-file JSON format"""
         if not self.file_path.exists():
             logger.info("High score file not found, starting with empty scores")
-            return []
+            return
 
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                scores: List[ScoreEntry] = data
-                logger.info(f"Loaded {len(scores)} high scores")
-                return scores
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Failed to load high scores: {e}")
-            return []
-
-    def _save_scores(self) -> bool:
-        """Save scores to file"""
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.scores, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved {len(self.scores)} high scores")
-            return True
-        except IOError as e:
-            logger.error(f"Failed to save high scores: {e}")
-            return False
-
-    def add_score(self, score: int, player_name: str = "Anonymous") -> bool:
+            count = self.store.import_json(self.file_path)
+            logger.info(
+                "Imported %d high scores from %s", count, self.file_path
+            )
+        except (ValueError, OSError) as e:
+            logger.error("Failed to load high scores: %s", e)
+
+    def refresh(self) -> bool:
+        """Pick up scores saved by other processes. Returns True if any."""
+        return self.store.refresh()
+
+    def add_listener(self, listener: ScoreListener) -> None:
+        """Call a function whenever the scores change"""
+        self.store.add_listener(listener)
+
+    def remove_listener(self, listener: ScoreListener) -> None:
+        """Stop calling a listener"""
+        self.store.remove_listener(listener)
+
+    @property
+    def scores(self) -> List[ScoreEntry]:
+        """The high score table, best first"""
+        return self.store.top(self.max_scores)
+
+    def add_score(
+        self,
+        score: int,
+        player_name: str = "Anonymous",
+        seed: Optional[int] = None,
+    ) -> bool:
         """Add new score and return True if it's a new high score"""
         is_new_high_score = self.is_high_score(score)
 
@@ -65,51 +81,49 @@ class HighScoreManager:
             "date": datetime.now().isoformat(),
             "timestamp": datetime.now().timestamp(),
         }
+        if seed is not None:
+            new_score_entry["seed"] = seed
 
-        self.scores.append(new_score_entry)
-
-        # Sort by score (descending) and keep only top scores
-        self.scores.sort(key=lambda x: x["score"], reverse=True)
-        self.scores = self.scores[: self.max_scores]
+        # Appends one record; the whole history is kept
+        self.store.add(new_score_entry)
 
-        # Save to file
-        self._save_scores()
-
-        logger.info(f"Added score: {score} by {player_name}")
+        logger.info("Added score: %d by %s", score, player_name)
 
         return is_new_high_score
 
     def is_high_score(self, score: int) -> bool:
         """Check if score qualifies as a high score"""
-        if len(self.scores) < self.max_scores:
+        if len(self.store) < self.max_scores:
             return True
 
         return score > self.get_lowest_high_score()
 
     def get_high_score(self) -> int:
         """Get the highest score"""
-        return self.scores[0]["score"] if self.scores else 0
+        top = self.store.top(1)
+        return top[0]["score"] if top else 0
 
     def get_lowest_high_score(self) -> int:
         """Get the lowest high score"""
-        return self.scores[-1]["score"] if self.scores else 0
+        scores = self.scores
+        return scores[-1]["score"] if scores else 0
 
     def get_top_scores(self, limit: Optional[int] = None) -> List[ScoreEntry]:
         """Get top scores with optional limit"""
         if limit is None:
             limit = self.max_scores
 
-        return self.scores[:limit]
+        return self.store.top(limit)
 
     def get_player_best_score(self, player_name: str) -> int:
         """Get best score for a specific player"""
-        player_scores = [
-            s["score"] for s in self.scores if s["player"] == player_name
-        ]
-        return max(player_scores) if player_scores else 0
+        return self.store.player_best(player_name)
+
+    def get_rank(self, score: int) -> int:
+        """Get the position a score takes among all scores (1 is best)"""
+        return self.store.rank(score)
 
     def clear_scores(self) -> None:
         """Clear all scores"""
-        self.scores = []
-        self._save_scores()
+        self.store.clear()
         logger.info("Cleared all high scores")
@@ -1,11 +1,21 @@
 """
 Input management system for Snake Game
+
+Direction keys are not applied as they arrive: they go through an
+InputQueue that keeps them in the order they were pressed and hands the
+game at most one valid direction change per simulation tick, so quick
+combinations such as up-then-left are played out over two ticks instead
+of being lost.
 """
 
 import pygame
+from collections import deque
 from enum import Enum
-from typing import Dict, Optional, Set, List
-from .game_objects import Direction
+from typing import Deque, Dict, NamedTuple, Optional, Set, List
+from .game_objects import Direction, Snake
+
+# Longest time an idle screen blocks waiting for input, in milliseconds
+IDLE_TIMEOUT_MS = 500
 
 
 class InputAction(Enum):
@@ -63,13 +73,19 @@ class InputHandler:
         self, events: List[pygame.event.Event]
     ) -> Set[InputAction]:
         """Convert pygame events to game actions"""
-        actions = set()
+        return set(self.get_ordered_actions(events))
+
+    def get_ordered_actions(
+        self, events: List[pygame.event.Event]
+    ) -> List[InputAction]:
+        """Convert pygame events to game actions in the order pressed"""
+        actions = []
 
         for event in events:
             if event.type == pygame.KEYDOWN:
                 action = self.key_mappings.get(event.key)
                 if action:
-                    actions.add(action)
+                    actions.append(action)
 
         return actions
 
@@ -91,3 +107,87 @@ class InputHandler:
         """Remove key mapping"""
         if key in self.key_mappings:
             del self.key_mappings[key]
+
+
+class QueuedInput(NamedTuple):
+    """A direction key press waiting for its tick"""
+
+    direction: Direction
+    timestamp_ms: int
+
+
+class InputQueue:
+    """Bounded, ordered queue of direction changes.
+
+    Presses beyond ``depth`` are dropped, as are repeats of the last
+    queued direction. Each tick, apply() feeds the snake the oldest
+    direction it accepts; Snake.change_direction still rejects reversals.
+    The time from press to move is kept for the last ``history`` moves.
+    """
+
+    def __init__(self, depth: int = 3, history: int = 256):
+        if depth <= 0:
+            raise ValueError("Input queue depth must be positive")
+
+        self.depth = depth
+        self.dropped = 0
+        self._inputs: Deque[QueuedInput] = deque()
+        self.latencies: Deque[int] = deque(maxlen=history)
+
+    def push(self, direction: Direction, timestamp_ms: int) -> bool:
+        """Queue a direction change. Returns False if it was dropped."""
+        inputs = self._inputs
+        if inputs and inputs[-1].direction == direction:
+            return False
+        if len(inputs) >= self.depth:
+            self.dropped += 1
+            return False
+
+        inputs.append(QueuedInput(direction, timestamp_ms))
+        return True
+
+    def apply(self, snake: Snake, now_ms: int) -> Optional[QueuedInput]:
+        """Turn the snake with the oldest valid queued direction.
+
+        Directions the snake already moves in or cannot take are
+        discarded. Returns the applied input, if any.
+        """
+        inputs = self._inputs
+        while inputs:
+            queued = inputs.popleft()
+            if queued.direction == snake.direction:
+                continue
+            if snake.change_direction(queued.direction):
+                self.latencies.append(now_ms - queued.timestamp_ms)
+                return queued
+        return None
+
+    def clear(self) -> None:
+        """Drop all queued directions"""
+        self._inputs.clear()
+
+    def latency_stats(self) -> Dict[str, float]:
+        """Get input-to-move latency statistics in milliseconds"""
+        latencies = self.latencies
+        if not latencies:
+            return {"moves": 0, "dropped": self.dropped}
+        return {
+            "moves": len(latencies),
+            "mean_ms": sum(latencies) / len(latencies),
+            "max_ms": max(latencies),
+            "dropped": self.dropped,
+        }
+
+    def __len__(self) -> int:
+        return len(self._inputs)
+
+
+def wait_for_events(
+    timeout_ms: int = IDLE_TIMEOUT_MS,
+) -> List[pygame.event.Event]:
+    """Block until an event arrives (or the timeout passes) and return
+    it together with any other pending events"""
+    event = pygame.event.wait(timeout_ms)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
@@ -1,9 +1,43 @@
 """
 Logging system for debugging and analytics
+
+Importing this module creates no files: entry points call
+logger.configure() to start logging to the console and to a size-rotated
+file in the log directory. Records are handed to a background thread
+through a queue, so the game thread never waits on disk or terminal
+writes.
+
+The log directory and level default to the SNAKE_LOG_DIR and
+SNAKE_LOG_LEVEL environment variables ("logs" and INFO). Calls on hot
+paths pass %-style arguments, formatted only if the record is written,
+and check is_enabled_for() first when the arguments themselves cost
+something to build.
 """
 
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, List, Optional, Union
+
+DEFAULT_LOG_DIR = "logs"
+LOG_FILE_NAME = "snake_game.log"
+
+# Rotate the log file at this size, keeping this many old files
+MAX_LOG_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+def _parse_level(level: Union[int, str]) -> int:
+    """Get a logging level from a number or a name such as "debug" """
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(level.upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return value
 
 
 class GameLogger:
@@ -12,57 +46,108 @@ class GameLogger:
     def __init__(self, name: str = "SnakeGame", level: int = logging.INFO):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
-
-        # Prevent duplicate handlers
-        if not self.logger.handlers:
-            self._setup_handlers()
-
-    def _setup_handlers(self) -> None:
-        """Setup file and console handlers"""
-
-        # Create logs directory if it doesn't exist
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        self._listener: Optional[QueueListener] = None
+        self._queue_handler: Optional[QueueHandler] = None
+        self.log_file: Optional[Path] = None
+
+    def configure(
+        self,
+        log_dir: Union[str, Path, None] = None,
+        level: Union[int, str, None] = None,
+        max_bytes: int = MAX_LOG_BYTES,
+        backup_count: int = LOG_BACKUP_COUNT,
+    ) -> None:
+        """Start writing log records in the background.
+
+        Records go to the console (INFO and above) and to a rotating
+        snake_game.log in ``log_dir``. Calling it again replaces the
+        previous setup.
+        """
+        if log_dir is None:
+            log_dir = os.environ.get("SNAKE_LOG_DIR", DEFAULT_LOG_DIR)
+        if level is None:
+            level = os.environ.get("SNAKE_LOG_LEVEL", "INFO")
+        self.logger.setLevel(_parse_level(level))
+        self.shutdown()
 
         # Formatter
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
-        # File handler
-        file_handler = logging.FileHandler(log_dir / "snake_game.log")
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
+        handlers: List[logging.Handler] = [console_handler]
 
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-
-    def debug(self, message: str) -> None:
+        # File handler
+        log_dir = Path(log_dir)
+        error: Optional[OSError] = None
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            file_handler = RotatingFileHandler(
+                log_dir / LOG_FILE_NAME,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding="utf-8",
+            )
+        except OSError as e:
+            error = e
+        else:
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+            self.log_file = log_dir / LOG_FILE_NAME
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(log_queue)
+        self._listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self.logger.addHandler(self._queue_handler)
+        self._listener.start()
+
+        if error is not None:
+            self.warning("Logging to the console only: %s", error)
+
+    def shutdown(self) -> None:
+        """Write out queued records and stop the background thread"""
+        if self._queue_handler is not None:
+            self.logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+        self.log_file = None
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check a record of this level would be logged"""
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args: Any) -> None:
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """Log critical message"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
 
 
 # Global logger instance
 logger = GameLogger()
+# Registered before the modules that log while exiting, so it runs after
+atexit.register(logger.shutdown)
@@ -1,14 +1,106 @@
 """Main entry point for the Snake Game package"""
 
+import argparse
 import sys
 import pygame
-from .game import SnakeGame
+from .config import CONFIG
+from .frame_timer import FRAME_TIMER, after_next_present
+from .game import DEFAULT_REPLAY_DIR, SnakeGame
+from .logger import logger
+from .replay import MAX_SEED
+from .telemetry import TELEMETRY
+
+# Printed by --quit-after-first-frame for the start-up benchmark
+FIRST_FRAME_MARKER = "FIRST_FRAME"
+
+
+def _quit_after_first_frame() -> None:
+    """Report that the first frame is on screen and exit"""
+    print(FIRST_FRAME_MARKER, flush=True)
+    raise SystemExit(0)
+
+
+def parse_seed(text: str) -> int:
+    """Parse a --seed value that fits a replay's seed field"""
+    seed = int(text)
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(
+            f"seed must be between 0 and {MAX_SEED}"
+        )
+    return seed
 
 
 def main():
     """Main entry point for the Snake game"""
+    parser = argparse.ArgumentParser(prog="snake-game")
+    parser.add_argument(
+        "--seed",
+        type=parse_seed,
+        default=None,
+        help="play every game with this seed (default: random per game)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="frame_times.json",
+        default=None,
+        metavar="PATH",
+        help="time frame phases and write them to PATH (.json or .csv) "
+        "on exit (default: frame_times.json)",
+    )
+    parser.add_argument(
+        "--telemetry",
+        nargs="?",
+        const="telemetry.jsonl",
+        default=None,
+        metavar="PATH",
+        help="append per-game events to PATH as JSON Lines "
+        "(default: telemetry.jsonl)",
+    )
+    parser.add_argument(
+        "--replay-dir",
+        nargs="?",
+        const=str(DEFAULT_REPLAY_DIR),
+        default=None,
+        metavar="DIR",
+        help="save a replay of every finished game to DIR "
+        f"(default: {DEFAULT_REPLAY_DIR})",
+    )
+    parser.add_argument(
+        "--log-dir",
+        default=None,
+        metavar="DIR",
+        help="write snake_game.log to DIR (default: $SNAKE_LOG_DIR or logs)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default=None,
+        metavar="LEVEL",
+        help="lowest level to log, e.g. DEBUG or WARNING "
+        "(default: $SNAKE_LOG_LEVEL or INFO)",
+    )
+    parser.add_argument(
+        "--quit-after-first-frame",
+        action="store_true",
+        help="print FIRST_FRAME and exit once the first frame is shown "
+        "(used to benchmark start-up time)",
+    )
+    args = parser.parse_args()
+
+    try:
+        logger.configure(args.log_dir, args.log_level)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.profile is not None:
+        FRAME_TIMER.enable(args.profile)
+    if args.telemetry is not None:
+        TELEMETRY.enable(args.telemetry)
+    if args.quit_after_first_frame:
+        after_next_present(_quit_after_first_frame)
+    CONFIG.ensure_loaded()
+
     try:
-        game = SnakeGame()
+        game = SnakeGame(args.seed, args.replay_dir)
         game.run()
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Thanks for playing!")
@@ -4,10 +4,19 @@ Menu system for Snake Game
 
 import pygame
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional
-from .config import CONFIG, COLORS
-from .high_score import HighScoreManager
+from .config import CONFIG, CONFIG_WATCHER, COLORS
+from .frame_timer import (
+    FRAME_TIMER,
+    PHASE_EVENTS,
+    PHASE_UPDATE,
+    present,
+)
+from .high_score import HighScoreManager, ScoreEntry
+from .input_handler import wait_for_events
 from .logger import logger
+from .text_cache import render_text
 
 
 class MenuState(Enum):
@@ -25,9 +34,6 @@ class BaseMenu:
 
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
-        self.font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 32)
-        self.title_font = pygame.font.Font(None, 72)
         self.selected_item = 0
         self.menu_items: List[str] = []
 
@@ -37,6 +43,23 @@ class BaseMenu:
         self.title_color = COLORS.GREEN
         self.background_color = COLORS.BLACK
 
+    # Fonts are loaded when a menu is first drawn
+
+    @cached_property
+    def font(self) -> pygame.font.Font:
+        """Font for menu items"""
+        return pygame.font.Font(None, 48)
+
+    @cached_property
+    def small_font(self) -> pygame.font.Font:
+        """Font for hints and table rows"""
+        return pygame.font.Font(None, 32)
+
+    @cached_property
+    def title_font(self) -> pygame.font.Font:
+        """Font for menu titles"""
+        return pygame.font.Font(None, 72)
+
     def handle_input(self, event: pygame.event.Event) -> Optional[str]:
         """Handle menu input events"""
         if event.type == pygame.KEYDOWN:
@@ -44,12 +67,12 @@ class BaseMenu:
                 self.selected_item = (self.selected_item - 1) % len(
                     self.menu_items
                 )
-                logger.debug(f"Menu selection: {self.selected_item}")
+                logger.debug("Menu selection: %s", self.selected_item)
             elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
                 self.selected_item = (self.selected_item + 1) % len(
                     self.menu_items
                 )
-                logger.debug(f"Menu selection: {self.selected_item}")
+                logger.debug("Menu selection: %s", self.selected_item)
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 return self._handle_selection()
             elif event.key == pygame.K_ESCAPE:
@@ -66,7 +89,7 @@ class BaseMenu:
 
     def draw_title(self, title: str, y_offset: int = 50) -> None:
         """Draw menu title"""
-        title_surface = self.title_font.render(title, True, self.title_color)
+        title_surface = render_text(self.title_font, title, self.title_color)
         title_rect = title_surface.get_rect(
             center=(CONFIG.WINDOW_WIDTH // 2, y_offset)
         )
@@ -80,7 +103,7 @@ class BaseMenu:
                 if i == self.selected_item
                 else self.normal_color
             )
-            item_surface = self.font.render(item, True, color)
+            item_surface = render_text(self.font, item, color)
             item_rect = item_surface.get_rect(
                 center=(CONFIG.WINDOW_WIDTH // 2, start_y + i * spacing)
             )
@@ -138,8 +161,8 @@ class MainMenu(BaseMenu):
 
         # Draw instructions
         instruction_text = "Use ARROW KEYS or WASD to navigate, ENTER to select"
-        instruction_surface = self.small_font.render(
-            instruction_text, True, COLORS.GRAY
+        instruction_surface = render_text(
+            self.small_font, instruction_text, COLORS.GRAY
         )
         instruction_rect = instruction_surface.get_rect(
             center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT - 30)
@@ -154,6 +177,10 @@ class SettingsMenu(BaseMenu):
         super().__init__(screen)
         self._update_menu_items()
 
+    def refresh(self) -> None:
+        """Show settings that were changed outside the menu"""
+        self._update_menu_items()
+
     def _update_menu_items(self) -> None:
         """Update menu items with current settings"""
         self.menu_items = [
@@ -192,7 +219,7 @@ class SettingsMenu(BaseMenu):
         self._update_menu_items()
         # Save configuration
         CONFIG.save_to_file()
-        logger.info(f"Wall collision set to: {CONFIG.WALL_COLLISION}")
+        logger.info("Wall collision set to: %s", CONFIG.WALL_COLLISION)
 
     def _adjust_speed(self) -> None:
         """Cycle through different speed options"""
@@ -200,7 +227,7 @@ class SettingsMenu(BaseMenu):
         self._update_menu_items()
         # Save configuration
         CONFIG.save_to_file()
-        logger.info(f"Game speed set to: {new_fps}")
+        logger.info("Game speed set to: %d", new_fps)
 
     def draw(self) -> None:
         """Draw settings menu"""
@@ -217,8 +244,8 @@ class SettingsMenu(BaseMenu):
         ]
 
         if self.selected_item < len(descriptions):
-            desc_surface = self.small_font.render(
-                descriptions[self.selected_item], True, COLORS.GRAY
+            desc_surface = render_text(
+                self.small_font, descriptions[self.selected_item], COLORS.GRAY
             )
             desc_rect = desc_surface.get_rect(
                 center=(CONFIG.WINDOW_WIDTH // 2, 420)
@@ -234,6 +261,19 @@ class HighScoreMenu(BaseMenu):
         self.high_score_manager = HighScoreManager()
         self.menu_items = ["Back to Main Menu"]
 
+        # Top scores shown, re-read only when the scores change
+        self._top_scores: Optional[List[ScoreEntry]] = None
+        self.high_score_manager.add_listener(self._on_scores_changed)
+
+    def _on_scores_changed(self) -> None:
+        """Drop the cached score list when new scores land"""
+        self._top_scores = None
+
+    def refresh(self) -> bool:
+        """Pick up scores saved by other game processes"""
+        self.high_score_manager.refresh()
+        return self._top_scores is None
+
     def _handle_selection(self) -> str:
         """Handle high score menu selection"""
         if self.selected_item == 0:  # Back to main menu
@@ -250,13 +290,15 @@ class HighScoreMenu(BaseMenu):
         self.draw_title("HIGH SCORES", 50)
 
         # Get top scores
-        top_scores = self.high_score_manager.get_top_scores(10)
+        if self._top_scores is None:
+            self._top_scores = self.high_score_manager.get_top_scores(10)
+        top_scores = self._top_scores
 
         if not top_scores:
             # No scores yet
             no_scores_text = "No high scores yet!"
-            no_scores_surface = self.font.render(
-                no_scores_text, True, COLORS.GRAY
+            no_scores_surface = render_text(
+                self.font, no_scores_text, COLORS.GRAY
             )
             no_scores_rect = no_scores_surface.get_rect(
                 center=(CONFIG.WINDOW_WIDTH // 2, 200)
@@ -280,7 +322,7 @@ class HighScoreMenu(BaseMenu):
                 else:
                     color = COLORS.WHITE
 
-                score_surface = self.small_font.render(score_text, True, color)
+                score_surface = render_text(self.small_font, score_text, color)
                 score_rect = score_surface.get_rect(
                     center=(CONFIG.WINDOW_WIDTH // 2, start_y + i * 25)
                 )
@@ -295,7 +337,6 @@ class MenuManager:
 
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
-        self.clock = pygame.time.Clock()
 
         # Initialize menus
         self.main_menu = MainMenu(screen)
@@ -305,9 +346,17 @@ class MenuManager:
         # Current state
         self.current_state = MenuState.MAIN_MENU
         self.running = True
+        self.needs_redraw = True
 
         logger.info("Menu manager initialized")
 
+    def set_screen(self, screen: pygame.Surface) -> None:
+        """Draw to a new display surface (after the window was resized)"""
+        self.screen = screen
+        for menu in (self.main_menu, self.settings_menu, self.high_score_menu):
+            menu.screen = screen
+        self.needs_redraw = True
+
     def get_current_menu(self) -> BaseMenu:
         """Get the current active menu"""
         if self.current_state == MenuState.MAIN_MENU:
@@ -320,8 +369,12 @@ class MenuManager:
             return self.main_menu
 
     def handle_events(self) -> Optional[str]:
-        """Handle menu events"""
-        for event in pygame.event.get():
+        """Wait for menu events and handle them"""
+        for event in wait_for_events():
+            # Menus are static, so only input changes what they show
+            self.needs_redraw = True
+            if FRAME_TIMER.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 self.running = False
                 return MenuState.QUIT.value
@@ -340,10 +393,10 @@ class MenuManager:
                     try:
                         self.current_state = MenuState(result)
                         logger.debug(
-                            f"Menu state changed to: {self.current_state}"
+                            "Menu state changed to: %s", self.current_state
                         )
                     except ValueError:
-                        logger.warning(f"Invalid menu state: {result}")
+                        logger.warning("Invalid menu state: %s", result)
 
         return None
 
@@ -355,27 +408,50 @@ class MenuManager:
         """Draw current menu"""
         current_menu = self.get_current_menu()
         current_menu.draw()
-        pygame.display.flip()
+        FRAME_TIMER.draw_overlay(self.screen, (20, 20))
+        present()
+        self.needs_redraw = False
 
     def run(self) -> str:
         """Run the menu system and return next state"""
         logger.info("Starting menu system")
 
+        # Returning from a game leaves its frame on screen
+        self.needs_redraw = True
         while self.running:
+            FRAME_TIMER.begin_frame()
+            if CONFIG_WATCHER.poll():
+                # config.json was edited; menus lay out from CONFIG
+                self.settings_menu.refresh()
+                self.needs_redraw = True
+            # Idle waits time out twice a second, which is also how often
+            # the score file is checked for other processes' games
+            if (
+                self.current_state == MenuState.HIGH_SCORES
+                and self.high_score_menu.refresh()
+            ):
+                self.needs_redraw = True
+            if self.needs_redraw:
+                self.update()
+                FRAME_TIMER.mark(PHASE_UPDATE)
+                self.draw()
+
+            # Blocks until there is input, so an idle menu uses no CPU
             result = self.handle_events()
+            FRAME_TIMER.mark(PHASE_EVENTS)
+            FRAME_TIMER.end_frame()
             if result:
                 return result
 
-            self.update()
-            self.draw()
-            self.clock.tick(60)  # 60 FPS for smooth menu navigation
-
         return MenuState.QUIT.value
 
 
 def main():
     """Main function for testing menus standalone"""
-    pygame.init()
+    CONFIG.ensure_loaded()
+    logger.configure()
+    pygame.display.init()
+    pygame.font.init()
     screen = pygame.display.set_mode(
         (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
     )
@@ -385,7 +461,7 @@ def main():
     result = menu_manager.run()
 
     pygame.quit()
-    logger.info(f"Menu system exited with state: {result}")
+    logger.info("Menu system exited with state: %s", result)
 
 
 if __name__ == "__main__":
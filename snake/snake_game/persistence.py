@@ -0,0 +1,194 @@
+"""
+Write-behind persistence for Snake Game
+
+Saving settings or a score used to block the frame that triggered it.
+WriteBehind hands file writes to a background thread instead:
+
+- writes to the same file are coalesced while they wait, so a burst of
+  settings changes costs one write, and queued appends go out together
+- whole-file writes go to a temporary file that is then renamed over the
+  target, so a crash never leaves a truncated file behind
+- pending writes are flushed when the process exits
+
+Code that reads a file it may have just written calls flush(path) first,
+or checks pending(path) and tries again later where it must not block.
+"""
+
+import atexit
+import os
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Union
+from .logger import logger
+
+PathLike = Union[str, Path]
+Data = Union[str, bytes]
+
+# Read once: os.umask() can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class _Write(NamedTuple):
+    """A pending write: replace the file or append to it"""
+
+    data: Data
+    append: bool
+
+
+def _file_mode(path: Path) -> int:
+    """Get a file's permissions, or those open() would give a new file"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write(path: PathLike, data: Data) -> None:
+    """Replace a file's contents via a temporary file and a rename"""
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp() creates the file owner-only, and the rename keeps that
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _append(path: Path, data: Data) -> None:
+    """Append to a file, creating it if needed"""
+    with open(path, "ab") as f:
+        f.write(data.encode("utf-8") if isinstance(data, str) else data)
+
+
+class WriteBehind:
+    """Background file writer with per-file coalescing"""
+
+    def __init__(self, delay: float = 0.05):
+        # How long a write waits for more writes to the same file
+        self.delay = delay
+        self._pending: "OrderedDict[Path, List[_Write]]" = OrderedDict()
+        self._active: Optional[Path] = None
+        self._urgent = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, path: PathLike, data: Data) -> None:
+        """Queue an atomic replacement of a file's contents"""
+        # Replaces anything still queued for the file
+        self._submit(Path(path), _Write(data, False), replace=True)
+
+    def append(self, path: PathLike, data: Data) -> None:
+        """Queue data to be appended to a file"""
+        self._submit(Path(path), _Write(data, True), replace=False)
+
+    def _submit(self, path: Path, write: _Write, replace: bool) -> None:
+        """Add a write to the queue, merging it with queued ones"""
+        with self._condition:
+            if self._closed:
+                # Shutting down: nothing would pick the write up
+                self._run(path, [write])
+                return
+
+            writes = self._pending.setdefault(path, [])
+            if replace:
+                writes.clear()
+                writes.append(write)
+            elif writes and type(writes[-1].data) is type(write.data):
+                last = writes[-1]
+                writes[-1] = _Write(last.data + write.data, last.append)
+            else:
+                writes.append(write)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="snake-write-behind", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _worker(self) -> None:
+        """Write queued files until closed"""
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._pending and not self._closed:
+                    condition.wait()
+                if not self._pending:
+                    return
+                if not (self._urgent or self._closed):
+                    # Let a burst of writes to the same file pile up
+                    condition.wait(self.delay)
+                path, writes = self._pending.popitem(last=False)
+                self._active = path
+
+            self._run(path, writes)
+
+            with condition:
+                self._active = None
+                if not self._pending:
+                    self._urgent = False
+                condition.notify_all()
+
+    def _run(self, path: Path, writes: List[_Write]) -> None:
+        """Perform a file's queued writes in order"""
+        for write in writes:
+            try:
+                if write.append:
+                    _append(path, write.data)
+                else:
+                    atomic_write(path, write.data)
+            except OSError as e:
+                logger.error("Could not write %s: %s", path, e)
+
+    def _busy(self, path: Optional[Path]) -> bool:
+        """Check writes (to a file, or any) are queued or running"""
+        if path is None:
+            return bool(self._pending) or self._active is not None
+        return path in self._pending or self._active == path
+
+    def pending(self, path: Optional[PathLike] = None) -> bool:
+        """Check writes (to one file, or any) are not on disk yet"""
+        with self._condition:
+            return self._busy(Path(path) if path is not None else None)
+
+    def flush(self, path: Optional[PathLike] = None) -> None:
+        """Wait until queued writes (to one file, or all) are on disk"""
+        target = Path(path) if path is not None else None
+        with self._condition:
+            if not self._busy(target):
+                return
+            self._urgent = True
+            self._condition.notify_all()
+            while self._busy(target):
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Flush all writes and stop the worker"""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+
+# Shared by the config and score storage
+PERSISTENCE = WriteBehind()
+atexit.register(PERSISTENCE.close)
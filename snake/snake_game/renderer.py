@@ -0,0 +1,277 @@
+"""
+Incremental dirty-rectangle renderer for Snake Game
+
+Between two ticks only a handful of cells change: the new head, the old
+head (now a body segment), the vacated tail cell and the food. Instead of
+clearing the screen and redrawing every segment, DirtyRectRenderer keeps
+the previous frame on the display surface as a persistent background,
+repaints just those cells and the HUD when it changes, and pushes them
+with pygame.display.update(rects). Frame cost no longer depends on the
+snake length.
+
+With a fixed-timestep game loop the display refreshes several times per
+tick; draw_motion() then slides the head and tail tiles between their
+previous and current cells so motion looks smooth.
+"""
+
+from typing import Callable, Hashable, List, Optional, Set, Tuple
+import pygame
+from .config import CONFIG, COLORS
+from .game_objects import (
+    Food,
+    Position,
+    Snake,
+    cell_rect,
+    current_position_table,
+)
+from .frame_timer import present
+from .sprites import TILE_CACHE
+
+HudDrawer = Callable[[], List[pygame.Rect]]
+
+# (is head, start cell, end cell) of a tile sliding between two cells
+Slide = Tuple[bool, Position, Position]
+
+
+def _adjacent(a: Position, b: Position) -> bool:
+    """Check two cells are neighbours (not a wrap-around jump)"""
+    return abs(a.x - b.x) + abs(a.y - b.y) == 1
+
+
+def _slides(snake: Snake) -> List[Slide]:
+    """Get the head and tail tiles that moved on the last tick"""
+    body = snake.body
+    slides: List[Slide] = []
+    tail = snake.vacated_tail
+    if tail is not None and len(body) > 1 and _adjacent(tail, body.tail):
+        slides.append((False, tail, body.tail))
+    head = snake.previous_head
+    if head is not None and _adjacent(head, body.head):
+        slides.append((True, head, body.head))
+    return slides
+
+
+def _restore_cell(
+    screen: pygame.Surface, position: Position, snake: Snake, food: Food
+) -> None:
+    """Repaint a cell with its current (non-interpolated) contents"""
+    body = snake.body
+    screen.fill(COLORS.BLACK, cell_rect(position))
+    if body.occupancy(position):
+        snake.draw_segment(screen, position, position == body.head)
+    elif position == food.position:
+        food.draw(screen)
+
+
+def draw_motion(
+    screen: pygame.Surface,
+    snake: Snake,
+    food: Food,
+    alpha: float,
+    avoid: Optional[pygame.Rect] = None,
+) -> Set[Position]:
+    """Draw the head and tail part-way between their last two cells.
+
+    ``alpha`` is the fraction of the current tick that has elapsed; at 1
+    the snake is drawn where it is. Nothing is drawn if a touched cell
+    overlaps ``avoid`` (the HUD), which would otherwise be painted over.
+    Returns the cells that were repainted.
+    """
+    if alpha >= 1.0:
+        return set()
+    slides = _slides(snake)
+    if not slides:
+        return set()
+
+    cells = {cell for _, start, end in slides for cell in (start, end)}
+    if (
+        avoid is not None
+        and avoid.collidelist([cell_rect(cell) for cell in cells]) >= 0
+    ):
+        return set()
+
+    for cell in cells:
+        _restore_cell(screen, cell, snake, food)
+    # The head has not arrived in its new cell yet
+    head = snake.body.head
+    if any(is_head for is_head, _, _ in slides):
+        screen.fill(COLORS.BLACK, cell_rect(head))
+
+    tiles = TILE_CACHE.get()
+    grid_size = CONFIG.GRID_SIZE
+    for is_head, start, end in slides:
+        x = start.x + (end.x - start.x) * alpha
+        y = start.y + (end.y - start.y) * alpha
+        screen.blit(
+            tiles.head if is_head else tiles.body,
+            (round(x * grid_size), round(y * grid_size)),
+        )
+    return cells
+
+
+class DirtyRectRenderer:
+    """Repaints only the cells and HUD regions that changed.
+
+    Anything that cannot be expressed as at most one move since the last
+    frame (a new game, a state change, several ticks between frames) falls
+    back to a full redraw; call invalidate() to force one.
+    """
+
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next frame"""
+        self._valid = False
+        self._head: Optional[Position] = None
+        self._tail: Optional[Position] = None
+        self._length = 0
+        self._food: Optional[Position] = None
+        self._hud_key: Hashable = None
+        self._hud_rect: Optional[pygame.Rect] = None
+        self._motion_cells: Set[Position] = set()
+
+    def _can_patch(self, snake: Snake) -> bool:
+        """Check the snake moved at most one cell since the last frame"""
+        if not self._valid:
+            return False
+
+        body = snake.body
+        length = len(body)
+        if body.head == self._head:
+            return length == self._length
+        if length == self._length + 1:
+            # Grew: the old tail stays in place
+            return body[1] == self._head
+        if length == self._length:
+            return length == 1 or body[1] == self._head
+        return False
+
+    def draw(
+        self,
+        snake: Snake,
+        food: Food,
+        hud_key: Hashable,
+        draw_hud: HudDrawer,
+        alpha: float = 1.0,
+    ) -> List[pygame.Rect]:
+        """Draw a frame and return the rectangles pushed to the display.
+
+        ``hud_key`` identifies the HUD contents (e.g. score and length);
+        ``draw_hud`` draws the HUD and returns the rectangles it covers.
+        ``alpha`` is the elapsed fraction of the current tick, used to
+        interpolate the head and tail (see draw_motion()).
+        """
+        if self._can_patch(snake):
+            dirty = self._draw_changes(snake, food, hud_key, draw_hud)
+            full = False
+        else:
+            dirty = [self._draw_full(snake, food, draw_hud)]
+            full = True
+
+        self._motion_cells = draw_motion(
+            self.screen, snake, food, alpha, self._hud_rect
+        )
+        if full:
+            present()
+        else:
+            dirty.extend(
+                pygame.Rect(cell_rect(cell)) for cell in self._motion_cells
+            )
+            present(dirty)
+
+        body = snake.body
+        self._valid = True
+        self._head = body.head
+        self._tail = body.tail
+        self._length = len(body)
+        self._food = food.position
+        self._hud_key = hud_key
+        return dirty
+
+    def _draw_full(
+        self, snake: Snake, food: Food, draw_hud: HudDrawer
+    ) -> pygame.Rect:
+        """Redraw the whole screen"""
+        self.screen.fill(COLORS.BLACK)
+        snake.draw(self.screen)
+        food.draw(self.screen)
+        self._hud_rect = union_rects(draw_hud())
+        return self.screen.get_rect()
+
+    def _draw_changes(
+        self, snake: Snake, food: Food, hud_key: Hashable, draw_hud: HudDrawer
+    ) -> List[pygame.Rect]:
+        """Repaint the cells that changed since the last frame"""
+        screen = self.screen
+        body = snake.body
+        head = body.head
+        dirty: List[pygame.Rect] = []
+
+        # Undo the previous frame's interpolated tiles
+        for cell in self._motion_cells:
+            _restore_cell(screen, cell, snake, food)
+            dirty.append(pygame.Rect(cell_rect(cell)))
+
+        if head != self._head:
+            # Vacated tail cell (unless the snake grew or the head took it)
+            if self._tail is not None and not body.occupancy(self._tail):
+                dirty.append(self._erase(self._tail))
+            # The old head is now a body segment
+            if self._head is not None and body.occupancy(self._head):
+                snake.draw_segment(screen, self._head, False)
+                dirty.append(pygame.Rect(cell_rect(self._head)))
+            snake.draw_segment(screen, head, True)
+            dirty.append(pygame.Rect(cell_rect(head)))
+
+        if food.position != self._food:
+            if self._food is not None and not body.occupancy(self._food):
+                dirty.append(self._erase(self._food))
+            food.draw(screen)
+            dirty.append(pygame.Rect(cell_rect(food.position)))
+
+        hud_rect = self._hud_rect
+        if hud_key != self._hud_key or (
+            hud_rect is not None and hud_rect.collidelist(dirty) >= 0
+        ):
+            if hud_rect is not None:
+                screen.fill(COLORS.BLACK, hud_rect)
+                self._redraw_cells(hud_rect, snake, food)
+                dirty.append(hud_rect)
+            self._hud_rect = union_rects(draw_hud())
+            if self._hud_rect is not None:
+                dirty.append(self._hud_rect)
+
+        return dirty
+
+    def _erase(self, position: Position) -> pygame.Rect:
+        """Paint a cell with the background"""
+        rect = pygame.Rect(cell_rect(position))
+        self.screen.fill(COLORS.BLACK, rect)
+        return rect
+
+    def _redraw_cells(
+        self, rect: pygame.Rect, snake: Snake, food: Food
+    ) -> None:
+        """Redraw the snake and food cells under a screen region"""
+        grid_size = CONFIG.GRID_SIZE
+        table = current_position_table()
+        body = snake.body
+        head = body.head
+        x_end = min((rect.right - 1) // grid_size, CONFIG.grid_width - 1)
+        y_end = min((rect.bottom - 1) // grid_size, CONFIG.grid_height - 1)
+        for y in range(max(0, rect.top // grid_size), y_end + 1):
+            for x in range(max(0, rect.left // grid_size), x_end + 1):
+                position = table.get(x, y)
+                if body.occupancy(position):
+                    snake.draw_segment(self.screen, position, position == head)
+                elif position == food.position:
+                    food.draw(self.screen)
+
+
+def union_rects(rects: List[pygame.Rect]) -> Optional[pygame.Rect]:
+    """Get the bounding rectangle of a list of rectangles"""
+    if not rects:
+        return None
+    return rects[0].unionall(rects[1:])
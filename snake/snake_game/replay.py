@@ -0,0 +1,343 @@
+"""
+Replay recording and playback for Snake Game
+
+SnakeSimulator is deterministic for a given seed, so a game is fully
+described by its seed, the rule settings and the ticks at which the
+snake changed direction. Replays store only that and re-simulate the game
+on playback, either headless at full speed or rendered at CONFIG.FPS.
+
+Binary layout (little-endian):
+    header   magic "SNKR", version (u8), flags (u8), grid width (u16),
+             grid height (u16), initial length (u16), points per food
+             (u32), seed (i64), ticks (u32), score (u32), changes (u32)
+    changes  one unsigned LEB128 varint per direction change holding
+             (ticks since the previous change << 2) | direction index
+"""
+
+import argparse
+import struct
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+from .config import CONFIG
+from .game_objects import Direction
+from .simulation import SnakeSimulator
+
+MAGIC = b"SNKR"
+VERSION = 1
+# Largest seed the i64 header field holds (game seeds are never negative)
+MAX_SEED = 2**63 - 1
+
+_HEADER = struct.Struct("<4sBBHHHIqIII")
+_FLAG_WALL_COLLISION = 0x01
+_DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+_DIRECTION_CODES = {direction: i for i, direction in enumerate(_DIRECTIONS)}
+
+
+class ReplayError(ValueError):
+    """Raised for malformed or unsupported replay data"""
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint to out"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint, returning (value, next offset)"""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("Truncated replay data")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+@dataclass
+class Replay:
+    """A recorded game: seed, rule settings and direction changes"""
+
+    seed: int
+    grid_width: int
+    grid_height: int
+    wall_collision: bool
+    points_per_food: int
+    initial_length: int
+    changes: List[Tuple[int, Direction]] = field(default_factory=list)
+    ticks: int = 0
+    score: int = 0
+
+    @classmethod
+    def from_config(cls, seed: int) -> "Replay":
+        """Create an empty replay for the current CONFIG rules"""
+        return cls(
+            seed=seed,
+            grid_width=CONFIG.grid_width,
+            grid_height=CONFIG.grid_height,
+            wall_collision=CONFIG.WALL_COLLISION,
+            points_per_food=CONFIG.POINTS_PER_FOOD,
+            initial_length=CONFIG.INITIAL_SNAKE_LENGTH,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Encode the replay in the compact binary format"""
+        flags = _FLAG_WALL_COLLISION if self.wall_collision else 0
+        try:
+            header = _HEADER.pack(
+                MAGIC,
+                VERSION,
+                flags,
+                self.grid_width,
+                self.grid_height,
+                self.initial_length,
+                self.points_per_food,
+                self.seed,
+                self.ticks,
+                self.score,
+                len(self.changes),
+            )
+        except struct.error as e:
+            raise ReplayError(f"Replay does not fit the binary format: {e}")
+
+        out = bytearray(header)
+        previous_tick = 0
+        for tick, direction in self.changes:
+            delta = tick - previous_tick
+            if delta < 0:
+                raise ReplayError("Direction changes must be in tick order")
+            _encode_varint(delta << 2 | _DIRECTION_CODES[direction], out)
+            previous_tick = tick
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """Decode a replay from the compact binary format"""
+        if len(data) < _HEADER.size:
+            raise ReplayError("Truncated replay header")
+
+        (
+            magic,
+            version,
+            flags,
+            grid_width,
+            grid_height,
+            initial_length,
+            points_per_food,
+            seed,
+            ticks,
+            score,
+            count,
+        ) = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("Not a Snake replay")
+        if version != VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+
+        changes: List[Tuple[int, Direction]] = []
+        offset = _HEADER.size
+        tick = 0
+        for _ in range(count):
+            value, offset = _decode_varint(data, offset)
+            tick += value >> 2
+            changes.append((tick, _DIRECTIONS[value & 0x03]))
+
+        return cls(
+            seed=seed,
+            grid_width=grid_width,
+            grid_height=grid_height,
+            wall_collision=bool(flags & _FLAG_WALL_COLLISION),
+            points_per_food=points_per_food,
+            initial_length=initial_length,
+            changes=changes,
+            ticks=ticks,
+            score=score,
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the replay to a file"""
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Replay":
+        """Read a replay from a file"""
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayRecorder:
+    """Records the direction changes of the current game"""
+
+    def __init__(self):
+        self.replay: Optional[Replay] = None
+
+    def start(self, seed: int) -> None:
+        """Start recording a new game with the given seed"""
+        self.replay = Replay.from_config(seed)
+
+    def record(self, tick: int, direction: Direction) -> None:
+        """Record a direction change applied on the given tick"""
+        if self.replay is not None:
+            self.replay.changes.append((tick, direction))
+
+    def finish(self, ticks: int, score: int) -> Optional[Replay]:
+        """Stop recording and return the finished replay"""
+        replay = self.replay
+        self.replay = None
+        if replay is not None:
+            replay.ticks = ticks
+            replay.score = score
+        return replay
+
+
+@contextmanager
+def replay_config(replay: Replay) -> Iterator[None]:
+    """Temporarily apply the replay's rule settings to CONFIG"""
+    settings = {
+        "WINDOW_WIDTH": replay.grid_width * CONFIG.GRID_SIZE,
+        "WINDOW_HEIGHT": replay.grid_height * CONFIG.GRID_SIZE,
+        "WALL_COLLISION": replay.wall_collision,
+        "POINTS_PER_FOOD": replay.points_per_food,
+        "INITIAL_SNAKE_LENGTH": replay.initial_length,
+    }
+    previous = {name: getattr(CONFIG, name) for name in settings}
+    try:
+        for name, value in settings.items():
+            CONFIG.update_setting(name, value)
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(CONFIG, name, value)
+
+
+class ReplayPlayer:
+    """Re-simulates a recorded game"""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+
+    def _actions(self) -> Iterator[Optional[Direction]]:
+        """Yield the action for each recorded tick"""
+        changes = self.replay.changes
+        index = 0
+        for tick in range(self.replay.ticks):
+            action = None
+            # Only the last change recorded for a tick takes effect
+            while index < len(changes) and changes[index][0] == tick:
+                action = changes[index][1]
+                index += 1
+            yield action
+
+    def play(self) -> SnakeSimulator:
+        """Re-simulate the game headless at full speed"""
+        with replay_config(self.replay):
+            sim = SnakeSimulator(self.replay.seed)
+            step = sim.step
+            for action in self._actions():
+                if sim.done:
+                    break
+                step(action)
+        return sim
+
+    def verify(self) -> bool:
+        """Check the re-simulated game ends with the recorded result"""
+        sim = self.play()
+        return sim.ticks == self.replay.ticks and sim.score == self.replay.score
+
+    def play_rendered(self, fps: Optional[int] = None) -> SnakeSimulator:
+        """Re-simulate the game in a window, one tick per frame"""
+        import pygame
+        from .config import COLORS
+        from .text_cache import render_text
+
+        with replay_config(self.replay):
+            pygame.display.init()
+            pygame.font.init()
+            try:
+                screen = pygame.display.set_mode(
+                    (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
+                )
+                pygame.display.set_caption(
+                    f"Snake Game - replay of seed {self.replay.seed}"
+                )
+                font = pygame.font.Font(None, 36)
+                clock = pygame.time.Clock()
+
+                sim = SnakeSimulator(self.replay.seed)
+                for action in self._actions():
+                    if sim.done or _quit_requested(pygame):
+                        break
+                    sim.step(action)
+
+                    screen.fill(COLORS.BLACK)
+                    sim.snake.draw(screen)
+                    sim.food.draw(screen)
+                    text = render_text(
+                        font, f"Score: {sim.score}", COLORS.WHITE
+                    )
+                    screen.blit(text, (10, 10))
+                    pygame.display.flip()
+                    clock.tick(fps or CONFIG.FPS)
+            finally:
+                pygame.quit()
+        return sim
+
+
+def _quit_requested(pygame) -> bool:
+    """Check for a window close or Escape key press"""
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            return True
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            return True
+    return False
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for playing back replays"""
+    parser = argparse.ArgumentParser(
+        prog="snake-replay",
+        description="Re-simulate recorded Snake games",
+    )
+    parser.add_argument("replays", nargs="+", help="replay files (.snkr)")
+    parser.add_argument(
+        "--render", action="store_true", help="show the game in a window"
+    )
+    parser.add_argument(
+        "--fps", type=int, default=None, help="render speed (default: FPS)"
+    )
+    args = parser.parse_args(argv)
+
+    CONFIG.ensure_loaded()
+    mismatches = 0
+    for path in args.replays:
+        try:
+            replay = Replay.load(path)
+        except (OSError, ReplayError) as e:
+            print(f"{path}: {e}")
+            mismatches += 1
+            continue
+
+        player = ReplayPlayer(replay)
+        sim = player.play_rendered(args.fps) if args.render else player.play()
+        matches = sim.ticks == replay.ticks and sim.score == replay.score
+        if not matches:
+            mismatches += 1
+        print(
+            f"{path}: seed {replay.seed}, score {sim.score} in {sim.ticks} "
+            f"ticks (recorded {replay.score} in {replay.ticks}) - "
+            f"{'OK' if matches else 'MISMATCH'}"
+        )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
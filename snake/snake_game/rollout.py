@@ -0,0 +1,304 @@
+"""
+Multiprocess rollout pool for Snake Game
+
+Runs many headless games (agent + seed + config overrides) across worker
+processes. Workers drive SnakeSimulator, the same rules SnakeGame.update()
+uses, and write a compact record per game into a shared-memory buffer, so
+results never have to be pickled back to the parent.
+
+Workers are started with the "spawn" method by default so they do not
+inherit pygame/SDL state from a parent that has already opened a window;
+the parent's CONFIG is passed to them explicitly instead.
+"""
+
+import argparse
+import ctypes
+import json
+import logging
+import multiprocessing
+import random
+import sys
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
+from .config import CONFIG
+from .game_objects import Direction, current_position_table
+from .logger import logger
+from .simulation import CAUSE_CODES, CAUSE_EVENTS, CAUSE_NONE, SnakeSimulator
+
+# Extra cause code for games stopped at their tick limit
+CAUSE_MAX_TICKS = len(CAUSE_EVENTS) + 1
+
+Agent = Callable[[SnakeSimulator, random.Random], Optional[Direction]]
+
+_DIRECTIONS = tuple(Direction)
+_OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
+
+def straight_agent(
+    sim: SnakeSimulator, rng: random.Random
+) -> Optional[Direction]:
+    """Never turn"""
+    return None
+
+
+def random_agent(sim: SnakeSimulator, rng: random.Random) -> Direction:
+    """Pick a random direction every tick"""
+    return rng.choice(_DIRECTIONS)
+
+
+def greedy_agent(
+    sim: SnakeSimulator, rng: random.Random
+) -> Optional[Direction]:
+    """Move towards the food, avoiding cells that kill the snake"""
+    snake = sim.snake
+    body = snake.body
+    head = body.head
+    table = current_position_table()
+    wrap = not CONFIG.WALL_COLLISION
+
+    best: Optional[Direction] = None
+    best_distance = 0.0
+    for direction in _DIRECTIONS:
+        if direction == _OPPOSITE[snake.direction]:
+            continue
+        target = table.step(head, direction, wrap)
+        if target.is_out_of_bounds():
+            continue
+        # The tail cell frees up on this move unless the snake grows
+        if body.occupancy(target) and not (
+            target == body.tail and not snake.grow_pending
+        ):
+            continue
+        distance = target.distance_to(sim.food.position)
+        if best is None or distance < best_distance:
+            best = direction
+            best_distance = distance
+    return best
+
+
+AGENTS: Dict[str, Agent] = {
+    "straight": straight_agent,
+    "random": random_agent,
+    "greedy": greedy_agent,
+}
+
+
+@dataclass
+class RolloutJob:
+    """One game to play: agent name, seed and config overrides"""
+
+    agent: str = "greedy"
+    seed: int = 0
+    config: Dict[str, Any] = field(default_factory=dict)
+    max_ticks: int = 100_000
+
+
+class RolloutResult(TypedDict):
+    """Result of a single rollout game"""
+
+    agent: str
+    seed: int
+    score: int
+    length: int
+    ticks: int
+    cause: str
+
+
+class GameRecord(ctypes.Structure):
+    """Shared-memory record written by workers for one game"""
+
+    _fields_ = [
+        ("score", ctypes.c_int64),
+        ("ticks", ctypes.c_int64),
+        ("length", ctypes.c_int32),
+        ("cause", ctypes.c_int8),
+    ]
+
+
+def play_game(job: RolloutJob) -> SnakeSimulator:
+    """Play one game in this process and return the finished simulator"""
+    agent = AGENTS[job.agent]
+
+    previous = {name: getattr(CONFIG, name) for name in job.config}
+    try:
+        for name, value in job.config.items():
+            CONFIG.update_setting(name, value)
+
+        # Keep the agent's stream separate from the game's own RNG
+        rng = random.Random(f"{job.seed}:agent")
+
+        sim = SnakeSimulator(job.seed)
+        step = sim.step
+        while not sim.done and sim.ticks < job.max_ticks:
+            step(agent(sim, rng))
+        return sim
+    finally:
+        for name, value in previous.items():
+            setattr(CONFIG, name, value)
+
+
+def _cause_code(sim: SnakeSimulator) -> int:
+    """Get the compact cause code of a finished game"""
+    if sim.death_cause is not None:
+        return CAUSE_CODES[sim.death_cause]
+    return CAUSE_MAX_TICKS
+
+
+def _cause_name(code: int) -> str:
+    """Get a readable cause name for a cause code"""
+    if code == CAUSE_MAX_TICKS:
+        return "max_ticks"
+    if code == CAUSE_NONE:
+        return "none"
+    return CAUSE_EVENTS[code].value
+
+
+# Shared result buffer, set in each worker by _init_worker
+_records: Any = None
+
+
+def _init_worker(records: Any, settings: Dict[str, Any]) -> None:
+    """Attach the shared result buffer and copy the parent's config"""
+    global _records
+    _records = records
+    for name, value in settings.items():
+        CONFIG.update_setting(name, value)
+
+    # Per-game info logs would flood the console
+    logger.logger.setLevel(logging.WARNING)
+
+
+def _run_shard(shard: Tuple[int, List[RolloutJob]]) -> Tuple[int, int]:
+    """Play a contiguous shard of jobs, writing into the shared buffer"""
+    start, jobs = shard
+    for offset, job in enumerate(jobs):
+        sim = play_game(job)
+        record = _records[start + offset]
+        record.score = sim.score
+        record.ticks = sim.ticks
+        record.length = sim.length
+        record.cause = _cause_code(sim)
+    return start, start + len(jobs)
+
+
+class RolloutPool:
+    """Shards rollout jobs over a pool of worker processes"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.shard_size = shard_size
+        self.context = multiprocessing.get_context(start_method)
+
+    def _make_shards(
+        self, jobs: Sequence[RolloutJob]
+    ) -> List[Tuple[int, List[RolloutJob]]]:
+        """Split jobs into contiguous shards, a few per worker"""
+        shard_size = self.shard_size or max(1, len(jobs) // (self.workers * 4))
+        return [
+            (start, list(jobs[start : start + shard_size]))
+            for start in range(0, len(jobs), shard_size)
+        ]
+
+    def iter_results(
+        self, jobs: Sequence[RolloutJob]
+    ) -> Iterator[Tuple[int, RolloutResult]]:
+        """Run jobs and yield (job index, result) as shards complete"""
+        if not jobs:
+            return
+
+        records = self.context.RawArray(GameRecord, len(jobs))
+        with self.context.Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(records, CONFIG.to_dict()),
+        ) as pool:
+            for start, end in pool.imap_unordered(
+                _run_shard, self._make_shards(jobs)
+            ):
+                for index in range(start, end):
+                    record = records[index]
+                    job = jobs[index]
+                    yield index, {
+                        "agent": job.agent,
+                        "seed": job.seed,
+                        "score": record.score,
+                        "length": record.length,
+                        "ticks": record.ticks,
+                        "cause": _cause_name(record.cause),
+                    }
+
+    def run(self, jobs: Sequence[RolloutJob]) -> List[RolloutResult]:
+        """Run jobs and return their results in job order"""
+        results: List[Optional[RolloutResult]] = [None] * len(jobs)
+        for index, result in self.iter_results(jobs):
+            results[index] = result
+        return [result for result in results if result is not None]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for running rollouts"""
+    parser = argparse.ArgumentParser(
+        prog="snake-rollout",
+        description="Run headless Snake games across all CPU cores",
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="greedy")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=100_000)
+    parser.add_argument("--wall-collision", choices=["on", "off"], default=None)
+    parser.add_argument(
+        "--output", default=None, help="write per-game results as JSONL"
+    )
+    args = parser.parse_args(argv)
+
+    CONFIG.ensure_loaded()
+    logger.configure()
+    config: Dict[str, Any] = {}
+    if args.wall_collision is not None:
+        config["WALL_COLLISION"] = args.wall_collision == "on"
+
+    jobs = [
+        RolloutJob(args.agent, args.seed + i, config, args.max_ticks)
+        for i in range(args.games)
+    ]
+    results = RolloutPool(args.workers).run(jobs)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+
+    if results:
+        scores = [r["score"] for r in results]
+        ticks = sum(r["ticks"] for r in results)
+        print(
+            f"{len(results)} games, {ticks} ticks, "
+            f"mean score {sum(scores) / len(scores):.1f}, "
+            f"best score {max(scores)}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""
+Score storage for Snake Game
+
+ScoreStore keeps every finished game in an append-only JSON Lines file:
+adding a score writes one line instead of rewriting the whole file, and
+no result is ever thrown away. On load the entries are indexed in memory
+by score and by player, so the top-K list, a player's best score and the
+rank of a score are answered without scanning the history.
+
+Records are written in the background by the shared write-behind worker;
+a line cut short by a crash is skipped on the next load.
+
+get_score_store() returns one shared store per file, so the game and the
+menus read the same in-memory scores. refresh() checks the log's
+modification time and size, reads only the records other processes
+appended since, and listeners are told whenever the scores change.
+"""
+
+import json
+import os
+import threading
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
+from .logger import logger
+from .persistence import PERSISTENCE
+
+
+class _BaseScoreEntry(TypedDict):
+    score: int
+    player: str
+    date: str
+    timestamp: float
+
+
+class ScoreEntry(_BaseScoreEntry, total=False):
+    """Represents a single score entry (older entries have no seed)"""
+
+    seed: int
+
+
+# (-score, insertion number): ascending order is best score first, with
+# ties in the order they were achieved
+_ScoreKey = Tuple[int, int]
+
+# Modification time (ns) and size of the log
+_Signature = Tuple[int, int]
+
+ScoreListener = Callable[[], None]
+
+
+def _is_entry(value: object) -> bool:
+    """Check a decoded value looks like a score entry"""
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("score"), int)
+        and isinstance(value.get("player"), str)
+    )
+
+
+class ScoreStore:
+    """Append-only log of all scores with in-memory indexes"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._listeners: List[ScoreListener] = []
+        self._load()
+
+    def _reset(self) -> None:
+        """Drop the in-memory indexes"""
+        self._entries: List[ScoreEntry] = []
+        self._by_score: List[_ScoreKey] = []
+        self._player_best: Dict[str, int] = {}
+        # The log does not end with a newline (an interrupted write)
+        self._unterminated = False
+        # What the log looked like when read, and the size it will have
+        # once this store's own queued writes are done
+        self._signature: Optional[_Signature] = None
+        self._expected_size = 0
+        # This store's appends since the log was last read
+        self._own_writes = bytearray()
+
+    def _load(self) -> None:
+        """Read and index the log"""
+        self._reset()
+        self.flush()
+        # Whether the log did not exist yet (e.g. to import old scores)
+        self.is_new = not self.path.exists()
+        if self.is_new:
+            return
+
+        entries = self._read(0)
+        if entries is None:
+            return
+        self._index_many(entries)
+        logger.info("Loaded %d scores", len(self._entries))
+
+    def _read(self, offset: int) -> Optional[List[ScoreEntry]]:
+        """Parse the log's records from ``offset`` to its end.
+
+        Advances the expected size and signature past what was read.
+        Returns None if the log could not be read.
+        """
+        entries: List[ScoreEntry] = []
+        skipped = 0
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                line = b""
+                for line in f:
+                    self._expected_size += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        entry = None
+                    if _is_entry(entry):
+                        entries.append(entry)
+                    elif line.strip():
+                        skipped += 1
+                self._signature = _signature(os.fstat(f.fileno()))
+            # Callers flush first, so the own writes were read as well
+            self._own_writes = bytearray()
+        except OSError as e:
+            logger.error("Failed to load scores: %s", e)
+            return None
+
+        if line:
+            self._unterminated = not line.endswith(b"\n")
+        if skipped:
+            logger.warning("Skipped %d damaged score records", skipped)
+        return entries
+
+    def refresh(self) -> bool:
+        """Pick up records another process wrote to the log.
+
+        Costs one stat() when nothing changed. A log that grew only has
+        its new lines read; one that shrank or vanished, or had records
+        appended in between this store's own, is reloaded.
+        Returns True if the scores changed.
+        """
+        self.flush()
+        try:
+            signature: Optional[_Signature] = _signature(os.stat(self.path))
+        except FileNotFoundError:
+            signature = None
+        # (A log that was written and has since vanished is a change)
+        if signature == self._signature and (signature or self.is_new):
+            return False
+
+        size = signature[1] if signature is not None else 0
+        if signature is not None and size == self._expected_size:
+            # Only this store's own writes landed since it was read
+            self._signature = signature
+            return False
+
+        if (
+            signature is not None
+            and size > self._expected_size
+            and self._appended_after_own_writes()
+        ):
+            # Records were appended: index just those
+            entries = self._read(self._expected_size)
+            if entries is None:
+                return False
+            self.is_new = False
+            self._index_many(entries)
+        else:
+            self._load()
+        self._notify()
+        return True
+
+    def _appended_after_own_writes(self) -> bool:
+        """Check new records start at the expected size.
+
+        If another process appended between this store's read and its own
+        writes, the expected size points into someone else's records.
+        """
+        own = bytes(self._own_writes)
+        offset = self._expected_size
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset - len(own))
+                if f.read(len(own)) != own:
+                    return False
+                if offset:
+                    f.seek(offset - 1)
+                    if f.read(1) != b"\n":
+                        return False
+                line = f.readline()
+        except OSError:
+            return False
+        try:
+            return _is_entry(json.loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return False
+
+    def add_listener(self, listener: ScoreListener) -> None:
+        """Call a function whenever the scores change"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ScoreListener) -> None:
+        """Stop calling a listener"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        """Tell the listeners the scores changed"""
+        for listener in list(self._listeners):
+            listener()
+
+    def _index(self, entry: ScoreEntry) -> None:
+        """Add an entry to the in-memory indexes"""
+        insort(self._by_score, (-entry["score"], len(self._entries)))
+        self._entries.append(entry)
+        player = entry["player"]
+        if entry["score"] > self._player_best.get(player, -1):
+            self._player_best[player] = entry["score"]
+
+    def _index_many(self, entries: List[ScoreEntry]) -> None:
+        """Add entries read from the log to the in-memory indexes.
+
+        Uses one sort instead of an insort per entry, which would make
+        loading a long history quadratic.
+        """
+        start = len(self._entries)
+        self._entries.extend(entries)
+        self._by_score.extend(
+            (-entry["score"], start + i) for i, entry in enumerate(entries)
+        )
+        # Timsort merges the new run with the already sorted keys
+        self._by_score.sort()
+        player_best = self._player_best
+        for entry in entries:
+            player = entry["player"]
+            if entry["score"] > player_best.get(player, -1):
+                player_best[player] = entry["score"]
+
+    def _append(self, entries: List[ScoreEntry]) -> None:
+        """Queue entries to be written to the end of the log"""
+        lines = "".join(
+            json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries
+        )
+        if self._unterminated:
+            # Keep the first new record off the damaged line
+            lines = "\n" + lines
+            self._unterminated = False
+        data = lines.encode("utf-8")
+        self._expected_size += len(data)
+        self._own_writes += data
+        self.is_new = False
+        PERSISTENCE.append(self.path, lines)
+
+    def add(self, entry: ScoreEntry) -> None:
+        """Record a score"""
+        self._index(entry)
+        self._append([entry])
+        self._notify()
+
+    def add_many(self, entries: Iterable[ScoreEntry]) -> int:
+        """Record several scores with one write and return how many"""
+        entries = list(entries)
+        for entry in entries:
+            self._index(entry)
+        if entries:
+            self._append(entries)
+            self._notify()
+        return len(entries)
+
+    def import_json(self, path: Union[str, Path]) -> int:
+        """Import the entries of a high score JSON file.
+
+        Returns the number of entries imported; invalid entries are
+        skipped. Raises ValueError if the file is not a JSON list.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid high score file: {e}") from e
+        if not isinstance(data, list):
+            raise ValueError("High score file must contain a list")
+
+        return self.add_many(entry for entry in data if _is_entry(entry))
+
+    def top(self, limit: int) -> List[ScoreEntry]:
+        """Get the best ``limit`` scores, best first"""
+        entries = self._entries
+        return [entries[i] for _, i in self._by_score[: max(limit, 0)]]
+
+    def rank(self, score: int) -> int:
+        """Get the position a score would take (1 is the best)"""
+        # Every key of an equal score sorts after (-score, -1)
+        return bisect_left(self._by_score, (-score, -1)) + 1
+
+    def player_best(self, player: str) -> int:
+        """Get a player's best score (0 if they have none)"""
+        return self._player_best.get(player, 0)
+
+    def clear(self) -> None:
+        """Delete all scores"""
+        self._reset()
+        self.is_new = False
+        # Truncate rather than delete, so the store is not mistaken for a
+        # new one and old scores imported again
+        PERSISTENCE.write(self.path, "")
+        self._notify()
+
+    def flush(self) -> None:
+        """Wait until queued records are written"""
+        PERSISTENCE.flush(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _signature(stat: os.stat_result) -> _Signature:
+    """Get the parts of a file's status that change when it is written"""
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+_STORES: Dict[Path, ScoreStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_score_store(path: Union[str, Path]) -> ScoreStore:
+    """Get the process-wide store for a log, loading it on first use"""
+    key = Path(path).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = ScoreStore(path)
+            return store
+    store.refresh()
+    return store
@@ -0,0 +1,136 @@
+"""
+Headless simulation core for Snake Game
+
+SnakeSimulator holds the state of one game and advances it one tick at a
+time. It does not import pygame, so it can run games without a window,
+e.g. for bots, load tests or replays. SnakeGame drives the same rules and
+only adds rendering and input on top.
+"""
+
+import random
+import secrets
+from enum import Enum
+from typing import List, Optional
+from .config import CONFIG
+from .game_objects import CollisionType, Direction, Food, Snake
+
+
+class SimEvent(Enum):
+    """Events that can happen during a simulation tick"""
+
+    MOVED = "moved"
+    ATE_FOOD = "ate_food"
+    HIT_WALL = "hit_wall"
+    HIT_SELF = "hit_self"
+    BOARD_FULL = "board_full"
+
+
+# Compact end-of-game cause codes for array and shared-memory results
+CAUSE_NONE = 0
+CAUSE_WALL = 1
+CAUSE_SELF = 2
+CAUSE_BOARD_FULL = 3
+
+CAUSE_EVENTS = {
+    CAUSE_WALL: SimEvent.HIT_WALL,
+    CAUSE_SELF: SimEvent.HIT_SELF,
+    CAUSE_BOARD_FULL: SimEvent.BOARD_FULL,
+}
+CAUSE_CODES = {event: code for code, event in CAUSE_EVENTS.items()}
+
+_COLLISION_EVENTS = {
+    CollisionType.WALL: SimEvent.HIT_WALL,
+    CollisionType.SELF: SimEvent.HIT_SELF,
+}
+
+
+def new_seed() -> int:
+    """Draw a fresh 32-bit game seed from the OS entropy pool"""
+    return secrets.randbits(32)
+
+
+class SnakeSimulator:
+    """Pure-Python Snake game state with a step() API.
+
+    Every game has its own seeded RNG stream, so the same seed and the same
+    actions always replay the same game. Without a seed each game draws a
+    fresh one; it is available as ``seed`` for logs and replays.
+    With ``start=False`` the first game begins at the first reset() call.
+    """
+
+    def __init__(self, seed: Optional[int] = None, start: bool = True):
+        self.base_seed = seed
+        if start:
+            self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Start a new game, optionally with an explicit seed"""
+        if seed is None:
+            seed = self.base_seed if self.base_seed is not None else new_seed()
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        self.snake = Snake()
+        self.food = Food(self.rng)
+        self.score = 0
+        self.food_eaten = 0
+        self.ticks = 0
+        self.done = False
+        self.board_full = False
+        self.death_cause: Optional[SimEvent] = None
+
+        # Ensure food doesn't spawn on snake
+        if not self.food.respawn(self.snake.body):
+            self._finish(SimEvent.BOARD_FULL)
+
+    def _finish(self, cause: SimEvent) -> None:
+        """End the game with the given cause"""
+        self.done = True
+        self.death_cause = cause
+        self.board_full = cause == SimEvent.BOARD_FULL
+
+    def step(self, action: Optional[Direction] = None) -> List[SimEvent]:
+        """Advance the game one tick and return what happened.
+
+        ``action`` is an optional direction change applied before moving;
+        reverse directions are ignored like in the interactive game. A
+        finished game does not advance and returns no events.
+        """
+        if self.done:
+            return []
+
+        snake = self.snake
+        if action is not None:
+            snake.change_direction(action)
+
+        # Move snake
+        snake.move()
+        self.ticks += 1
+        events = [SimEvent.MOVED]
+
+        # Check collisions
+        collision = snake.get_collision()
+        if collision is not None:
+            cause = _COLLISION_EVENTS[collision]
+            events.append(cause)
+            self._finish(cause)
+            return events
+
+        # Check if snake ate the food
+        if snake.ate_food(self.food):
+            snake.grow()
+            self.score += CONFIG.POINTS_PER_FOOD
+            self.food_eaten += 1
+            events.append(SimEvent.ATE_FOOD)
+
+            # No free cell left for the food: the snake fills the board
+            if not self.food.respawn(snake.body):
+                events.append(SimEvent.BOARD_FULL)
+                self._finish(SimEvent.BOARD_FULL)
+
+        return events
+
+    @property
+    def length(self) -> int:
+        """Get the current snake length"""
+        return self.snake.get_length()
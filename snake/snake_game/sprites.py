@@ -0,0 +1,64 @@
+"""
+Pre-rendered tile sprites for Snake Game
+
+Drawing a cell with a border takes two fills. TileCache renders the head,
+body and food tiles once as display-format surfaces, so a whole snake can
+be drawn with a single Surface.blits() call. Tiles are rebuilt
+automatically when CONFIG.GRID_SIZE or the COLORS palette change.
+"""
+
+from typing import Hashable, NamedTuple, Optional, Tuple
+import pygame
+from . import config
+
+
+class Tiles(NamedTuple):
+    """Tile surfaces for one grid size and palette"""
+
+    head: pygame.Surface
+    body: pygame.Surface
+    food: pygame.Surface
+
+
+def _make_tile(
+    size: int, border: Tuple[int, int, int], fill: Tuple[int, int, int]
+) -> pygame.Surface:
+    """Render a cell tile with a 1 pixel border"""
+    tile = pygame.Surface((size, size))
+    tile.fill(border)
+    tile.fill(fill, (1, 1, size - 2, size - 2))
+    # Match the display's pixel format so blits need no conversion
+    if pygame.display.get_surface() is not None:
+        tile = tile.convert()
+    return tile
+
+
+class TileCache:
+    """Builds tiles on demand and rebuilds them when their inputs change"""
+
+    def __init__(self):
+        self._key: Optional[Hashable] = None
+        self._tiles: Optional[Tiles] = None
+
+    def get(self) -> Tiles:
+        """Get the tiles for the current grid size and palette"""
+        colors = config.COLORS
+        key = (config.CONFIG.GRID_SIZE, colors, pygame.display.get_surface())
+        if self._tiles is None or key != self._key:
+            size = config.CONFIG.GRID_SIZE
+            self._tiles = Tiles(
+                head=_make_tile(size, colors.BLACK, colors.DARK_GREEN),
+                body=_make_tile(size, colors.BLACK, colors.GREEN),
+                food=_make_tile(size, colors.WHITE, colors.RED),
+            )
+            self._key = key
+        return self._tiles
+
+    def clear(self) -> None:
+        """Drop the cached tiles"""
+        self._key = None
+        self._tiles = None
+
+
+# Shared by all snakes and food
+TILE_CACHE = TileCache()
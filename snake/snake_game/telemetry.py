@@ -0,0 +1,195 @@
+"""
+Gameplay telemetry for Snake Game
+
+Telemetry records typed per-game events (start, direction changes, food
+eaten, game over) as JSON Lines for offline analysis. The game thread
+only appends a small tuple to a bounded in-memory ring buffer; a
+background thread formats the buffered events and appends them to the
+telemetry file in batches.
+
+The cost on the game thread is capped: telemetry is off unless enabled,
+nothing is emitted on ordinary ticks, and when the writer falls behind
+and the buffer is full, new events are dropped and counted instead of
+waiting. A "dropped" line in the file marks where events were lost.
+
+Events carry a game number; a game with no game_over event was abandoned
+(restarted or left for the menu).
+"""
+
+import atexit
+import json
+import threading
+import time
+from collections import deque
+from enum import Enum
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+from .logger import logger
+
+
+class TelemetryEvent(Enum):
+    """Telemetry event types"""
+
+    GAME_START = "game_start"
+    DIRECTION = "direction"
+    FOOD = "food"
+    GAME_OVER = "game_over"
+
+
+# Wall time, event, game number, tick and event fields
+_Record = Tuple[float, TelemetryEvent, int, int, Dict[str, Any]]
+
+
+class Telemetry:
+    """Ring-buffered event stream with a batched background writer"""
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+    ):
+        if capacity <= 0 or batch_size <= 0:
+            raise ValueError(
+                "Telemetry capacity and batch size must be positive"
+            )
+
+        self.capacity = capacity
+        # The writer wakes when this many events are waiting, or after
+        # flush_interval seconds otherwise
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enabled = False
+        self.path: Optional[Path] = None
+
+        self.dropped = 0
+        self.written = 0
+        self._game = 0
+        self._buffer: Deque[_Record] = deque()
+        self._reported_drops = 0
+        self._writing = False
+        self._urgent = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def enable(self, path: Union[str, Path] = "telemetry.jsonl") -> None:
+        """Start recording events to a JSON Lines file"""
+        self.path = Path(path)
+        self.enabled = True
+
+    def emit(self, event: TelemetryEvent, tick: int, **fields: Any) -> None:
+        """Record an event; never blocks on the writer"""
+        if not self.enabled:
+            return
+        if event is TelemetryEvent.GAME_START:
+            self._game += 1
+
+        record = (time.time(), event, self._game, tick, fields)
+        with self._condition:
+            if len(self._buffer) >= self.capacity:
+                self.dropped += 1
+                return
+            self._buffer.append(record)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="snake-telemetry", daemon=True
+                )
+                self._thread.start()
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+
+    def _worker(self) -> None:
+        """Write batches of buffered events until closed"""
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._buffer and not self._closed:
+                    condition.wait()
+                if len(self._buffer) < self.batch_size and not (
+                    self._urgent or self._closed
+                ):
+                    # Let a batch build up
+                    condition.wait(self.flush_interval)
+                if not self._buffer:
+                    return
+                batch = list(self._buffer)
+                self._buffer.clear()
+                dropped = self.dropped - self._reported_drops
+                self._reported_drops = self.dropped
+                self._writing = True
+
+            self._write(batch, dropped)
+
+            with condition:
+                self._writing = False
+                if not self._buffer:
+                    self._urgent = False
+                condition.notify_all()
+
+    def _write(self, batch: List[_Record], dropped: int) -> None:
+        """Append a batch of events to the telemetry file"""
+        lines = []
+        if dropped:
+            lines.append(
+                json.dumps({"event": "dropped", "count": dropped}) + "\n"
+            )
+        for timestamp, event, game, tick, fields in batch:
+            record = {
+                "time": round(timestamp, 3),
+                "event": event.value,
+                "game": game,
+                "tick": tick,
+            }
+            record.update(fields)
+            lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        except OSError as e:
+            logger.error("Could not write telemetry to %s: %s", self.path, e)
+            return
+        self.written += len(batch)
+
+    def flush(self) -> None:
+        """Wait until buffered events are written"""
+        with self._condition:
+            if self._thread is None:
+                return
+            self._urgent = True
+            self._condition.notify_all()
+            while self._buffer or self._writing:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Write buffered events and stop the writer"""
+        self.enabled = False
+        self.flush()
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        if self.dropped:
+            logger.warning("Dropped %d telemetry events", self.dropped)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the numbers of written, dropped and waiting events"""
+        with self._condition:
+            pending = len(self._buffer)
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "pending": pending,
+        }
+
+
+# Shared by the game; enabled by --telemetry
+TELEMETRY = Telemetry()
+atexit.register(TELEMETRY.close)
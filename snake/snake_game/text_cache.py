@@ -0,0 +1,84 @@
+"""
+Shared text surface cache for Snake Game
+
+Rendering text is one of the most expensive things a frame does, yet the
+HUD, overlays and menus draw the same few strings over and over.
+TextCache keeps a bounded LRU of rendered surfaces keyed by
+(font, text, color, antialias) and counts hits and misses.
+
+Cached surfaces are shared between callers and must not be modified.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Sequence, Tuple
+import pygame
+
+TextKey = Tuple[pygame.font.Font, str, Tuple[int, ...], bool]
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces"""
+
+    def __init__(self, max_size: int = 256):
+        if max_size <= 0:
+            raise ValueError("Text cache size must be positive")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Sequence[int],
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """Get the rendered text surface, rendering it on a miss"""
+        key: TextKey = (font, text, tuple(color), antialias)
+        surfaces = self._surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        surfaces[key] = surface
+        if len(surfaces) > self.max_size:
+            surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Drop all cached surfaces and reset the counters"""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit/miss counters and the current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._surfaces),
+            "max_size": self.max_size,
+        }
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+# Shared by the game screen and all menus
+TEXT_CACHE = TextCache()
+
+
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: Sequence[int],
+    antialias: bool = True,
+) -> pygame.Surface:
+    """Render text through the shared cache"""
+    return TEXT_CACHE.render(font, text, color, antialias)
@@ -0,0 +1,245 @@
+"""
+Vectorized batch environment for Snake Game
+
+VectorSnakeEnv holds N independent games in NumPy arrays and advances all
+of them in lockstep with array operations. It follows the same rules as
+SnakeSimulator (and therefore Snake.move/check_collision): wrap-around or
+wall collision according to CONFIG.WALL_COLLISION, deferred growth after
+eating and POINTS_PER_FOOD per food. Finished games are reset
+automatically at the end of the step that ended them.
+
+Requires NumPy (``pip install snake-game-classic[sim]``).
+"""
+
+from typing import NamedTuple, Optional, Sequence, Union
+import numpy as np
+from .config import CONFIG
+from .game_objects import Direction
+from .simulation import (  # noqa: F401 - re-exported cause codes
+    CAUSE_BOARD_FULL,
+    CAUSE_EVENTS,
+    CAUSE_NONE,
+    CAUSE_SELF,
+    CAUSE_WALL,
+)
+
+# Action encoding: index into ACTIONS, or NO_ACTION to keep the direction
+ACTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+NO_ACTION = -1
+
+_DX = np.array([d.value[0] for d in ACTIONS], dtype=np.int32)
+_DY = np.array([d.value[1] for d in ACTIONS], dtype=np.int32)
+_OPPOSITE = np.array([1, 0, 3, 2], dtype=np.int8)
+_RIGHT = ACTIONS.index(Direction.RIGHT)
+
+
+class VectorStepResult(NamedTuple):
+    """Per-game results of one VectorSnakeEnv.step() call.
+
+    ``scores``, ``lengths`` and ``ticks`` hold the final values for games
+    that ended on this step (before they were reset) and the current
+    values for the others.
+    """
+
+    rewards: np.ndarray
+    dones: np.ndarray
+    causes: np.ndarray
+    scores: np.ndarray
+    lengths: np.ndarray
+    ticks: np.ndarray
+
+
+class VectorSnakeEnv:
+    """N Snake games stepped in lockstep with NumPy"""
+
+    def __init__(
+        self,
+        num_envs: int,
+        seed: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        wall_collision: Optional[bool] = None,
+        points_per_food: Optional[int] = None,
+        initial_length: Optional[int] = None,
+    ):
+        if num_envs <= 0:
+            raise ValueError("Number of environments must be positive")
+
+        self.num_envs = num_envs
+        self.width = CONFIG.grid_width if width is None else width
+        self.height = CONFIG.grid_height if height is None else height
+        self.wall_collision = (
+            CONFIG.WALL_COLLISION if wall_collision is None else wall_collision
+        )
+        self.points_per_food = (
+            CONFIG.POINTS_PER_FOOD
+            if points_per_food is None
+            else points_per_food
+        )
+        self.initial_length = (
+            CONFIG.INITIAL_SNAKE_LENGTH
+            if initial_length is None
+            else initial_length
+        )
+        if self.initial_length > self.width // 2 + 1:
+            raise ValueError("Initial snake does not fit on the grid")
+
+        self.size = self.width * self.height
+        self.capacity = self.size + 1
+        self.rng = np.random.default_rng(seed)
+        self._rows = np.arange(num_envs)
+
+        # Game state, one row/entry per game
+        self.head_x = np.zeros(num_envs, dtype=np.int32)
+        self.head_y = np.zeros(num_envs, dtype=np.int32)
+        self.directions = np.zeros(num_envs, dtype=np.int8)
+        self.grow_pending = np.zeros(num_envs, dtype=bool)
+        self.bodies = np.zeros((num_envs, self.capacity), dtype=np.int32)
+        self.head_index = np.zeros(num_envs, dtype=np.int32)
+        self.lengths = np.zeros(num_envs, dtype=np.int32)
+        self.occupancy = np.zeros((num_envs, self.size), dtype=np.uint8)
+        self.food = np.zeros(num_envs, dtype=np.int32)
+        self.scores = np.zeros(num_envs, dtype=np.int64)
+        self.ticks = np.zeros(num_envs, dtype=np.int64)
+
+        self.reset()
+
+    @property
+    def heads(self) -> np.ndarray:
+        """Head positions as an (N, 2) array of (x, y)"""
+        return np.stack((self.head_x, self.head_y), axis=1)
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> None:
+        """Reset all games, or only those selected by a boolean mask"""
+        if mask is None:
+            rows = self._rows
+        else:
+            rows = np.flatnonzero(mask)
+        if not len(rows):
+            return
+
+        length = self.initial_length
+        center_x = self.width // 2
+        center_y = self.height // 2
+
+        self.occupancy[rows] = 0
+        # Ring buffer runs tail -> head, so the head is the last segment
+        initial_cells = center_y * self.width + center_x - np.arange(length)
+        self.bodies[rows, :length] = initial_cells[::-1]
+        self.occupancy[rows[:, None], initial_cells[None, :]] = 1
+        self.head_index[rows] = length - 1
+        self.lengths[rows] = length
+
+        self.head_x[rows] = center_x
+        self.head_y[rows] = center_y
+        self.directions[rows] = _RIGHT
+        self.grow_pending[rows] = False
+        self.scores[rows] = 0
+        self.ticks[rows] = 0
+
+        # Fresh boards always have room for the food
+        self._spawn_food(rows)
+
+    def _spawn_food(self, rows: np.ndarray) -> np.ndarray:
+        """Place food on a uniformly random free cell of each game.
+
+        Returns a mask over ``rows`` of games whose board is full.
+        """
+        free_counts = self.size - self.lengths[rows]
+        full = free_counts <= 0
+        rows = rows[~full]
+        if len(rows):
+            free = self.occupancy[rows] == 0
+            picks = (self.rng.random(len(rows)) * free_counts[~full]).astype(
+                np.int64
+            )
+            # Index of the (pick + 1)-th free cell in each row
+            cumulative = np.cumsum(free, axis=1)
+            self.food[rows] = np.argmax(cumulative > picks[:, None], axis=1)
+        return full
+
+    def step(
+        self, actions: Union[Sequence[int], np.ndarray, None] = None
+    ) -> VectorStepResult:
+        """Advance every game one tick.
+
+        ``actions`` holds one entry per game: an index into ACTIONS, or
+        NO_ACTION to keep going straight. Reverse directions are ignored.
+        """
+        rows = self._rows
+
+        # Apply direction changes, rejecting reverse movement
+        if actions is not None:
+            actions = np.asarray(actions, dtype=np.int8)
+            change = (actions >= 0) & (actions != _OPPOSITE[self.directions])
+            self.directions = np.where(change, actions, self.directions)
+
+        # Calculate new head positions
+        new_x = self.head_x + _DX[self.directions]
+        new_y = self.head_y + _DY[self.directions]
+        if self.wall_collision:
+            hit_wall = (
+                (new_x < 0)
+                | (new_x >= self.width)
+                | (new_y < 0)
+                | (new_y >= self.height)
+            )
+            on_grid = ~hit_wall
+        else:
+            new_x %= self.width
+            new_y %= self.height
+            hit_wall = np.zeros(self.num_envs, dtype=bool)
+            on_grid = ~hit_wall
+        new_cells = np.where(on_grid, new_y * self.width + new_x, 0)
+
+        # Remove tails of games that are not growing
+        shrink = ~self.grow_pending
+        tail_index = (self.head_index - self.lengths + 1) % self.capacity
+        tail_cells = self.bodies[rows, tail_index]
+        self.occupancy[rows[shrink], tail_cells[shrink]] -= 1
+        self.lengths[~shrink] += 1
+        self.grow_pending[:] = False
+
+        # Add new heads
+        self.head_index = (self.head_index + 1) % self.capacity
+        self.bodies[rows, self.head_index] = new_cells
+        self.occupancy[rows[on_grid], new_cells[on_grid]] += 1
+        self.head_x = new_x
+        self.head_y = new_y
+        self.ticks += 1
+
+        # Check collisions (the head itself accounts for one segment)
+        hit_self = on_grid & (self.occupancy[rows, new_cells] > 1)
+        alive = ~(hit_wall | hit_self)
+
+        # Check food
+        ate = alive & (new_cells == self.food)
+        rewards = np.where(ate, self.points_per_food, 0)
+        self.scores += rewards
+        self.grow_pending[ate] = True
+
+        board_full = np.zeros(self.num_envs, dtype=bool)
+        eaters = np.flatnonzero(ate)
+        if len(eaters):
+            board_full[eaters[self._spawn_food(eaters)]] = True
+
+        causes = np.full(self.num_envs, CAUSE_NONE, dtype=np.int8)
+        causes[hit_wall] = CAUSE_WALL
+        causes[hit_self] = CAUSE_SELF
+        causes[board_full] = CAUSE_BOARD_FULL
+        dones = causes != CAUSE_NONE
+
+        result = VectorStepResult(
+            rewards=rewards,
+            dones=dones,
+            causes=causes,
+            scores=self.scores.copy(),
+            lengths=self.lengths.copy(),
+            ticks=self.ticks.copy(),
+        )
+
+        # Auto-reset finished games
+        if dones.any():
+            self.reset(dones)
+
+        return result
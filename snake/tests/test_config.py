@@ -2,10 +2,14 @@
 Unit tests for configuration system
 """
 
+import json
 import unittest
 import tempfile
 import os
-from snake_game.config import GameConfig
+import subprocess
+import sys
+from unittest import mock
+from snake_game.config import ConfigWatcher, GameConfig
 
 
 class TestGameConfig(unittest.TestCase):
@@ -78,6 +82,25 @@ class TestGameConfig(unittest.TestCase):
         with self.assertRaises(ValueError):
             config.update_setting("FPS", 0)
 
+    def test_wrong_type_is_rejected(self):
+        """Test settings keep their type"""
+        config = GameConfig()
+
+        with self.assertRaises(ValueError):
+            config.update_setting("FPS", "fast")
+        with self.assertRaises(ValueError):
+            config.update_setting("FPS", True)
+        self.assertEqual(config.FPS, 10)
+
+    def test_load_reports_changed_settings(self):
+        """Test loading returns only the settings whose value changed"""
+        with open(self.temp_path, "w") as f:
+            json.dump({"FPS": 20, "GRID_SIZE": 20, "RENDER_FPS": -1}, f)
+        config = GameConfig()
+
+        self.assertEqual(config.load_from_file(self.temp_path), {"FPS"})
+        self.assertEqual(config.RENDER_FPS, 60)
+
     def test_grid_properties(self):
         """Test grid calculation properties"""
         config = GameConfig()
@@ -87,6 +110,169 @@ class TestGameConfig(unittest.TestCase):
         self.assertEqual(config.grid_width, expected_width)
         self.assertEqual(config.grid_height, expected_height)
 
+    def test_geometry_follows_dimension_changes(self):
+        """Test cached geometry is recomputed when a dimension changes"""
+        config = GameConfig()
+        self.assertEqual((config.grid_width, config.center_y), (32, 12))
+
+        config.update_setting("GRID_SIZE", 10)
+        self.assertEqual((config.grid_width, config.center_y), (64, 24))
+
+        config.WINDOW_WIDTH = 200
+        self.assertEqual(config.grid_width, 20)
+
+        config.reset_to_defaults()
+        self.assertEqual((config.grid_width, config.center_y), (32, 12))
+
+    def test_other_settings_keep_geometry_cached(self):
+        """Test changing a non-dimension setting keeps the cache"""
+        config = GameConfig()
+        config.grid_width
+        config.update_setting("FPS", 20)
+        self.assertIn("grid_width", vars(config))
+
+    def test_missing_file_is_not_created(self):
+        """Test loading without a config file only uses defaults"""
+        os.unlink(self.temp_path)
+        config = GameConfig()
+        config.load_from_file(self.temp_path)
+
+        self.assertEqual(config.FPS, 10)
+        self.assertFalse(os.path.exists(self.temp_path))
+
+    def test_ensure_loaded_loads_once(self):
+        """Test the config file is read on first use only"""
+        config = GameConfig()
+        with mock.patch.object(config, "load_from_file") as load:
+            load.side_effect = lambda: setattr(config, "_loaded", True)
+            config.ensure_loaded()
+            config.ensure_loaded()
+        load.assert_called_once()
+
+    def test_import_has_no_side_effects(self):
+        """Test importing the config reads and writes nothing"""
+        package_dir = os.path.dirname(os.path.dirname(__file__))
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "config.json"), "w") as f:
+                f.write('{"FPS": 25}')
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys; from snake_game.config import CONFIG; "
+                    "print(CONFIG.FPS, 'pygame' in sys.modules)",
+                ],
+                cwd=directory,
+                env={**os.environ, "PYTHONPATH": os.path.abspath(package_dir)},
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            with open(os.path.join(directory, "config.json")) as f:
+                self.assertEqual(f.read(), '{"FPS": 25}')
+
+        # The config needs neither the file nor pygame
+        self.assertEqual(output.split(), ["10", "False"])
+
+
+class TestConfigWatcher(unittest.TestCase):
+    """Tests for applying config file edits while running"""
+
+    def setUp(self):
+        """Watch a temporary config file with a fake clock"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "config.json")
+        self.config = GameConfig()
+        self.config._config_file = self.path
+        self.config.save_to_file()
+
+        self.now = 100.0
+        patcher = mock.patch(
+            "snake_game.config.time.monotonic", side_effect=lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.changes = []
+        self.watcher = ConfigWatcher(self.config)
+        self.watcher.add_listener(self.changes.append)
+        self.watcher.start()
+
+    def _edit(self, **settings) -> None:
+        """Rewrite the file as an operator would"""
+        with open(self.path) as f:
+            data = json.load(f)
+        data.update(settings)
+        with open(self.path, "w") as f:
+            json.dump(data, f, indent=4)
+
+    def test_edit_is_applied(self):
+        """Test an edit is loaded and reported to listeners"""
+        self._edit(FPS=25, GRID_SIZE=10)
+        self.now += 1.0
+
+        self.assertEqual(self.watcher.poll(), {"FPS", "GRID_SIZE"})
+        self.assertEqual(self.config.FPS, 25)
+        self.assertEqual(self.config.grid_width, 64)
+        self.assertEqual(self.changes, [{"FPS", "GRID_SIZE"}])
+
+    def test_checks_at_most_once_per_interval(self):
+        """Test the file is not looked at between checks"""
+        self._edit(FPS=25)
+        self.now += 0.5
+        with mock.patch("snake_game.config.os.stat") as stat:
+            self.assertEqual(self.watcher.poll(), set())
+        stat.assert_not_called()
+
+        self.now += 0.5
+        self.assertEqual(self.watcher.poll(), {"FPS"})
+
+    def test_unchanged_file_is_not_read(self):
+        """Test the file is only read after it changed"""
+        self.now += 1.0
+        with mock.patch.object(self.config, "load_from_file") as load:
+            self.assertEqual(self.watcher.poll(), set())
+        load.assert_not_called()
+
+    def test_invalid_edit_keeps_setting(self):
+        """Test invalid values are rejected and the rest applied"""
+        self._edit(FPS=0, WALL_COLLISION=True)
+        self.now += 1.0
+
+        self.assertEqual(self.watcher.poll(), {"WALL_COLLISION"})
+        self.assertEqual(self.config.FPS, 10)
+
+    def test_own_save_is_not_a_change(self):
+        """Test saving from the settings menu reports nothing"""
+        self.config.FPS = 15
+        self.config.save_to_file()
+        self.now += 1.0
+
+        self.assertEqual(self.watcher.poll(), set())
+        self.assertEqual(self.changes, [])
+
+    def test_pending_save_is_not_waited_for(self):
+        """Test a check is skipped while our own save is queued"""
+        self._edit(FPS=25)
+        self.now += 1.0
+        with mock.patch("snake_game.config.PERSISTENCE") as persistence:
+            persistence.pending.return_value = True
+            self.assertEqual(self.watcher.poll(), set())
+        persistence.flush.assert_not_called()
+
+        self.now += 1.0
+        self.assertEqual(self.watcher.poll(), {"FPS"})
+
+    def test_stopped_watcher_does_nothing(self):
+        """Test polling is a no-op unless watching"""
+        self.watcher.stop()
+        self._edit(FPS=25)
+        self.now += 1.0
+
+        self.assertEqual(self.watcher.poll(), set())
+        self.assertEqual(self.config.FPS, 10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,180 @@
+"""
+Unit tests for frame phase timing
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pygame
+from snake_game.frame_timer import (
+    PHASE_DRAW,
+    PHASE_EVENTS,
+    PHASE_SLEEP,
+    FrameTimer,
+    after_next_present,
+    percentile,
+    present,
+)
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+class TestFrameTimer(unittest.TestCase):
+    """Tests for FrameTimer class"""
+
+    def setUp(self):
+        """Setup an enabled timer driven by a fake clock"""
+        self.timer = FrameTimer(window=100)
+        self.timer.enable()
+        self.now = 0.0
+        patcher = mock.patch(
+            "snake_game.frame_timer.perf_counter", side_effect=self._clock
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _clock(self) -> float:
+        return self.now
+
+    def _frame(self, events_ms: float, draw_ms: float, sleep_ms: float):
+        """Record one frame with the given phase durations"""
+        self.timer.begin_frame()
+        for phase, ms in (
+            (PHASE_EVENTS, events_ms),
+            (PHASE_DRAW, draw_ms),
+            (PHASE_SLEEP, sleep_ms),
+        ):
+            self.now += ms / 1000
+            self.timer.mark(phase)
+        self.timer.end_frame(budget_ms=16.0)
+
+    def test_phases_are_timed(self):
+        """Test time between marks is charged to each phase"""
+        self._frame(1.0, 4.0, 11.0)
+
+        stats = self.timer.stats()
+        self.assertAlmostEqual(stats["events"]["p50"], 1.0)
+        self.assertAlmostEqual(stats["draw"]["p50"], 4.0)
+        self.assertAlmostEqual(stats["sleep"]["p50"], 11.0)
+        self.assertAlmostEqual(stats["frame"]["max"], 16.0)
+        self.assertEqual(stats["update"]["p99"], 0.0)
+
+    def test_percentiles_and_dropped_frames(self):
+        """Test rolling percentiles and slow frames are reported"""
+        for i in range(100):
+            draw_ms = 40.0 if i % 20 == 0 else 5.0
+            self._frame(0.0, draw_ms, 0.0)
+
+        stats = self.timer.stats()["draw"]
+        self.assertAlmostEqual(stats["p50"], 5.0)
+        self.assertAlmostEqual(stats["p99"], 40.0)
+        self.assertEqual(self.timer.dropped, 5)
+
+    def test_window_is_bounded(self):
+        """Test only the most recent frames are kept"""
+        for _ in range(150):
+            self._frame(1.0, 1.0, 1.0)
+        self.assertEqual(len(self.timer.samples), 100)
+        self.assertEqual(self.timer.frames, 150)
+
+    def test_disabled_records_nothing(self):
+        """Test a disabled timer ignores marks"""
+        timer = FrameTimer()
+        timer.begin_frame()
+        timer.mark(PHASE_DRAW)
+        timer.end_frame(16.0)
+        self.assertEqual(timer.frames, 0)
+
+    def test_dump_json_and_csv(self):
+        """Test the summary and samples can be written on exit"""
+        self._frame(1.0, 2.0, 3.0)
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = self.timer.dump(os.path.join(directory, "t.json"))
+            with open(json_path) as f:
+                summary = json.load(f)
+            csv_path = self.timer.dump(os.path.join(directory, "t.csv"))
+            with open(csv_path, newline="") as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(summary["frames"], 1)
+        self.assertIn("p95", summary["phases"]["flip"])
+        self.assertEqual(rows[0][-1], "frame")
+        self.assertEqual(float(rows[1][-1]), 6.0)
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles"""
+        values = list(range(1, 11))
+        self.assertEqual(percentile(values, 50), 5)
+        self.assertEqual(percentile(values, 99), 10)
+        self.assertEqual(percentile([], 50), 0.0)
+
+
+class TestFrameTimerOverlay(unittest.TestCase):
+    """Tests for the frame timing overlay"""
+
+    def setUp(self):
+        """Setup a display and a timer"""
+        pygame.init()
+        self.screen = pygame.display.set_mode((320, 240))
+        self.timer = FrameTimer()
+
+    def tearDown(self):
+        """Shut down pygame"""
+        pygame.quit()
+
+    def test_f3_toggles_overlay_and_timing(self):
+        """Test F3 shows the overlay and starts timing"""
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+
+        self.assertTrue(self.timer.handle_event(event))
+        self.assertTrue(self.timer.overlay_visible)
+        self.assertTrue(self.timer.enabled)
+        self.assertIsNotNone(self.timer.overlay_key())
+
+        self.timer.handle_event(event)
+        self.assertIsNone(self.timer.overlay_key())
+        self.assertIsNone(self.timer.draw_overlay(self.screen, (0, 0)))
+
+    def test_overlay_refreshes_periodically(self):
+        """Test the overlay numbers change at most once per refresh"""
+        self.timer.handle_event(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+        )
+        self.timer.begin_frame()
+        self.timer.end_frame()
+        key = self.timer.overlay_key()
+        self.timer.begin_frame()
+        self.timer.end_frame()
+
+        self.assertEqual(self.timer.overlay_key(), key)
+        rect = self.timer.draw_overlay(self.screen, (10, 10))
+        self.assertEqual(rect.topleft, (10, 10))
+
+
+class TestPresent(unittest.TestCase):
+    """Tests for pushing frames to the display"""
+
+    def setUp(self):
+        """Setup a display"""
+        pygame.display.init()
+        pygame.display.set_mode((64, 48))
+
+    def tearDown(self):
+        """Shut down pygame"""
+        pygame.quit()
+
+    def test_after_next_present_runs_once(self):
+        """Test a callback runs after the next frame only"""
+        calls = []
+        after_next_present(lambda: calls.append(1))
+
+        present()
+        present()
+        self.assertEqual(calls, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
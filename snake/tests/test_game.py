@@ -0,0 +1,379 @@
+"""
+Unit tests for the SnakeGame screen handling
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import pygame
+from snake_game.config import CONFIG
+from snake_game.game import MAX_TICKS_PER_FRAME, GameState, SnakeGame
+from snake_game.game_objects import Direction, Snake
+from snake_game.high_score import HighScoreManager
+from snake_game.persistence import PERSISTENCE
+from snake_game.main import parse_seed
+from snake_game.replay import MAX_SEED, Replay
+from snake_game.telemetry import Telemetry
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+class TestOverlayScreens(unittest.TestCase):
+    """Tests for the cached pause and game over screens"""
+
+    def setUp(self):
+        """Create a game with a temporary high score file"""
+        fd, self.temp_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        os.unlink(self.temp_path)
+        self.game = SnakeGame(seed=1)
+        self.game.high_score_manager = HighScoreManager(self.temp_path)
+
+    def tearDown(self):
+        """Cleanup temporary files and pygame"""
+        self.game.high_score_manager.store.flush()
+        store_path = self.game.high_score_manager.store.path
+        for path in (self.temp_path, store_path):
+            if os.path.exists(path):
+                os.unlink(path)
+        pygame.quit()
+
+    def _count_flips(self, frames: int) -> int:
+        """Draw some frames and count how often the display is flipped"""
+        with mock.patch("pygame.display.flip") as flip:
+            for _ in range(frames):
+                self.game.draw()
+        return flip.call_count
+
+    def test_static_pause_screen_is_drawn_once(self):
+        """Test an unchanged pause screen is not redrawn"""
+        self.game.state = GameState.PAUSED
+        self.assertEqual(self._count_flips(10), 1)
+
+    def test_dim_layer_is_reused(self):
+        """Test the dim layer is not reallocated for every overlay"""
+        self.game.state = GameState.PAUSED
+        self.game.draw()
+        dim_layer = self.game._dim_layer
+
+        self.game.state = GameState.GAME_OVER
+        self.game.draw()
+
+        self.assertIs(self.game._dim_layer, dim_layer)
+
+    def test_game_over_screen_redraws_on_change(self):
+        """Test the game over screen is recomposed when the score changes"""
+        self.game.state = GameState.GAME_OVER
+        self.assertEqual(self._count_flips(3), 1)
+
+        self.game.simulator.score += CONFIG.POINTS_PER_FOOD
+        self.assertEqual(self._count_flips(3), 1)
+
+    def test_overlay_is_recomposed_after_playing(self):
+        """Test pausing again composes a fresh pause screen"""
+        self.game.state = GameState.PAUSED
+        self.game.draw()
+
+        self.game.state = GameState.PLAYING
+        self.game.draw()
+        self.game.state = GameState.PAUSED
+
+        self.assertEqual(self._count_flips(2), 1)
+
+    def test_expose_event_refreshes_display(self):
+        """Test an exposed window gets the composed screen again"""
+        self.game.state = GameState.PAUSED
+        self.game.draw()
+
+        pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+        self.game.handle_events()
+
+        self.assertEqual(self._count_flips(2), 1)
+
+
+class TestGameSetup(unittest.TestCase):
+    """Tests for creating a game"""
+
+    def tearDown(self):
+        """Shut down pygame"""
+        pygame.quit()
+
+    def test_first_game_is_set_up_once(self):
+        """Test creating a game builds the first snake only once"""
+        with mock.patch("snake_game.simulation.Snake", wraps=Snake) as snake:
+            game = SnakeGame(seed=1)
+
+        snake.assert_called_once_with()
+        self.assertEqual(game.simulator.seed, 1)
+        self.assertEqual(game.snake.get_length(), CONFIG.INITIAL_SNAKE_LENGTH)
+
+
+class TestIdleMode(unittest.TestCase):
+    """Tests for event-driven waiting on static screens"""
+
+    def setUp(self):
+        """Create a game"""
+        self.game = SnakeGame(seed=1)
+
+    def tearDown(self):
+        """Shut down pygame"""
+        pygame.quit()
+
+    def test_static_states_wait_for_events(self):
+        """Test paused and game over screens block on input"""
+        for state in (GameState.PAUSED, GameState.GAME_OVER):
+            self.game.state = state
+            with mock.patch(
+                "snake_game.game.wait_for_events", return_value=[]
+            ) as wait:
+                self.assertTrue(self.game.handle_events())
+            wait.assert_called_once()
+
+    def test_playing_polls_events(self):
+        """Test a running game never blocks on input"""
+        with mock.patch("snake_game.game.wait_for_events") as wait:
+            self.game.handle_events()
+        wait.assert_not_called()
+
+
+class FakeClock:
+    """Clock that reports a fixed frame time without sleeping"""
+
+    def __init__(self, frame_ms: int):
+        self.frame_ms = frame_ms
+
+    def tick(self, framerate: int = 0) -> int:
+        return self.frame_ms
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Tests for the fixed-timestep game loop"""
+
+    def setUp(self):
+        """Create a game whose frames take 25 ms"""
+        self.original_fps = CONFIG.FPS
+        CONFIG.FPS = 10
+        self.game = SnakeGame(seed=1)
+        self.game.clock = FakeClock(25)
+        self.game._frame_ms = 25
+
+    def tearDown(self):
+        """Restore original configuration and shut down pygame"""
+        CONFIG.FPS = self.original_fps
+        pygame.quit()
+
+    def _run_frames(self, frames: int) -> None:
+        """Run display frames with no input"""
+        with mock.patch("pygame.display.update"), mock.patch(
+            "pygame.display.flip"
+        ):
+            for _ in range(frames):
+                self.assertTrue(self.game._run_fixed_timestep_frame())
+
+    def test_ticks_follow_elapsed_time(self):
+        """Test the simulation ticks once per 100 ms of frames"""
+        self._run_frames(12)
+        self.assertEqual(self.game.simulator.ticks, 3)
+
+    def test_interpolation_between_ticks(self):
+        """Test the interpolation factor tracks time since the last tick"""
+        alphas = []
+        for _ in range(4):
+            self._run_frames(1)
+            alphas.append(self.game.interpolation)
+        self.assertEqual(alphas, [0.25, 0.5, 0.75, 0.0])
+
+    def test_long_frame_is_clamped(self):
+        """Test a stalled frame runs a bounded number of ticks"""
+        self.game.clock = FakeClock(0)
+        self.game._frame_ms = 10_000
+        self._run_frames(1)
+        self.assertEqual(self.game.simulator.ticks, MAX_TICKS_PER_FRAME)
+
+    def test_paused_time_is_not_simulated(self):
+        """Test unpausing does not run the ticks missed while paused"""
+        self.game.state = GameState.PAUSED
+        # Ten seconds pass on the pause screen, then a 25 ms frame
+        self.game.clock = mock.Mock()
+        self.game.clock.tick.side_effect = [10_000, 25]
+        unpause = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+        with mock.patch(
+            "snake_game.game.wait_for_events", return_value=[unpause]
+        ):
+            self._run_frames(1)
+
+        self.assertEqual(self.game.state, GameState.PLAYING)
+        self.assertEqual(self.game.simulator.ticks, 0)
+        self.assertEqual(self.game._frame_ms, 25)
+
+    def test_one_direction_change_per_tick(self):
+        """Test quick turns are applied in order on successive ticks"""
+        snake = self.game.snake
+        snake.direction = snake.next_direction = Direction.RIGHT
+        for key in (pygame.K_UP, pygame.K_LEFT):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+        self._run_frames(1)
+        self.assertEqual(len(self.game.input_queue), 2)
+
+        self._run_frames(3)
+        self.assertEqual(snake.direction, Direction.UP)
+        self._run_frames(4)
+        self.assertEqual(snake.direction, Direction.LEFT)
+
+
+class TestConfigChanges(unittest.TestCase):
+    """Tests for applying config file edits to a running game"""
+
+    def setUp(self):
+        """Create a game and remember the configuration"""
+        self.original = CONFIG.to_dict()
+        self.game = SnakeGame(seed=1)
+
+    def tearDown(self):
+        """Restore original configuration and shut down pygame"""
+        for name, value in self.original.items():
+            setattr(CONFIG, name, value)
+        pygame.quit()
+
+    def test_speed_change_keeps_game(self):
+        """Test a new speed applies without a restart or a new window"""
+        self.game.update()
+        snake = self.game.snake
+        screen = self.game.screen
+
+        CONFIG.FPS = 20
+        self.game.apply_config_changes({"FPS"})
+
+        self.assertIs(self.game.snake, snake)
+        self.assertIs(self.game.screen, screen)
+
+    def test_grid_change_restarts_paused_game(self):
+        """Test a new grid size restarts the game on the same window"""
+        self.game.state = GameState.PAUSED
+        screen = self.game.screen
+
+        CONFIG.GRID_SIZE = 10
+        self.game.apply_config_changes({"GRID_SIZE"})
+
+        self.assertEqual(self.game.state, GameState.PAUSED)
+        self.assertIs(self.game.screen, screen)
+        self.assertEqual(self.game.snake.body.head.x, 32)
+
+    def test_window_size_change_resizes_window(self):
+        """Test only a new window size recreates the window"""
+        CONFIG.WINDOW_WIDTH = 400
+        self.game.apply_config_changes({"WINDOW_WIDTH"})
+
+        self.assertEqual(self.game.screen.get_size(), (400, 480))
+        self.assertIs(self.game.renderer.screen, self.game.screen)
+
+
+class TestTelemetryEvents(unittest.TestCase):
+    """Tests for the telemetry the game emits"""
+
+    def setUp(self):
+        """Create a game that records telemetry to a temporary file"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "telemetry.jsonl")
+        self.telemetry = Telemetry()
+        self.telemetry.enable(self.path)
+        patcher = mock.patch("snake_game.game.TELEMETRY", self.telemetry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.replay_dir = Path(directory.name, "replays")
+
+        self.original_wall = CONFIG.WALL_COLLISION
+        CONFIG.WALL_COLLISION = True
+        self.game = SnakeGame(seed=1, replay_dir=self.replay_dir)
+        self.game.high_score_manager = HighScoreManager(
+            os.path.join(directory.name, "scores.json")
+        )
+
+    def tearDown(self):
+        """Restore original configuration and shut down pygame"""
+        self.game.high_score_manager.store.flush()
+        CONFIG.WALL_COLLISION = self.original_wall
+        pygame.quit()
+
+    def _play_until_game_over(self) -> None:
+        """Turn once and run into the wall"""
+        self.game.input_queue.push(Direction.UP, 0)
+        while self.game.state == GameState.PLAYING:
+            self.game.update()
+
+    def test_game_lifecycle_is_recorded(self):
+        """Test a game's start, turns and end are recorded"""
+        self._play_until_game_over()
+        self.telemetry.close()
+
+        with open(self.path) as f:
+            records = [json.loads(line) for line in f]
+        events = [record["event"] for record in records]
+        self.assertEqual(events[0], "game_start")
+        self.assertIn("direction", events)
+        self.assertEqual(events[-1], "game_over")
+
+        game_over = records[-1]
+        self.assertEqual(game_over["cause"], "hit_wall")
+        self.assertEqual(game_over["direction_changes"], 1)
+        self.assertTrue(game_over["wall_collision"])
+        self.assertEqual(game_over["tick"], self.game.simulator.ticks)
+
+    def test_replay_is_saved_to_replay_dir(self):
+        """Test a finished game's replay is written to the replay directory"""
+        self._play_until_game_over()
+        PERSISTENCE.flush()
+
+        (path,) = self.replay_dir.iterdir()
+        self.assertEqual(path.suffix, ".snkr")
+        self.assertEqual(
+            Replay.from_bytes(path.read_bytes()), self.game.last_replay
+        )
+
+    def test_replays_of_same_game_get_separate_files(self):
+        """Test same-seed games ending at the same time do not collide"""
+        self._play_until_game_over()
+        replay = self.game.last_replay
+        with mock.patch("snake_game.game.time.time_ns", return_value=0):
+            self.game._save_replay(replay, self.replay_dir)
+            self.game._save_replay(replay, self.replay_dir)
+        PERSISTENCE.flush()
+
+        self.assertEqual(len(list(self.replay_dir.iterdir())), 3)
+
+    def test_unsaveable_replay_keeps_high_score(self):
+        """Test a replay that does not fit the format still ends the game"""
+        self.game.simulator.base_seed = MAX_SEED + 1
+        self.game.reset_game()
+        self._play_until_game_over()
+
+        self.assertEqual(self.game.state, GameState.GAME_OVER)
+        self.assertFalse(self.replay_dir.exists())
+        (entry,) = self.game.high_score_manager.scores
+        self.assertEqual(entry["seed"], MAX_SEED + 1)
+
+    def test_seed_outside_replay_range_is_rejected(self):
+        """Test --seed only takes seeds a replay can store"""
+        self.assertEqual(parse_seed(str(MAX_SEED)), MAX_SEED)
+        for text in ("-1", str(MAX_SEED + 1)):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                parse_seed(text)
+
+    def test_no_replay_without_replay_dir(self):
+        """Test replays are only saved when a directory is given"""
+        self.game.replay_dir = None
+        with mock.patch("snake_game.game.PERSISTENCE") as persistence:
+            self._play_until_game_over()
+
+        self.assertIsNotNone(self.game.last_replay)
+        persistence.write.assert_not_called()
+        self.assertFalse(self.replay_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,20 @@
 Unit tests for game objects
 """
 
+import random
 import unittest
+import tracemalloc
 import pygame
-from snake_game.game_objects import Position, Direction, Snake, Food
+from snake_game.game_objects import (
+    Position,
+    Direction,
+    Snake,
+    SnakeBody,
+    Food,
+    FreeCells,
+    PositionTable,
+    current_position_table,
+)
 from snake_game.config import CONFIG
 
 
@@ -112,6 +123,44 @@ class TestPosition(unittest.TestCase):
         self.assertEqual(wrapped, Position(5, 5))
 
 
+class TestPositionTable(unittest.TestCase):
+    """Tests for interned positions and cell ids"""
+
+    def test_positions_are_interned(self):
+        """Test in-grid coordinates always map to the same object"""
+        table = PositionTable(4, 3)
+        self.assertIs(table.get(2, 1), table.get(2, 1))
+        self.assertIs(table.get(2, 1), table.from_cell(6))
+        self.assertEqual(table.cell_id(Position(2, 1)), 6)
+
+    def test_off_grid_positions(self):
+        """Test off-grid coordinates are valid but not interned"""
+        table = PositionTable(4, 3)
+        self.assertEqual(table.get(-1, 1), Position(-1, 1))
+        self.assertEqual(table.cell_id(Position(4, 0)), -1)
+
+    def test_step(self):
+        """Test stepping with and without wrap-around"""
+        table = PositionTable(4, 3)
+        corner = table.get(3, 0)
+
+        self.assertIs(
+            table.step(corner, Direction.RIGHT, True), table.get(0, 0)
+        )
+        self.assertIs(table.step(corner, Direction.UP, True), table.get(3, 2))
+        self.assertEqual(
+            table.step(corner, Direction.RIGHT, False), Position(4, 0)
+        )
+
+    def test_arithmetic_returns_interned_positions(self):
+        """Test Position helpers reuse the configured grid's positions"""
+        table = current_position_table()
+        self.assertIs(Position(1, 1) + Direction.RIGHT, table.get(2, 1))
+        self.assertIs(
+            Position(-1, 1).wrap_around(), table.get(CONFIG.grid_width - 1, 1)
+        )
+
+
 class TestSnake(unittest.TestCase):
     """Tests for Snake class"""
 
@@ -288,6 +337,164 @@ class TestSnake(unittest.TestCase):
         )
 
 
+class TestTickAllocations(unittest.TestCase):
+    """Tests that steady-state ticks do not grow the heap"""
+
+    def setUp(self):
+        self.original_wall_collision = CONFIG.WALL_COLLISION
+        CONFIG.WALL_COLLISION = False
+
+    def tearDown(self):
+        CONFIG.WALL_COLLISION = self.original_wall_collision
+
+    def _tick(self, snake: Snake, food: Food) -> None:
+        snake.move()
+        snake.check_collision()
+        snake.ate_food(food)
+
+    def test_no_heap_growth_per_tick(self):
+        """Test moving around the grid allocates no lasting memory"""
+        snake = Snake()
+        food = Food()
+        food.position = Position(-1, -1)  # Never eaten
+        laps = CONFIG.grid_width
+
+        tracemalloc.start()
+        try:
+            # Warm up: intern every cell on the snake's row
+            for _ in range(2 * laps):
+                self._tick(snake, food)
+            before = tracemalloc.get_traced_memory()[0]
+
+            for _ in range(20 * laps):
+                self._tick(snake, food)
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        # Allow for a single deque block being in flight
+        self.assertLess(after - before, 1024)
+
+
+class TestSnakeBody(unittest.TestCase):
+    """Tests for the deque-backed SnakeBody"""
+
+    def test_occupancy_follows_moves(self):
+        """Test occupancy index stays in sync with head/tail updates"""
+        body = SnakeBody([Position(2, 0), Position(1, 0), Position(0, 0)])
+
+        body.push_head(Position(3, 0))
+        self.assertEqual(body.pop_tail(), Position(0, 0))
+
+        self.assertEqual(len(body), 3)
+        self.assertIn(Position(3, 0), body)
+        self.assertNotIn(Position(0, 0), body)
+        self.assertEqual(body.occupancy(Position(0, 0)), 0)
+        self.assertEqual(body.head, Position(3, 0))
+        self.assertEqual(body.tail, Position(1, 0))
+
+    def test_overlapping_segments_are_counted(self):
+        """Test a cell covered twice keeps its count until both leave"""
+        body = SnakeBody([Position(1, 1), Position(1, 1)])
+        self.assertEqual(body.occupancy(Position(1, 1)), 2)
+
+        body.pop_tail()
+        self.assertIn(Position(1, 1), body)
+        self.assertEqual(body.occupancy(Position(1, 1)), 1)
+
+    def test_setitem_updates_occupancy(self):
+        """Test replacing a segment updates the occupancy index"""
+        body = SnakeBody([Position(1, 1), Position(0, 1)])
+        body[0] = Position(5, 5)
+
+        self.assertNotIn(Position(1, 1), body)
+        self.assertIn(Position(5, 5), body)
+        self.assertEqual(body[0], Position(5, 5))
+
+    def test_list_compatibility(self):
+        """Test the body still behaves like the old list for readers"""
+        segments = [Position(2, 0), Position(1, 0), Position(0, 0)]
+        body = SnakeBody(segments)
+
+        self.assertEqual(body, segments)
+        self.assertEqual(list(body), segments)
+        self.assertEqual(body[1:], segments[1:])
+        self.assertEqual(body[-1], Position(0, 0))
+
+    def test_snake_moving_into_vacated_tail_cell(self):
+        """Test chasing the tail is not a self collision"""
+        snake = Snake()
+        snake.body = [
+            Position(5, 5),
+            Position(5, 6),
+            Position(4, 6),
+            Position(4, 5),
+        ]
+        snake.direction = Direction.LEFT
+        snake.next_direction = Direction.LEFT
+
+        snake.move()
+
+        self.assertEqual(snake.body.head, Position(4, 5))
+        self.assertFalse(snake.check_collision())
+
+
+class TestFreeCells(unittest.TestCase):
+    """Tests for the free-cell index"""
+
+    def test_occupy_and_release(self):
+        """Test cells move in and out of the free set"""
+        free_cells = FreeCells(3, 2)
+        self.assertEqual(len(free_cells), 6)
+
+        free_cells.occupy(Position(1, 1))
+        free_cells.occupy(Position(1, 1))  # Already occupied, no-op
+        self.assertEqual(len(free_cells), 5)
+        self.assertNotIn(Position(1, 1), free_cells)
+
+        free_cells.release(Position(1, 1))
+        free_cells.release(Position(1, 1))  # Already free, no-op
+        self.assertEqual(len(free_cells), 6)
+        self.assertIn(Position(1, 1), free_cells)
+
+    def test_off_grid_positions_are_ignored(self):
+        """Test positions outside the grid never enter the index"""
+        free_cells = FreeCells(3, 2)
+        free_cells.occupy(Position(-1, 0))
+        free_cells.release(Position(3, 0))
+
+        self.assertEqual(len(free_cells), 6)
+        self.assertNotIn(Position(-1, 0), free_cells)
+
+    def test_sample_returns_only_free_cells(self):
+        """Test sampling never returns an occupied cell"""
+        free_cells = FreeCells(4, 4)
+        for x in range(4):
+            for y in range(4):
+                if (x, y) != (2, 3):
+                    free_cells.occupy(Position(x, y))
+
+        rng = random.Random(0)
+        for _ in range(10):
+            self.assertEqual(free_cells.sample(rng), Position(2, 3))
+
+        free_cells.occupy(Position(2, 3))
+        self.assertIsNone(free_cells.sample(rng))
+
+    def test_snake_keeps_free_cells_in_sync(self):
+        """Test the snake's free-cell index follows its moves"""
+        snake = Snake()
+        free_cells = snake.body.free_cells
+        total = CONFIG.grid_width * CONFIG.grid_height
+
+        for _ in range(5):
+            snake.grow()
+            snake.move()
+            self.assertEqual(len(free_cells), total - snake.get_length())
+            for segment in snake.body:
+                self.assertNotIn(segment, free_cells)
+
+
 class TestFood(unittest.TestCase):
     """Tests for Food class"""
 
@@ -336,6 +543,26 @@ class TestFood(unittest.TestCase):
         )
         self.assertEqual(self.food.position, expected_position)
 
+    def test_food_respawn_board_full(self):
+        """Test respawn reports a full board instead of failing"""
+        original_position = self.food.position
+        snake_positions = [
+            Position(x, y)
+            for x in range(CONFIG.grid_width)
+            for y in range(CONFIG.grid_height)
+        ]
+
+        self.assertFalse(self.food.respawn(snake_positions))
+        self.assertEqual(self.food.position, original_position)
+
+    def test_food_respawn_uses_snake_free_cells(self):
+        """Test respawn samples from the snake's free-cell index"""
+        snake = Snake()
+
+        self.assertTrue(self.food.respawn(snake.body))
+        self.assertNotIn(self.food.position, snake.body)
+        self.assertFalse(self.food.position.is_out_of_bounds())
+
 
 if __name__ == "__main__":
     unittest.main()
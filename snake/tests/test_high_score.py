@@ -2,6 +2,7 @@
 Unit tests for high score system
 """
 
+import json
 import unittest
 import tempfile
 import os
@@ -21,9 +22,11 @@ class TestHighScoreManager(unittest.TestCase):
         self.manager = HighScoreManager(file_path=self.temp_path, max_scores=3)
 
     def tearDown(self):
-        """Cleanup temporary file"""
-        if os.path.exists(self.temp_path):
-            os.unlink(self.temp_path)
+        """Cleanup temporary files"""
+        self.manager.store.flush()
+        for path in (self.temp_path, self.manager.store.path):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def test_empty_high_scores(self):
         """Test initial state with no high scores"""
@@ -107,6 +110,15 @@ class TestHighScoreManager(unittest.TestCase):
         self.assertEqual(len(self.manager.get_top_scores()), 0)
         self.assertEqual(self.manager.get_high_score(), 0)
 
+    def test_seed_is_stored(self):
+        """Test the game seed is saved with the score entry"""
+        self.manager.add_score(100, "Player1", seed=1234)
+        self.manager.add_score(50, "Player2")
+
+        top_scores = HighScoreManager(file_path=self.temp_path).get_top_scores()
+        self.assertEqual(top_scores[0]["seed"], 1234)
+        self.assertNotIn("seed", top_scores[1])
+
     def test_persistence(self):
         """Test that scores are saved and loaded from file"""
         # Add scores
@@ -120,6 +132,45 @@ class TestHighScoreManager(unittest.TestCase):
         self.assertEqual(new_manager.get_high_score(), 200)
         self.assertEqual(len(new_manager.get_top_scores()), 2)
 
+    def test_history_beyond_table_is_kept(self):
+        """Test scores below the table still count for players and ranks"""
+        for i in range(5):
+            self.manager.add_score(i * 10, f"Player{i}")
+
+        self.assertEqual(self.manager.get_player_best_score("Player0"), 0)
+        self.assertEqual(self.manager.get_player_best_score("Player1"), 10)
+        self.assertEqual(self.manager.get_rank(15), 4)
+        self.assertEqual(len(self.manager.store), 5)
+
+    def test_legacy_json_is_imported(self):
+        """Test scores from the old JSON file are imported once"""
+        self.manager.store.clear()
+        self.manager.store.flush()
+        os.unlink(self.manager.store.path)
+        with open(self.temp_path, "w") as f:
+            json.dump(
+                [
+                    {"score": 50, "player": "Old", "date": "", "timestamp": 0},
+                    {"score": 30, "player": "Old", "date": "", "timestamp": 0},
+                ],
+                f,
+            )
+
+        manager = HighScoreManager(file_path=self.temp_path)
+        self.assertEqual(manager.get_high_score(), 50)
+        manager.add_score(70, "New")
+
+        manager = HighScoreManager(file_path=self.temp_path)
+        self.assertEqual(len(manager.store), 3)
+
+    def test_managers_share_scores(self):
+        """Test a score added by one manager is seen by another"""
+        menu_manager = HighScoreManager(file_path=self.temp_path)
+        self.manager.add_score(100, "Player1")
+
+        self.assertIs(menu_manager.store, self.manager.store)
+        self.assertEqual(menu_manager.get_high_score(), 100)
+
     def test_corrupted_file_handling(self):
         """Test handling of corrupted score file"""
         # Write invalid JSON to file
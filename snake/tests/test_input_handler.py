@@ -4,8 +4,8 @@ Unit tests for input handler
 
 import unittest
 import pygame
-from snake_game.input_handler import InputHandler, InputAction
-from snake_game.game_objects import Direction
+from snake_game.input_handler import InputHandler, InputAction, InputQueue
+from snake_game.game_objects import Direction, Snake
 
 
 class TestInputHandler(unittest.TestCase):
@@ -112,6 +112,84 @@ class TestInputHandler(unittest.TestCase):
         expected_actions = {InputAction.MOVE_UP, InputAction.PAUSE}
         self.assertEqual(actions, expected_actions)
 
+    def test_ordered_actions(self):
+        """Test actions keep the order the keys were pressed in"""
+        events = [
+            pygame.event.Event(pygame.KEYDOWN, key=key)
+            for key in (pygame.K_LEFT, pygame.K_UP, pygame.K_LEFT)
+        ]
+
+        self.assertEqual(
+            self.handler.get_ordered_actions(events),
+            [InputAction.MOVE_LEFT, InputAction.MOVE_UP, InputAction.MOVE_LEFT],
+        )
+
+
+class TestInputQueue(unittest.TestCase):
+    """Tests for InputQueue class"""
+
+    def setUp(self):
+        """Setup a queue and a snake moving right"""
+        self.queue = InputQueue(depth=3)
+        self.snake = Snake()
+        self.snake.direction = self.snake.next_direction = Direction.RIGHT
+
+    def _tick(self, now_ms: int = 0):
+        """Apply one queued direction and move the snake"""
+        queued = self.queue.apply(self.snake, now_ms)
+        self.snake.move()
+        return queued
+
+    def test_one_direction_per_tick_in_order(self):
+        """Test queued directions are applied one per tick, in order"""
+        self.queue.push(Direction.UP, 0)
+        self.queue.push(Direction.LEFT, 0)
+
+        self._tick()
+        self.assertEqual(self.snake.direction, Direction.UP)
+        self._tick()
+        self.assertEqual(self.snake.direction, Direction.LEFT)
+        self.assertIsNone(self._tick())
+
+    def test_reverse_is_skipped(self):
+        """Test a reversal is discarded in favour of the next input"""
+        self.queue.push(Direction.LEFT, 0)
+        self.queue.push(Direction.DOWN, 0)
+
+        self._tick()
+
+        self.assertEqual(self.snake.direction, Direction.DOWN)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_depth_bounds_queue(self):
+        """Test presses beyond the depth are dropped"""
+        for direction in (Direction.UP, Direction.LEFT, Direction.DOWN):
+            self.assertTrue(self.queue.push(direction, 0))
+        self.assertFalse(self.queue.push(Direction.RIGHT, 0))
+
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual(self.queue.dropped, 1)
+
+    def test_repeated_direction_is_ignored(self):
+        """Test pressing the same key twice queues it once"""
+        self.queue.push(Direction.UP, 0)
+        self.assertFalse(self.queue.push(Direction.UP, 5))
+        self.assertEqual(len(self.queue), 1)
+
+    def test_latency_is_measured(self):
+        """Test the time from press to move is recorded"""
+        self.queue.push(Direction.UP, 100)
+        self._tick(now_ms=140)
+
+        stats = self.queue.latency_stats()
+        self.assertEqual(stats["moves"], 1)
+        self.assertEqual(stats["max_ms"], 40)
+
+    def test_invalid_depth(self):
+        """Test the queue depth must be positive"""
+        with self.assertRaises(ValueError):
+            InputQueue(depth=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the logging system
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from snake_game.logger import GameLogger
+
+
+class Counted:
+    """Counts how often it is formatted"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "counted"
+
+
+class TestGameLogger(unittest.TestCase):
+    """Tests for GameLogger class"""
+
+    def setUp(self):
+        """Create a logger writing to a temporary directory"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.log_dir = os.path.join(directory.name, "nested", "logs")
+        self.game_logger = GameLogger("SnakeGameTest")
+        self.addCleanup(self.game_logger.shutdown)
+        # Keep test output quiet
+        self.game_logger.logger.propagate = False
+
+    def _read_log(self) -> str:
+        """Stop logging and read what was written"""
+        self.game_logger.shutdown()
+        with open(os.path.join(self.log_dir, "snake_game.log")) as f:
+            return f.read()
+
+    def test_records_are_written_in_background(self):
+        """Test records reach the file once the queue is drained"""
+        self.game_logger.configure(self.log_dir, "DEBUG")
+        self.game_logger.debug("Moved to %s", (1, 2))
+        self.game_logger.warning("Careful")
+
+        contents = self._read_log()
+        self.assertIn("DEBUG - Moved to (1, 2)", contents)
+        self.assertIn("WARNING - Careful", contents)
+
+    def test_filtered_records_are_not_formatted(self):
+        """Test arguments of records below the level are never formatted"""
+        self.game_logger.configure(self.log_dir, logging.INFO)
+        counted = Counted()
+        self.game_logger.debug("Value %s", counted)
+        self.game_logger.info("Value %s", counted)
+
+        self.assertFalse(self.game_logger.is_enabled_for(logging.DEBUG))
+        self.assertIn("Value counted", self._read_log())
+        self.assertEqual(counted.formatted, 1)
+
+    def test_log_file_is_rotated(self):
+        """Test the log file is rotated once it reaches its size limit"""
+        self.game_logger.configure(
+            self.log_dir, "INFO", max_bytes=500, backup_count=2
+        )
+        for i in range(50):
+            self.game_logger.info("Record number %d", i)
+        self.game_logger.shutdown()
+
+        names = sorted(os.listdir(self.log_dir))
+        self.assertEqual(
+            names, ["snake_game.log", "snake_game.log.1", "snake_game.log.2"]
+        )
+        for name in names:
+            size = os.path.getsize(os.path.join(self.log_dir, name))
+            self.assertLessEqual(size, 500)
+
+    def test_unknown_level_is_rejected(self):
+        """Test a misspelled level name raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.game_logger.configure(self.log_dir, "LOUD")
+
+    def test_import_creates_no_log_directory(self):
+        """Test importing the package leaves the working directory alone"""
+        package_dir = os.path.dirname(os.path.dirname(__file__))
+        with tempfile.TemporaryDirectory() as directory:
+            subprocess.run(
+                [sys.executable, "-c", "import snake_game.game_objects"],
+                cwd=directory,
+                env={**os.environ, "PYTHONPATH": os.path.abspath(package_dir)},
+                check=True,
+                capture_output=True,
+            )
+            self.assertEqual(os.listdir(directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for the menu system
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pygame
+from snake_game.config import CONFIG
+from snake_game.high_score import HighScoreManager
+from snake_game.menu import MenuManager, MenuState
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+class TestMenuManager(unittest.TestCase):
+    """Tests for MenuManager class"""
+
+    def setUp(self):
+        """Setup a display and a menu manager for each test"""
+        pygame.init()
+        self.screen = pygame.display.set_mode(
+            (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
+        )
+        self.manager = MenuManager(self.screen)
+
+    def tearDown(self):
+        """Shut down pygame"""
+        pygame.quit()
+
+    def _key(self, key: int) -> pygame.event.Event:
+        """Create a key press event"""
+        return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+    def test_idle_menu_is_not_redrawn(self):
+        """Test timeouts without input do not redraw the menu"""
+        batches = [[], [], [], [pygame.event.Event(pygame.QUIT)]]
+        with mock.patch(
+            "snake_game.menu.wait_for_events", side_effect=batches
+        ), mock.patch.object(
+            self.manager, "draw", wraps=self.manager.draw
+        ) as draw:
+            result = self.manager.run()
+
+        self.assertEqual(result, MenuState.QUIT.value)
+        self.assertEqual(draw.call_count, 1)
+
+    def test_input_redraws_menu(self):
+        """Test each batch of input triggers one redraw"""
+        batches = [
+            [self._key(pygame.K_DOWN)],
+            [self._key(pygame.K_UP), self._key(pygame.K_DOWN)],
+            [self._key(pygame.K_ESCAPE)],
+        ]
+        with mock.patch(
+            "snake_game.menu.wait_for_events", side_effect=batches
+        ), mock.patch.object(
+            self.manager, "draw", wraps=self.manager.draw
+        ) as draw:
+            result = self.manager.run()
+
+        self.assertEqual(result, MenuState.QUIT.value)
+        self.assertEqual(draw.call_count, 3)
+        self.assertEqual(self.manager.main_menu.selected_item, 1)
+
+    def test_new_scores_redraw_high_score_menu(self):
+        """Test the high score screen updates when a score lands"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        scores = HighScoreManager(os.path.join(directory.name, "scores.json"))
+        self.addCleanup(scores.store.flush)
+        menu = self.manager.high_score_menu
+        menu.high_score_manager = scores
+        scores.add_listener(menu._on_scores_changed)
+        self.manager.current_state = MenuState.HIGH_SCORES
+
+        def score_lands():
+            scores.add_score(120, "Player1")
+            return []
+
+        batches = [score_lands, lambda: [pygame.event.Event(pygame.QUIT)]]
+        with mock.patch(
+            "snake_game.menu.wait_for_events",
+            side_effect=lambda: batches.pop(0)(),
+        ), mock.patch.object(
+            self.manager, "draw", wraps=self.manager.draw
+        ) as draw:
+            self.manager.run()
+
+        self.assertEqual(draw.call_count, 2)
+        self.assertEqual(menu._top_scores[0]["score"], 120)
+
+    def test_start_game(self):
+        """Test selecting Start Game leaves the menu"""
+        pygame.event.post(self._key(pygame.K_RETURN))
+        self.assertEqual(self.manager.run(), MenuState.GAME.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
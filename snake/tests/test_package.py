@@ -0,0 +1,57 @@
+"""
+Unit tests for the package's lazy imports
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+import snake_game
+
+
+def run_python(code: str) -> str:
+    """Run code in a fresh interpreter and return its output"""
+    package_dir = os.path.dirname(os.path.dirname(__file__))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": os.path.abspath(package_dir)},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+class TestLazyImports(unittest.TestCase):
+    """Tests for loading the package's contents on first use"""
+
+    def test_version_does_not_load_pygame(self):
+        """Test importing the package loads none of the game"""
+        output = run_python(
+            "import sys, snake_game; "
+            "print(snake_game.__version__, 'pygame' in sys.modules, "
+            "'snake_game.game' in sys.modules)"
+        )
+        self.assertEqual(
+            output.split(), [snake_game.__version__, "False", "False"]
+        )
+
+    def test_public_names_resolve(self):
+        """Test the exported names and submodules load on access"""
+        from snake_game.config import CONFIG
+        from snake_game.game import SnakeGame
+
+        self.assertIs(snake_game.CONFIG, CONFIG)
+        self.assertIs(snake_game.SnakeGame, SnakeGame)
+        self.assertIs(
+            snake_game.simulation, sys.modules["snake_game.simulation"]
+        )
+        self.assertIn("SnakeGame", dir(snake_game))
+
+    def test_unknown_name_raises(self):
+        """Test a missing attribute is still an AttributeError"""
+        with self.assertRaises(AttributeError):
+            snake_game.missing
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Unit tests for write-behind persistence
+"""
+
+import os
+import stat
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from snake_game import persistence
+from snake_game.persistence import WriteBehind, atomic_write
+
+
+class TestWriteBehind(unittest.TestCase):
+    """Tests for WriteBehind class"""
+
+    def setUp(self):
+        """Setup a writer and a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "data.json")
+        self.writer = WriteBehind(delay=0.01)
+
+    def tearDown(self):
+        """Stop the writer and remove the directory"""
+        self.writer.close()
+        self.directory.cleanup()
+
+    def _read(self) -> str:
+        with open(self.path) as f:
+            return f.read()
+
+    def test_write_and_flush(self):
+        """Test a queued write is on disk after flush"""
+        self.writer.write(self.path, "hello")
+        self.writer.flush(self.path)
+        self.assertEqual(self._read(), "hello")
+
+    def test_rapid_writes_are_coalesced(self):
+        """Test only the latest contents are written for a burst"""
+        release = threading.Event()
+        calls = []
+
+        def slow_write(path, data):
+            calls.append(data)
+            release.wait(5)
+            with open(path, "w") as f:
+                f.write(data)
+
+        with mock.patch.object(persistence, "atomic_write", slow_write):
+            self.writer.write(self.path, "first")
+            # Wait for the worker to start on the first write
+            while not calls:
+                time.sleep(0.001)
+            for i in range(10):
+                self.writer.write(self.path, f"v{i}")
+            release.set()
+            self.writer.flush()
+
+        self.assertEqual(calls, ["first", "v9"])
+        self.assertEqual(self._read(), "v9")
+
+    def test_pending(self):
+        """Test a write is pending until it is on disk"""
+        self.assertFalse(self.writer.pending(self.path))
+        self.writer.write(self.path, "hello")
+        self.assertTrue(self.writer.pending(self.path))
+        self.assertTrue(self.writer.pending())
+
+        self.writer.flush(self.path)
+        self.assertFalse(self.writer.pending(self.path))
+
+    def test_appends_keep_order(self):
+        """Test appends after a replacement are applied in order"""
+        self.writer.append(self.path, "a\n")
+        self.writer.write(self.path, "")
+        self.writer.append(self.path, "b\n")
+        self.writer.append(self.path, "c\n")
+        self.writer.flush()
+
+        self.assertEqual(self._read(), "b\nc\n")
+
+    def test_close_flushes(self):
+        """Test closing writes everything still queued"""
+        self.writer.append(self.path, "x")
+        self.writer.close()
+        self.assertEqual(self._read(), "x")
+
+    def test_failed_write_is_logged(self):
+        """Test a write error does not stop the worker"""
+        bad_path = os.path.join(self.directory.name, "missing", "data.json")
+        with mock.patch.object(persistence.logger, "error") as error:
+            self.writer.write(bad_path, "lost")
+            self.writer.write(self.path, "kept")
+            self.writer.flush()
+
+        error.assert_called_once()
+        self.assertEqual(self._read(), "kept")
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Tests for atomic_write function"""
+
+    def test_failed_write_keeps_old_file(self):
+        """Test an interrupted write leaves the old contents intact"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.json")
+            atomic_write(path, "old")
+
+            with mock.patch("os.replace", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    atomic_write(path, "new")
+
+            with open(path) as f:
+                self.assertEqual(f.read(), "old")
+            self.assertEqual(os.listdir(directory), ["config.json"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_file_permissions(self):
+        """Test new files follow the umask and rewrites keep the mode"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.json")
+            atomic_write(path, "new")
+            self.assertEqual(
+                stat.S_IMODE(os.stat(path).st_mode),
+                0o666 & ~persistence._UMASK,
+            )
+
+            os.chmod(path, 0o640)
+            atomic_write(path, "rewritten")
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Unit tests for the incremental dirty-rectangle renderer
+"""
+
+import os
+import random
+import unittest
+import pygame
+from snake_game.config import CONFIG, COLORS
+from snake_game.game_objects import Direction, Position
+from snake_game.renderer import DirtyRectRenderer, draw_motion
+from snake_game.simulation import SnakeSimulator
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+class TestDirtyRectRenderer(unittest.TestCase):
+    """Tests for DirtyRectRenderer class"""
+
+    def setUp(self):
+        """Setup a display and a simulator for each test"""
+        self.original_wall_collision = CONFIG.WALL_COLLISION
+        CONFIG.WALL_COLLISION = False
+        pygame.init()
+        self.screen = pygame.display.set_mode(
+            (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
+        )
+        self.font = pygame.font.Font(None, 36)
+        self.renderer = DirtyRectRenderer(self.screen)
+        self.sim = SnakeSimulator(seed=4)
+
+    def tearDown(self):
+        """Restore original configuration after each test"""
+        CONFIG.WALL_COLLISION = self.original_wall_collision
+        pygame.quit()
+
+    def _hud_drawer(self, surface: pygame.Surface):
+        """Get a HUD drawer for the given surface"""
+
+        def draw_hud():
+            text = f"Score: {self.sim.score}"
+            return [
+                surface.blit(
+                    self.font.render(text, True, COLORS.WHITE), (10, 10)
+                )
+            ]
+
+        return draw_hud
+
+    def _draw(self, alpha: float = 1.0):
+        """Draw the current simulator state incrementally"""
+        return self.renderer.draw(
+            self.sim.snake,
+            self.sim.food,
+            self.sim.score,
+            self._hud_drawer(self.screen),
+            alpha,
+        )
+
+    def _reference(self, alpha: float = 1.0) -> bytes:
+        """Render the current state from scratch"""
+        surface = pygame.Surface(self.screen.get_size())
+        surface.fill(COLORS.BLACK)
+        self.sim.snake.draw(surface)
+        self.sim.food.draw(surface)
+        hud_rect = self._hud_drawer(surface)()[0]
+        draw_motion(surface, self.sim.snake, self.sim.food, alpha, hud_rect)
+        return pygame.image.tostring(surface, "RGB")
+
+    def test_matches_full_redraw(self):
+        """Test incremental frames look exactly like full redraws"""
+        rng = random.Random(1)
+        for _ in range(600):
+            if self.sim.done:
+                self.sim.reset()
+                self.renderer.invalidate()
+            # Feed the snake often so it grows and the HUD changes
+            if rng.random() < 0.3:
+                head = self.sim.snake.body.head
+                target = Position((head.x + 1) % CONFIG.grid_width, head.y)
+                if target not in self.sim.snake.body:
+                    self.sim.food.position = target
+            self.sim.step(rng.choice([None, None, *Direction]))
+            if self.sim.done:
+                # The game shows its game over screen instead
+                continue
+            self._draw()
+
+            self.assertEqual(
+                pygame.image.tostring(self.screen, "RGB"), self._reference()
+            )
+
+    def test_interpolated_frames_match_full_redraw(self):
+        """Test frames between ticks look like interpolated full redraws"""
+        rng = random.Random(2)
+        for _ in range(200):
+            if self.sim.done:
+                self.sim.reset()
+                self.renderer.invalidate()
+            self.sim.step(rng.choice([None, None, *Direction]))
+            if self.sim.done:
+                continue
+            for alpha in (0.0, 0.25, 0.5, 0.75):
+                self._draw(alpha)
+                self.assertEqual(
+                    pygame.image.tostring(self.screen, "RGB"),
+                    self._reference(alpha),
+                )
+
+    def test_head_slides_between_cells(self):
+        """Test the head is drawn part-way to its new cell"""
+        size = CONFIG.GRID_SIZE
+        snake = self.sim.snake
+        snake.body = [Position(10, 10), Position(9, 10), Position(8, 10)]
+        snake.direction = snake.next_direction = Direction.RIGHT
+        self.sim.food.position = Position(0, CONFIG.grid_height - 1)
+        self.sim.step()
+
+        self._draw(0.5)
+
+        # The head tile starts half a cell into the old head cell
+        x = 10 * size + size // 2 + 1
+        color = tuple(self.screen.get_at((x, 10 * size + 1)))[:3]
+        self.assertEqual(color, COLORS.DARK_GREEN)
+        # ...and has not reached the far side of its new cell
+        color = tuple(self.screen.get_at((12 * size - 2, 10 * size + 1)))
+        self.assertEqual(color[:3], COLORS.BLACK)
+
+    def test_no_interpolation_across_wrap(self):
+        """Test a head that wrapped around is drawn in its new cell"""
+        snake = self.sim.snake
+        snake.body = [Position(0, 10), Position(1, 10), Position(2, 10)]
+        snake.direction = snake.next_direction = Direction.LEFT
+        self.sim.food.position = Position(5, 5)
+        self.sim.step()
+
+        self.assertEqual(
+            draw_motion(self.screen, snake, self.sim.food, 0.5),
+            {Position(2, 10), Position(1, 10)},
+        )
+
+    def test_first_frame_is_full(self):
+        """Test the first frame redraws the whole screen"""
+        dirty = self._draw()
+        self.assertEqual(dirty, [self.screen.get_rect()])
+
+    def test_move_repaints_few_cells(self):
+        """Test a move repaints a constant number of cells"""
+        snake = self.sim.snake
+        table_row = CONFIG.grid_height - 2
+        snake.body = [
+            Position(x, table_row) for x in range(CONFIG.grid_width - 1, 0, -1)
+        ]
+        snake.direction = snake.next_direction = Direction.UP
+        self.sim.food.position = Position(0, CONFIG.grid_height - 1)
+        self._draw()
+
+        self.sim.step()
+        dirty = self._draw()
+
+        # New head, old head and the vacated tail
+        self.assertEqual(len(dirty), 3)
+
+    def test_jump_falls_back_to_full_redraw(self):
+        """Test several ticks between frames trigger a full redraw"""
+        self.sim.food.position = Position(0, 0)
+        self._draw()
+
+        self.sim.step()
+        self.sim.step()
+        dirty = self._draw()
+
+        self.assertEqual(dirty, [self.screen.get_rect()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Unit tests for replay recording and playback
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from snake_game.config import CONFIG
+from snake_game.game_objects import Direction
+from snake_game.replay import (
+    Replay,
+    ReplayError,
+    ReplayPlayer,
+    ReplayRecorder,
+    main,
+)
+from snake_game.simulation import SnakeSimulator
+
+
+def record_game(seed: int, max_ticks: int = 10_000) -> Replay:
+    """Play a random game like SnakeGame.update() and record it"""
+    rng = random.Random(seed)
+    recorder = ReplayRecorder()
+    sim = SnakeSimulator(seed)
+    recorder.start(sim.seed)
+
+    while not sim.done and sim.ticks < max_ticks:
+        action = None
+        if rng.random() < 0.05:
+            action = rng.choice(list(Direction))
+            recorder.record(sim.ticks, action)
+        sim.step(action)
+
+    replay = recorder.finish(sim.ticks, sim.score)
+    assert replay is not None
+    return replay
+
+
+class TestReplay(unittest.TestCase):
+    """Tests for Replay, ReplayRecorder and ReplayPlayer"""
+
+    def setUp(self):
+        """Setup for each test"""
+        # main() also loads config.json into the shared CONFIG
+        settings = CONFIG.to_dict()
+        loaded = CONFIG._loaded
+
+        def restore_config():
+            for name, value in settings.items():
+                setattr(CONFIG, name, value)
+            CONFIG._loaded = loaded
+
+        self.addCleanup(restore_config)
+        CONFIG.WALL_COLLISION = False
+
+    def test_round_trip(self):
+        """Test a replay survives encoding and decoding"""
+        replay = record_game(seed=5, max_ticks=2000)
+        decoded = Replay.from_bytes(replay.to_bytes())
+
+        self.assertEqual(decoded, replay)
+
+    def test_long_game_is_compact(self):
+        """Test a 10k-tick game encodes to a few hundred bytes"""
+        replay = record_game(seed=11)
+        self.assertEqual(replay.ticks, 10_000)
+
+        # Roughly one in twenty ticks changes direction here, far more
+        # often than a human player does
+        self.assertLess(len(replay.to_bytes()), 1200)
+
+    def test_player_reproduces_game(self):
+        """Test playback ends with the recorded score and length"""
+        for seed in range(5):
+            replay = record_game(seed, max_ticks=3000)
+            sim = ReplayPlayer(replay).play()
+
+            self.assertEqual(sim.ticks, replay.ticks)
+            self.assertEqual(sim.score, replay.score)
+
+    def test_verify_detects_tampered_score(self):
+        """Test a replay with an edited score fails verification"""
+        replay = record_game(seed=3, max_ticks=2000)
+        self.assertTrue(ReplayPlayer(replay).verify())
+
+        replay.score += CONFIG.POINTS_PER_FOOD
+        self.assertFalse(ReplayPlayer(replay).verify())
+
+    def test_playback_uses_recorded_rules(self):
+        """Test playback applies the recorded settings and restores CONFIG"""
+        CONFIG.WALL_COLLISION = True
+        replay = record_game(seed=2, max_ticks=2000)
+        CONFIG.WALL_COLLISION = False
+
+        self.assertTrue(ReplayPlayer(replay).verify())
+        self.assertFalse(CONFIG.WALL_COLLISION)
+
+    def test_invalid_data(self):
+        """Test malformed replay data is rejected"""
+        data = record_game(seed=1, max_ticks=500).to_bytes()
+
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(b"XXXX" + data[4:])
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(data[:10])
+
+    def test_main_reports_result(self):
+        """Test the CLI exits with 0 for a matching replay"""
+        fd, path = tempfile.mkstemp(suffix=".snkr")
+        os.close(fd)
+        try:
+            replay = record_game(seed=8, max_ticks=1000)
+            replay.save(path)
+            self.assertEqual(main([path]), 0)
+
+            replay.score += 1
+            replay.save(path)
+            self.assertEqual(main([path]), 1)
+        finally:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for the multiprocess rollout pool
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from snake_game.config import CONFIG
+from snake_game.logger import logger
+from snake_game.rollout import (
+    AGENTS,
+    RolloutJob,
+    RolloutPool,
+    main,
+    play_game,
+)
+
+
+class TestRollout(unittest.TestCase):
+    """Tests for rollout helpers and RolloutPool"""
+
+    def setUp(self):
+        """Setup for each test"""
+        self.original_wall_collision = CONFIG.WALL_COLLISION
+
+    def tearDown(self):
+        """Restore original configuration after each test"""
+        CONFIG.WALL_COLLISION = self.original_wall_collision
+
+    def test_play_game_is_reproducible(self):
+        """Test the same job plays the same game"""
+        job = RolloutJob(agent="random", seed=3, max_ticks=500)
+        first = play_game(job)
+        second = play_game(job)
+
+        self.assertEqual(first.score, second.score)
+        self.assertEqual(first.ticks, second.ticks)
+        self.assertEqual(first.death_cause, second.death_cause)
+
+    def test_max_ticks(self):
+        """Test games stop at their tick limit"""
+        job = RolloutJob(
+            agent="straight",
+            seed=1,
+            config={"WALL_COLLISION": False},
+            max_ticks=50,
+        )
+        sim = play_game(job)
+
+        self.assertEqual(sim.ticks, 50)
+        self.assertFalse(sim.done)
+
+    def test_config_overrides_are_restored(self):
+        """Test per-job config overrides do not leak"""
+        CONFIG.WALL_COLLISION = False
+        play_game(RolloutJob(agent="straight", config={"WALL_COLLISION": True}))
+        self.assertFalse(CONFIG.WALL_COLLISION)
+
+    def test_greedy_agent_eats(self):
+        """Test the greedy agent scores points"""
+        sim = play_game(RolloutJob(agent="greedy", seed=5, max_ticks=2000))
+        self.assertGreater(sim.score, 0)
+
+    def test_pool_matches_in_process_games(self):
+        """Test pooled results match games played in this process"""
+        jobs = [
+            RolloutJob(agent=agent, seed=seed, max_ticks=300)
+            for agent in sorted(AGENTS)
+            for seed in range(3)
+        ]
+        results = RolloutPool(workers=2, shard_size=2).run(jobs)
+
+        self.assertEqual(len(results), len(jobs))
+        for job, result in zip(jobs, results):
+            sim = play_game(job)
+            self.assertEqual(result["agent"], job.agent)
+            self.assertEqual(result["seed"], job.seed)
+            self.assertEqual(result["score"], sim.score)
+            self.assertEqual(result["ticks"], sim.ticks)
+            self.assertEqual(result["length"], sim.length)
+            if sim.death_cause is None:
+                self.assertEqual(result["cause"], "max_ticks")
+            else:
+                self.assertEqual(result["cause"], sim.death_cause.value)
+
+    def _isolate_cli(self, directory: str) -> None:
+        """Keep main()'s logging and config loading out of the tree"""
+        settings = CONFIG.to_dict()
+        loaded = CONFIG._loaded
+
+        def restore_config():
+            for name, value in settings.items():
+                setattr(CONFIG, name, value)
+            CONFIG._loaded = loaded
+
+        self.addCleanup(restore_config)
+        log_dir = os.path.join(directory, "logs")
+        patcher = mock.patch.dict(os.environ, {"SNAKE_LOG_DIR": log_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Runs first: stops the listener main() started
+        self.addCleanup(logger.shutdown)
+
+    def test_cli_writes_jsonl(self):
+        """Test the command line entry point"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self._isolate_cli(directory.name)
+        output = os.path.join(directory.name, "results.jsonl")
+        exit_code = main(
+            [
+                "--games",
+                "4",
+                "--workers",
+                "2",
+                "--max-ticks",
+                "100",
+                "--output",
+                output,
+            ]
+        )
+        with open(output, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([r["seed"] for r in lines], [0, 1, 2, 3])
+        self.assertEqual(
+            logger.log_file,
+            Path(directory.name, "logs", "snake_game.log"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
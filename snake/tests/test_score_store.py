@@ -0,0 +1,251 @@
+"""
+Unit tests for the append-only score store
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from snake_game.score_store import ScoreStore, get_score_store
+
+
+def entry(score: int, player: str = "Player") -> dict:
+    """Build a score entry"""
+    return {"score": score, "player": player, "date": "", "timestamp": 0.0}
+
+
+class TestScoreStore(unittest.TestCase):
+    """Tests for ScoreStore class"""
+
+    def setUp(self):
+        """Setup a store in a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "scores.jsonl")
+        self.store = ScoreStore(self.path)
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.store.flush()
+        self.directory.cleanup()
+
+    def test_top_scores_best_first(self):
+        """Test the top list is ordered by score, earliest first on ties"""
+        for score, player in ((10, "a"), (30, "b"), (20, "c"), (30, "d")):
+            self.store.add(entry(score, player))
+
+        top = self.store.top(3)
+        self.assertEqual([e["player"] for e in top], ["b", "d", "c"])
+        self.assertEqual(self.store.top(0), [])
+
+    def test_rank(self):
+        """Test a score's rank counts the strictly better scores"""
+        for score in (50, 40, 40, 10):
+            self.store.add(entry(score))
+
+        self.assertEqual(self.store.rank(60), 1)
+        self.assertEqual(self.store.rank(40), 2)
+        self.assertEqual(self.store.rank(20), 4)
+        self.assertEqual(self.store.rank(0), 5)
+
+    def test_player_best(self):
+        """Test each player's best score is tracked"""
+        self.store.add(entry(10, "alice"))
+        self.store.add(entry(30, "alice"))
+        self.store.add(entry(20, "alice"))
+
+        self.assertEqual(self.store.player_best("alice"), 30)
+        self.assertEqual(self.store.player_best("bob"), 0)
+
+    def test_add_appends_one_line(self):
+        """Test adding a score appends instead of rewriting the file"""
+        self.store.add(entry(10))
+        self.store.flush()
+        size = os.path.getsize(self.path)
+        self.store.add(entry(20))
+        self.store.flush()
+
+        with open(self.path) as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(os.path.getsize(self.path), size + len(lines[1]))
+
+    def test_reload(self):
+        """Test a new store sees the saved scores"""
+        self.store.add(entry(10, "a"))
+        self.store.add(entry(20, "b"))
+
+        store = ScoreStore(self.path)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.top(1)[0]["player"], "b")
+
+    def test_load_sorts_once(self):
+        """Test loading indexes the log with one sort, keeping tie order"""
+        self.store.add_many(
+            entry(score, player)
+            for score, player in ((10, "a"), (30, "b"), (20, "a"), (30, "c"))
+        )
+        self.store.flush()
+
+        with mock.patch("snake_game.score_store.insort") as insort:
+            store = ScoreStore(self.path)
+        insort.assert_not_called()
+        self.assertEqual([e["player"] for e in store.top(4)], list("bcaa"))
+        self.assertEqual(store.rank(30), 1)
+        self.assertEqual(store.player_best("a"), 20)
+
+    def test_truncated_record_is_skipped(self):
+        """Test a record cut short by a crash does not break the log"""
+        self.store.add(entry(10))
+        self.store.flush()
+        with open(self.path, "a") as f:
+            f.write('{"score": 99, "pla')
+
+        store = ScoreStore(self.path)
+        self.assertEqual(len(store), 1)
+        store.add(entry(20))
+
+        self.assertEqual(len(ScoreStore(self.path)), 2)
+
+    def test_import_json(self):
+        """Test bulk import from a high score JSON file"""
+        json_path = os.path.join(self.directory.name, "high_scores.json")
+        with open(json_path, "w") as f:
+            json.dump([entry(10), entry(40), {"bad": True}], f)
+
+        self.assertEqual(self.store.import_json(json_path), 2)
+        self.assertEqual(self.store.top(1)[0]["score"], 40)
+        self.assertEqual(len(ScoreStore(self.path)), 2)
+
+    def test_import_invalid_json(self):
+        """Test importing a file that is not a score list fails"""
+        json_path = os.path.join(self.directory.name, "high_scores.json")
+        with open(json_path, "w") as f:
+            json.dump({"score": 10}, f)
+
+        with self.assertRaises(ValueError):
+            self.store.import_json(json_path)
+
+    def test_clear(self):
+        """Test clearing empties the store and its file"""
+        self.store.add(entry(10))
+        self.store.clear()
+
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(len(ScoreStore(self.path)), 0)
+        self.store.flush()
+        self.assertTrue(os.path.exists(self.path))
+
+
+class TestSharedScoreStore(unittest.TestCase):
+    """Tests for the process-wide score store"""
+
+    def setUp(self):
+        """Setup a shared store in a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "scores.jsonl")
+        self.store = get_score_store(self.path)
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.store.flush()
+        self.directory.cleanup()
+
+    def _write_from_other_process(self, score: int) -> None:
+        """Append a record as another game process would"""
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry(score, "other")) + "\n")
+
+    def test_same_file_same_store(self):
+        """Test every caller gets the same in-memory store"""
+        relative = os.path.relpath(self.path)
+        self.assertIs(get_score_store(relative), self.store)
+
+    def test_own_writes_do_not_reload(self):
+        """Test the store does not re-read scores it wrote itself"""
+        self.store.add(entry(10))
+        self.store.add(entry(20))
+
+        with mock.patch.object(self.store, "_load") as load:
+            self.assertFalse(self.store.refresh())
+        load.assert_not_called()
+
+    def test_reload_on_external_change(self):
+        """Test scores from another process are picked up"""
+        self.store.add(entry(10))
+        self.store.flush()
+        self._write_from_other_process(99)
+
+        self.assertTrue(self.store.refresh())
+        self.assertEqual(self.store.top(1)[0]["player"], "other")
+        self.assertEqual(len(self.store), 2)
+        self.assertFalse(self.store.refresh())
+
+    def test_refresh_reads_only_appended_records(self):
+        """Test another process's records are read without a reload"""
+        self.store.add_many(entry(score) for score in (10, 40, 20))
+        self.store.flush()
+        self._write_from_other_process(30)
+        self._write_from_other_process(50)
+
+        with mock.patch.object(self.store, "_load") as load:
+            self.assertTrue(self.store.refresh())
+        load.assert_not_called()
+        self.assertEqual(
+            [e["score"] for e in self.store.top(5)], [50, 40, 30, 20, 10]
+        )
+        self.assertEqual(self.store.player_best("other"), 50)
+
+        # Own records still go to the end and are not read back
+        self.store.add(entry(35))
+        self.assertFalse(self.store.refresh())
+        self.assertEqual(self.store.rank(35), 3)
+        self.assertEqual(len(ScoreStore(self.path)), 6)
+
+    def test_interleaved_append_is_reloaded(self):
+        """Test a record written between ours and our read is not lost"""
+        self.store.add(entry(10))
+        self.store.flush()
+        with mock.patch("snake_game.score_store.PERSISTENCE") as persistence:
+            self.store.add(entry(35))
+        (_, lines), _ = persistence.append.call_args
+        # Another process appends before this store's queued write lands
+        self._write_from_other_process(30)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+        self._write_from_other_process(50)
+
+        self.assertTrue(self.store.refresh())
+        self.assertEqual(
+            [e["score"] for e in self.store.top(5)], [50, 35, 30, 10]
+        )
+
+    def test_shrunk_log_is_reloaded(self):
+        """Test a log rewritten shorter by another process is reloaded"""
+        self.store.add_many(entry(score) for score in (10, 20, 30))
+        self.store.flush()
+        with open(self.path, "w") as f:
+            f.write(json.dumps(entry(5, "other")) + "\n")
+
+        self.assertTrue(self.store.refresh())
+        self.assertEqual([e["score"] for e in self.store.top(5)], [5])
+
+    def test_listeners_are_notified(self):
+        """Test listeners hear about new and reloaded scores"""
+        listener = mock.Mock()
+        self.store.add_listener(listener)
+
+        self.store.add(entry(10))
+        self.assertEqual(listener.call_count, 1)
+        self.store.flush()
+        self._write_from_other_process(20)
+        self.store.refresh()
+        self.assertEqual(listener.call_count, 2)
+
+        self.store.remove_listener(listener)
+        self.store.add(entry(30))
+        self.assertEqual(listener.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Unit tests for the headless simulation core
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from snake_game.config import CONFIG
+from snake_game.game_objects import Direction, Position
+from snake_game.simulation import SimEvent, SnakeSimulator
+
+
+class TestSnakeSimulator(unittest.TestCase):
+    """Tests for SnakeSimulator class"""
+
+    def setUp(self):
+        """Setup for each test"""
+        self.original_wall_collision = CONFIG.WALL_COLLISION
+        CONFIG.WALL_COLLISION = False
+        self.sim = SnakeSimulator()
+
+    def tearDown(self):
+        """Restore original configuration after each test"""
+        CONFIG.WALL_COLLISION = self.original_wall_collision
+
+    def test_initial_state(self):
+        """Test a fresh simulator starts a running game"""
+        self.assertEqual(self.sim.score, 0)
+        self.assertEqual(self.sim.ticks, 0)
+        self.assertFalse(self.sim.done)
+        self.assertEqual(self.sim.length, CONFIG.INITIAL_SNAKE_LENGTH)
+        self.assertNotIn(self.sim.food.position, self.sim.snake.body)
+
+    def test_step_moves_snake(self):
+        """Test a step moves the snake and applies the action"""
+        head = self.sim.snake.body.head
+        self.sim.food.position = Position(0, 0)
+
+        events = self.sim.step(Direction.UP)
+
+        self.assertEqual(events, [SimEvent.MOVED])
+        self.assertEqual(self.sim.snake.body.head, Position(head.x, head.y - 1))
+        self.assertEqual(self.sim.ticks, 1)
+
+    def test_reverse_action_is_ignored(self):
+        """Test reverse directions are rejected like in the game"""
+        head = self.sim.snake.body.head
+        self.sim.food.position = Position(0, 0)
+
+        self.sim.step(Direction.LEFT)
+
+        self.assertEqual(self.sim.snake.body.head, Position(head.x + 1, head.y))
+
+    def test_eating_food(self):
+        """Test eating food scores, grows and respawns the food"""
+        head = self.sim.snake.body.head
+        self.sim.food.position = Position(head.x + 1, head.y)
+
+        events = self.sim.step()
+        self.assertEqual(events, [SimEvent.MOVED, SimEvent.ATE_FOOD])
+        self.assertEqual(self.sim.score, CONFIG.POINTS_PER_FOOD)
+        self.assertEqual(self.sim.food_eaten, 1)
+        self.assertNotIn(self.sim.food.position, self.sim.snake.body)
+
+        self.sim.step()
+        self.assertEqual(self.sim.length, CONFIG.INITIAL_SNAKE_LENGTH + 1)
+
+    def test_wall_death(self):
+        """Test hitting a wall ends the game when walls are enabled"""
+        CONFIG.WALL_COLLISION = True
+        sim = SnakeSimulator()
+        sim.food.position = Position(0, 0)
+
+        events = []
+        for _ in range(CONFIG.grid_width):
+            events = sim.step(Direction.UP)
+            if sim.done:
+                break
+
+        self.assertIn(SimEvent.HIT_WALL, events)
+        self.assertEqual(sim.death_cause, SimEvent.HIT_WALL)
+        self.assertEqual(sim.step(), [])
+
+    def test_self_death(self):
+        """Test running into the body ends the game"""
+        self.sim.snake.body = [
+            Position(5, 5),
+            Position(4, 5),
+            Position(4, 6),
+            Position(5, 6),
+            Position(6, 6),
+        ]
+        self.sim.snake.direction = Direction.RIGHT
+        self.sim.food.position = Position(0, 0)
+
+        events = self.sim.step(Direction.DOWN)
+
+        self.assertEqual(events, [SimEvent.MOVED, SimEvent.HIT_SELF])
+        self.assertTrue(self.sim.done)
+        self.assertFalse(self.sim.board_full)
+
+    def test_board_full(self):
+        """Test filling the board ends the game as a win"""
+        head = self.sim.snake.body.head
+        self.sim.food.position = Position(head.x + 1, head.y)
+        free_cells = self.sim.snake.body.free_cells
+        # Keep the tail in place and leave only the food cell free
+        self.sim.snake.grow()
+        for x in range(CONFIG.grid_width):
+            for y in range(CONFIG.grid_height):
+                if (x, y) != (head.x + 1, head.y):
+                    free_cells.occupy(Position(x, y))
+
+        events = self.sim.step()
+
+        self.assertEqual(
+            events,
+            [SimEvent.MOVED, SimEvent.ATE_FOOD, SimEvent.BOARD_FULL],
+        )
+        self.assertTrue(self.sim.board_full)
+        self.assertEqual(self.sim.death_cause, SimEvent.BOARD_FULL)
+
+    def test_reset(self):
+        """Test reset starts a new game"""
+        self.sim.step()
+        self.sim.reset()
+
+        self.assertEqual(self.sim.ticks, 0)
+        self.assertFalse(self.sim.done)
+        self.assertIsNone(self.sim.death_cause)
+
+    def test_same_seed_replays_same_game(self):
+        """Test a seed and an action sequence fully determine a game"""
+        actions = [Direction.UP, None, Direction.LEFT, None, Direction.DOWN]
+
+        def play(seed: int) -> list:
+            sim = SnakeSimulator(seed)
+            foods = [sim.food.position]
+            for i in range(500):
+                if sim.done:
+                    break
+                sim.step(actions[i % len(actions)])
+                foods.append(sim.food.position)
+            return foods
+
+        self.assertEqual(play(42), play(42))
+        self.assertNotEqual(play(42), play(43))
+
+    def test_seed_is_kept_across_resets(self):
+        """Test a fixed seed is reused and a random one is drawn otherwise"""
+        sim = SnakeSimulator(1234)
+        sim.reset()
+        self.assertEqual(sim.seed, 1234)
+
+        sim.reset(99)
+        self.assertEqual(sim.seed, 99)
+
+        self.assertIsInstance(self.sim.seed, int)
+
+    def test_does_not_import_pygame(self):
+        """Test the simulation core imports and runs without pygame"""
+        code = (
+            "import sys\n"
+            "from snake_game.simulation import SnakeSimulator\n"
+            "SnakeSimulator().step()\n"
+            "assert 'pygame' not in sys.modules\n"
+        )
+        package_dir = os.path.dirname(os.path.dirname(__file__))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONPATH": os.path.abspath(package_dir)},
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the tile sprite cache
+"""
+
+import os
+import unittest
+import pygame
+from snake_game import config
+from snake_game.config import CONFIG, COLORS
+from snake_game.game_objects import Food, Position, Snake
+from snake_game.sprites import TILE_CACHE, TileCache
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+class TestTileCache(unittest.TestCase):
+    """Tests for TileCache class"""
+
+    def setUp(self):
+        """Setup a display for each test"""
+        self.original_grid_size = CONFIG.GRID_SIZE
+        pygame.init()
+        self.screen = pygame.display.set_mode(
+            (CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
+        )
+        self.cache = TileCache()
+
+    def tearDown(self):
+        """Restore original configuration after each test"""
+        CONFIG.GRID_SIZE = self.original_grid_size
+        config.COLORS = COLORS
+        TILE_CACHE.clear()
+        pygame.quit()
+
+    def test_tiles_are_reused(self):
+        """Test tiles are built once for the same settings"""
+        self.assertIs(self.cache.get(), self.cache.get())
+
+    def test_tile_pixels(self):
+        """Test tiles have a border and a filled inside"""
+        tiles = self.cache.get()
+        size = CONFIG.GRID_SIZE
+
+        self.assertEqual(tiles.head.get_size(), (size, size))
+        self.assertEqual(tuple(tiles.head.get_at((0, 0)))[:3], COLORS.BLACK)
+        self.assertEqual(
+            tuple(tiles.head.get_at((1, 1)))[:3], COLORS.DARK_GREEN
+        )
+        self.assertEqual(tuple(tiles.body.get_at((1, 1)))[:3], COLORS.GREEN)
+        self.assertEqual(tuple(tiles.food.get_at((0, 0)))[:3], COLORS.WHITE)
+        self.assertEqual(tuple(tiles.food.get_at((1, 1)))[:3], COLORS.RED)
+
+    def test_tiles_match_display_format(self):
+        """Test tiles are converted to the display's pixel format"""
+        tiles = self.cache.get()
+        self.assertEqual(tiles.body.get_bitsize(), self.screen.get_bitsize())
+
+    def test_rebuild_on_grid_size_change(self):
+        """Test changing GRID_SIZE rebuilds the tiles"""
+        self.cache.get()
+        CONFIG.GRID_SIZE = 10
+
+        self.assertEqual(self.cache.get().body.get_size(), (10, 10))
+
+    def test_rebuild_on_palette_change(self):
+        """Test replacing COLORS rebuilds the tiles"""
+        self.cache.get()
+        config.COLORS = config.Colors(GREEN=(0, 200, 0))
+
+        body = self.cache.get().body
+        self.assertEqual(tuple(body.get_at((1, 1)))[:3], (0, 200, 0))
+
+    def test_snake_and_food_draw_with_tiles(self):
+        """Test the snake and food draw their tiles at their cells"""
+        size = CONFIG.GRID_SIZE
+        snake = Snake()
+        food = Food()
+        food.position = Position(0, 0)
+
+        snake.draw(self.screen)
+        food.draw(self.screen)
+
+        head = snake.body.head
+        tail = snake.body.tail
+        self.assertEqual(self._pixel(head, size), COLORS.DARK_GREEN)
+        self.assertEqual(self._pixel(tail, size), COLORS.GREEN)
+        self.assertEqual(self._pixel(food.position, size), COLORS.RED)
+
+    def _pixel(self, position: Position, size: int) -> tuple:
+        """Get the color just inside a cell's border"""
+        color = self.screen.get_at(
+            (position.x * size + 1, position.y * size + 1)
+        )
+        return tuple(color)[:3]
+
+
+if __name__ == "__main__":
+    unittest.main()
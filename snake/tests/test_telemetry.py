@@ -0,0 +1,89 @@
+"""
+Unit tests for gameplay telemetry
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from snake_game.telemetry import Telemetry, TelemetryEvent
+
+
+class TestTelemetry(unittest.TestCase):
+    """Tests for Telemetry class"""
+
+    def setUp(self):
+        """Setup a temporary telemetry file"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "telemetry.jsonl")
+
+    def _make(self, **kwargs) -> Telemetry:
+        """Create an enabled telemetry stream that is closed afterwards"""
+        telemetry = Telemetry(**kwargs)
+        telemetry.enable(self.path)
+        self.addCleanup(telemetry.close)
+        return telemetry
+
+    def _read(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_disabled_emits_nothing(self):
+        """Test nothing is buffered or written unless enabled"""
+        telemetry = Telemetry()
+        telemetry.emit(TelemetryEvent.GAME_START, 0)
+        telemetry.close()
+
+        self.assertEqual(telemetry.stats()["pending"], 0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_events_are_written_as_json_lines(self):
+        """Test events are written with their game number and fields"""
+        telemetry = self._make()
+        telemetry.emit(TelemetryEvent.GAME_START, 0, seed=7)
+        telemetry.emit(TelemetryEvent.DIRECTION, 3, direction="UP")
+        telemetry.emit(TelemetryEvent.GAME_START, 0, seed=8)
+        telemetry.flush()
+
+        records = self._read()
+        self.assertEqual(
+            [(r["event"], r["game"], r["tick"]) for r in records],
+            [("game_start", 1, 0), ("direction", 1, 3), ("game_start", 2, 0)],
+        )
+        self.assertEqual(records[0]["seed"], 7)
+        self.assertEqual(telemetry.written, 3)
+
+    def test_full_batch_is_written_without_flush(self):
+        """Test the writer does not wait for the interval once a batch
+        is ready"""
+        telemetry = self._make(batch_size=2, flush_interval=60.0)
+        telemetry.emit(TelemetryEvent.FOOD, 1, score=10)
+        telemetry.emit(TelemetryEvent.FOOD, 2, score=20)
+
+        deadline = time.monotonic() + 5.0
+        while telemetry.written < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(telemetry.written, 2)
+
+    def test_full_buffer_drops_and_counts(self):
+        """Test events beyond the capacity are dropped, not waited on"""
+        telemetry = self._make(capacity=2, batch_size=100, flush_interval=60.0)
+        for tick in range(5):
+            telemetry.emit(TelemetryEvent.DIRECTION, tick, direction="UP")
+
+        self.assertEqual(telemetry.dropped, 3)
+        telemetry.flush()
+        records = self._read()
+        self.assertEqual(records[0], {"event": "dropped", "count": 3})
+        self.assertEqual([r["tick"] for r in records[1:]], [0, 1])
+
+    def test_invalid_sizes_are_rejected(self):
+        """Test the buffer must hold at least one event"""
+        with self.assertRaises(ValueError):
+            Telemetry(capacity=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
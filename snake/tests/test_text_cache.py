@@ -0,0 +1,69 @@
+"""
+Unit tests for the text surface cache
+"""
+
+import unittest
+import pygame
+from snake_game.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    """Tests for TextCache class"""
+
+    def setUp(self):
+        """Setup fonts and an empty cache for each test"""
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 24)
+        self.cache = TextCache(max_size=3)
+
+    def test_hit_returns_same_surface(self):
+        """Test repeated renders reuse the cached surface"""
+        first = self.cache.render(self.font, "Score: 10", (255, 255, 255))
+        second = self.cache.render(self.font, "Score: 10", (255, 255, 255))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_key_includes_font_color_and_antialias(self):
+        """Test surfaces differ by font, color and antialiasing"""
+        other_font = pygame.font.Font(None, 32)
+        white = (255, 255, 255)
+        base = self.cache.render(self.font, "A", white)
+
+        self.assertIsNot(self.cache.render(other_font, "A", white), base)
+        self.assertIsNot(self.cache.render(self.font, "A", (0, 0, 255)), base)
+        self.assertIsNot(self.cache.render(self.font, "A", white, False), base)
+        self.assertEqual(self.cache.misses, 4)
+
+    def test_lru_eviction(self):
+        """Test the least recently used surface is evicted"""
+        white = (255, 255, 255)
+        for text in ("a", "b", "c"):
+            self.cache.render(self.font, text, white)
+        # Touch "a" so "b" becomes the oldest entry
+        self.cache.render(self.font, "a", white)
+        self.cache.render(self.font, "d", white)
+
+        self.assertEqual(len(self.cache), 3)
+        self.cache.render(self.font, "a", white)
+        self.assertEqual(self.cache.hits, 2)
+        self.cache.render(self.font, "b", white)
+        self.assertEqual(self.cache.misses, 5)
+
+    def test_clear(self):
+        """Test clearing drops surfaces and counters"""
+        self.cache.render(self.font, "a", (255, 255, 255))
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats()["misses"], 0)
+
+    def test_invalid_size(self):
+        """Test the cache size must be positive"""
+        with self.assertRaises(ValueError):
+            TextCache(max_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit tests for the vectorized batch environment
+"""
+
+import random
+import unittest
+from snake_game.config import CONFIG
+from snake_game.game_objects import Direction, Position
+from snake_game.simulation import SnakeSimulator
+
+try:
+    import numpy as np
+    from snake_game.vector_env import (
+        ACTIONS,
+        CAUSE_BOARD_FULL,
+        CAUSE_EVENTS,
+        CAUSE_NONE,
+        CAUSE_SELF,
+        CAUSE_WALL,
+        NO_ACTION,
+        VectorSnakeEnv,
+    )
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorSnakeEnv(unittest.TestCase):
+    """Tests for VectorSnakeEnv class"""
+
+    def setUp(self):
+        """Setup for each test"""
+        self.original_wall_collision = CONFIG.WALL_COLLISION
+
+    def tearDown(self):
+        """Restore original configuration after each test"""
+        CONFIG.WALL_COLLISION = self.original_wall_collision
+
+    def test_initial_state(self):
+        """Test games start like SnakeSimulator games"""
+        env = VectorSnakeEnv(4, seed=1)
+        sim = SnakeSimulator()
+
+        head = sim.snake.body.head
+        self.assertTrue((env.head_x == head.x).all())
+        self.assertTrue((env.head_y == head.y).all())
+        self.assertTrue((env.lengths == sim.length).all())
+        for i in range(4):
+            self.assertEqual(env.occupancy[i, env.food[i]], 0)
+
+    def test_straight_moves(self):
+        """Test games move one cell per step"""
+        env = VectorSnakeEnv(3, seed=1)
+        env.food[:] = 0
+        start_x = env.head_x.copy()
+
+        env.step([NO_ACTION] * 3)
+
+        self.assertTrue((env.head_x == start_x + 1).all())
+        self.assertEqual(
+            int(env.occupancy.sum()), 3 * CONFIG.INITIAL_SNAKE_LENGTH
+        )
+
+    def test_wall_collision(self):
+        """Test wall deaths and auto-reset in wall mode"""
+        env = VectorSnakeEnv(2, seed=1, wall_collision=True)
+        env.food[:] = env.size - 1
+        up = ACTIONS.index(Direction.UP)
+
+        result = None
+        for _ in range(env.height):
+            result = env.step([up, NO_ACTION])
+            if result.dones[0]:
+                break
+
+        self.assertEqual(result.causes[0], CAUSE_WALL)
+        self.assertEqual(result.causes[1], CAUSE_NONE)
+        # The finished game was reset
+        self.assertEqual(env.head_y[0], env.height // 2)
+        self.assertEqual(env.ticks[0], 0)
+
+    def test_board_full(self):
+        """Test filling the board is reported as a win"""
+        env = VectorSnakeEnv(1, seed=1, width=4, height=1, initial_length=3)
+        # Snake occupies x=0..2 heading right, food on the last cell
+        env.food[:] = 3
+        env.grow_pending[:] = True
+
+        result = env.step()
+
+        self.assertTrue(result.dones[0])
+        self.assertEqual(result.causes[0], CAUSE_BOARD_FULL)
+        self.assertEqual(CAUSE_EVENTS[CAUSE_BOARD_FULL].value, "board_full")
+
+    def test_matches_simulator(self):
+        """Test lockstep games follow the SnakeSimulator rules exactly"""
+        for wall_collision in (False, True):
+            CONFIG.WALL_COLLISION = wall_collision
+            self._compare_with_simulator(seed=7)
+
+    def _compare_with_simulator(self, seed: int) -> None:
+        """Play random actions in both engines and compare every tick"""
+        rng = random.Random(seed)
+        env = VectorSnakeEnv(1, seed=seed)
+        sim = SnakeSimulator()
+        self._sync_food(env, sim)
+
+        for _ in range(2000):
+            action = rng.choice([NO_ACTION] * 3 + list(range(4)))
+            result = env.step([action])
+            events = sim.step(None if action < 0 else ACTIONS[action])
+
+            self.assertEqual(int(result.scores[0]), sim.score)
+            self.assertEqual(int(result.lengths[0]), sim.length)
+            if result.dones[0]:
+                self.assertTrue(sim.done)
+                self.assertIn(CAUSE_EVENTS[int(result.causes[0])], events)
+                sim.reset()
+            else:
+                self.assertFalse(sim.done)
+                head = sim.snake.body.head
+                self.assertEqual(
+                    (int(env.head_x[0]), int(env.head_y[0])), (head.x, head.y)
+                )
+            self._sync_food(env, sim)
+
+    def _sync_food(self, env: "VectorSnakeEnv", sim: SnakeSimulator) -> None:
+        """Copy the env's food placement into the simulator"""
+        cell = int(env.food[0])
+        sim.food.position = Position(cell % env.width, cell // env.width)
+
+    def test_self_collision_code(self):
+        """Test running into the body is reported as a self collision"""
+        env = VectorSnakeEnv(1, seed=1, initial_length=5)
+        env.food[:] = 0
+        down = ACTIONS.index(Direction.DOWN)
+        left = ACTIONS.index(Direction.LEFT)
+        up = ACTIONS.index(Direction.UP)
+
+        env.step([down])
+        env.step([left])
+        result = env.step([up])
+
+        self.assertEqual(result.causes[0], CAUSE_SELF)
+
+
+if __name__ == "__main__":
+    unittest.main()